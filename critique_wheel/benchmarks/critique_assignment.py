@@ -0,0 +1,65 @@
+"""Throughput of the critique assignment engine.
+
+Run from the project root:
+
+    python -m benchmarks.critique_assignment [works] [members]
+"""
+
+import random
+import sys
+import time
+
+from critique_wheel.critiques.models.assignment import (
+    AssignableWork,
+    Critic,
+    assign_critiques,
+)
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.works.value_objects import WorkAgeRestriction, WorkGenre, WorkId
+
+
+def build_pool(works: int, members: int, seed: int = 0):
+    rng = random.Random(seed)
+    genres = list(WorkGenre)
+    ages = list(WorkAgeRestriction)
+    member_ids = [MemberId() for _ in range(members)]
+    pool = [
+        AssignableWork(
+            work_id=WorkId(),
+            author_id=rng.choice(member_ids),
+            genre=rng.choice(genres),
+            age_restriction=rng.choice(ages),
+            critique_count=rng.randrange(3),
+        )
+        for _ in range(works)
+    ]
+    critics = [
+        Critic(
+            member_id=member_id,
+            owed=rng.randint(1, 5),
+            # A third of members state genre preferences, a fifth age limits.
+            genres=frozenset(rng.sample(genres, 3))
+            if rng.random() < 0.33
+            else frozenset(),
+            age_restrictions=frozenset(ages[:2]) if rng.random() < 0.2 else frozenset(),
+        )
+        for member_id in member_ids
+    ]
+    return pool, critics
+
+
+def main(works: int = 100_000, members: int = 50_000) -> None:
+    pool, critics = build_pool(works, members)
+    start = time.perf_counter()
+    assignments = assign_critiques(pool, critics)
+    elapsed = time.perf_counter() - start
+    owed = sum(critic.owed for critic in critics)
+    print(
+        f"{len(assignments)} of {owed} owed critiques assigned across "
+        f"{works} works and {members} members in {elapsed:.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
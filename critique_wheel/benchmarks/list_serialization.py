@@ -0,0 +1,117 @@
+"""Responses per second from GET /works with page_size summaries per page,
+serialized through Work summary dicts versus straight from the value objects.
+
+Run from the project root:
+
+    python -m benchmarks.list_serialization [page_size]
+"""
+
+import asyncio
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import fastapi
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from critique_wheel.adapters import orm
+from critique_wheel.config import config
+from critique_wheel.entrypoints.routers import works as works_router
+from critique_wheel.works.services import async_work_service, work_service
+
+REQUESTS = 50
+
+
+@contextmanager
+def dict_serialization():
+    # The page as it was: every summary through to_dict() before the
+    # response model validates it again.
+    def build_page(summaries, page_size):
+        page = work_service.build_page(summaries, page_size)
+        page["works"] = [summary.to_dict() for summary in page["works"]]
+        return page
+
+    original = async_work_service.build_page
+    async_work_service.build_page = build_page
+    try:
+        yield
+    finally:
+        async_work_service.build_page = original
+
+
+async def populate(engine, rows: int) -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(orm.mapper_registry.metadata.create_all)
+        start = datetime(2024, 1, 1)
+        # Plain column types, so the raw values below go straight in.
+        await connection.exec_driver_sql(
+            "INSERT INTO works (id, title, content, member_id, submission_date,"
+            " age_restriction, genre, status, word_count, critique_count,"
+            " active_critique_count)"
+            " VALUES (?, ?, ?, ?, ?, 'NONE', 'OTHER', 'ACTIVE', 2, 0, 0)",
+            [
+                (
+                    uuid.uuid4().bytes,
+                    f"Title {number}",
+                    "lorem ipsum",
+                    uuid.uuid4().bytes,
+                    start + timedelta(seconds=number),
+                )
+                for number in range(rows)
+            ],
+        )
+
+
+async def responses_per_second(client: httpx.AsyncClient, page_size: int) -> float:
+    params = {"page_size": page_size}
+    response = await client.get("/works", params=params)
+    assert len(response.json()["works"]) == page_size
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await client.get("/works", params=params)
+    return REQUESTS / (time.perf_counter() - start)
+
+
+async def measure(page_size: int) -> tuple:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    await populate(engine, page_size + 1)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def get_db_session():
+        yield session_factory
+
+    app = fastapi.FastAPI()
+    app.include_router(works_router.router)
+    app.dependency_overrides[works_router.get_db_session] = get_db_session
+    # In process, so the numbers are the app's and not the transport's.
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        with dict_serialization():
+            before = await responses_per_second(client, page_size)
+        after = await responses_per_second(client, page_size)
+    await engine.dispose()
+    return before, after
+
+
+def main(page_size: int = 1_000) -> None:
+    orm.start_mappers()
+    config.WORK_PAGE_SIZE_MAX = page_size
+    before, after = asyncio.run(measure(page_size))
+    print(
+        f"{page_size} works per page: {before:8,.1f} responses/s via dicts, "
+        f"{after:8,.1f} responses/s direct ({after / before:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000)
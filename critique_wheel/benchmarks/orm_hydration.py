@@ -0,0 +1,136 @@
+"""Rows per second hydrated into Work and Critique entities, with the
+validating value object constructors versus the trusted ORM path.
+
+Run from the project root:
+
+    python -m benchmarks.orm_hydration [rows]
+"""
+
+import gc
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, undefer
+
+from critique_wheel.adapters import orm, orm_domain_types
+from critique_wheel.critiques import value_objects as critique_values
+from critique_wheel.critiques.models.critique import Critique
+from critique_wheel.works import value_objects as work_values
+from critique_wheel.works.models.work import Work
+
+CRITIQUE_TEXT = "Word " * 60
+CONTENT_TEXT = "lorem ipsum dolor sit amet " * 400
+
+VALIDATING = {
+    orm_domain_types.TitleType: work_values.Title,
+    orm_domain_types.ContentType: work_values.Content,
+    orm_domain_types.CritiqueAboutType: critique_values.CritiqueAbout,
+    orm_domain_types.CritiqueSuccesesType: critique_values.CritiqueSuccesses,
+    orm_domain_types.CritiqueWeaknessesType: critique_values.CritiqueWeaknesses,
+    orm_domain_types.CritiqueIdeasType: critique_values.CritiqueIdeas,
+}
+
+
+@contextmanager
+def validating_hydration():
+    # The decorators as they were: every value through its constructor.
+    originals = {}
+    for type_, value_object in VALIDATING.items():
+        originals[type_] = type_.process_result_value
+        type_.process_result_value = lambda self, value, dialect, cls=value_object: (
+            cls(value) if value is not None else None
+        )
+    uuid_result = orm_domain_types.UUIDType.process_result_value
+    orm_domain_types.UUIDType.process_result_value = lambda self, value, dialect: (
+        self.value_type(id=uuid.UUID(bytes=value)) if value is not None else None
+    )
+    try:
+        yield
+    finally:
+        for type_, method in originals.items():
+            type_.process_result_value = method
+        orm_domain_types.UUIDType.process_result_value = uuid_result
+
+
+def populate(engine, rows: int) -> None:
+    works = [
+        {
+            "id": uuid.uuid4().bytes,
+            "title": f"Title {number}",
+            "content": CONTENT_TEXT,
+            "member_id": uuid.uuid4().bytes,
+        }
+        for number in range(rows)
+    ]
+    critiques = [
+        {
+            "id": uuid.uuid4().bytes,
+            "critique_about": CRITIQUE_TEXT,
+            "critique_successes": CRITIQUE_TEXT,
+            "critique_weaknesses": CRITIQUE_TEXT,
+            "critique_ideas": CRITIQUE_TEXT,
+            "member_id": uuid.uuid4().bytes,
+            "work_id": work["id"],
+        }
+        for work in works
+    ]
+    with engine.begin() as connection:
+        # Plain column types, so the raw values above go straight in.
+        connection.exec_driver_sql(
+            "INSERT INTO works (id, title, content, member_id, critique_count,"
+            " active_critique_count) VALUES (?, ?, ?, ?, 0, 0)",
+            [tuple(work.values()) for work in works],
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO critiques (id, critique_about, critique_successes,"
+            " critique_weaknesses, critique_ideas, member_id, work_id)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [tuple(critique.values()) for critique in critiques],
+        )
+
+
+def rows_per_second(session_factory, query) -> float:
+    session = session_factory()
+    gc.collect()
+    start = time.perf_counter()
+    loaded = query(session).all()
+    elapsed = time.perf_counter() - start
+    session.close()
+    return len(loaded) / elapsed
+
+
+def measure(rows: int) -> dict:
+    # A fresh engine per run: result processors are cached per dialect.
+    engine = create_engine("sqlite:///:memory:")
+    orm.mapper_registry.metadata.create_all(engine)
+    populate(engine, rows)
+    session_factory = sessionmaker(bind=engine)
+    queries = {
+        "works": lambda session: session.query(Work).options(undefer(Work.content)),
+        "critiques": lambda session: session.query(Critique),
+    }
+    results = {
+        name: rows_per_second(session_factory, query) for name, query in queries.items()
+    }
+    engine.dispose()
+    return results
+
+
+def main(rows: int = 20_000) -> None:
+    orm.start_mappers()
+    with validating_hydration():
+        before = measure(rows)
+    after = measure(rows)
+    for name in before:
+        print(
+            f"{name:>10}: {before[name]:10,.0f} rows/s validating, "
+            f"{after[name]:10,.0f} rows/s trusted "
+            f"({after[name] / before[name]:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,65 @@
+"""Cost of loading manuscripts: validating Content on every hydration versus
+trusting rows that were validated when written.
+
+Run from the project root:
+
+    python -m benchmarks.text_hydration [rows] [words]
+"""
+
+import sys
+import time
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select
+from sqlalchemy.types import String, TypeDecorator
+
+from critique_wheel.adapters.orm_domain_types import ContentType
+from critique_wheel.works.value_objects import Content
+
+
+class ValidatingContentType(TypeDecorator):
+    # The decorator before trusted hydration: __post_init__ recounts words.
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return value.value if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return Content(value) if value is not None else None
+
+
+def time_hydration(content_type, rows: int, text: str) -> float:
+    engine = create_engine("sqlite:///:memory:")
+    metadata = MetaData()
+    table = Table(
+        "works",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("content", content_type),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(table), [{"content": Content(text)} for _ in range(rows)]
+        )
+    with engine.connect() as connection:
+        start = time.perf_counter()
+        loaded = connection.execute(select(table.c.content)).scalars().all()
+        elapsed = time.perf_counter() - start
+    assert len(loaded) == rows
+    engine.dispose()
+    return elapsed
+
+
+def main(rows: int = 2_000, words: int = 7_500) -> None:
+    text = "lorem ipsum dolor sit amet " * (words // 5)
+    for name, content_type in [
+        ("validating", ValidatingContentType),
+        ("trusted", ContentType),
+    ]:
+        elapsed = time_hydration(content_type, rows, text)
+        print(f"{name:>10}: {elapsed * 1000:8.1f} ms for {rows} x {words} words")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,58 @@
+"""Hydration cost of id columns: CHAR(36) strings versus the UUIDType.
+
+Run from the project root:
+
+    python -m benchmarks.uuid_hydration [rows]
+"""
+
+import sys
+import time
+import uuid
+
+from sqlalchemy import Column, MetaData, Table, create_engine, insert, select
+from sqlalchemy.types import CHAR, TypeDecorator
+
+from critique_wheel.adapters.orm_domain_types import WorkUUIDType
+from critique_wheel.works.value_objects import WorkId
+
+
+class LegacyWorkUUIDType(TypeDecorator):
+    # The CHAR(36) decorator the id columns used before UUIDType.
+    impl = CHAR(36)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return str(value) if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return WorkId(id=uuid.UUID(value)) if value is not None else None
+
+
+def time_hydration(id_type, ids: list[WorkId]) -> float:
+    engine = create_engine("sqlite:///:memory:")
+    metadata = MetaData()
+    table = Table("works", metadata, Column("id", id_type, primary_key=True))
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(table), [{"id": work_id} for work_id in ids])
+    with engine.connect() as connection:
+        start = time.perf_counter()
+        rows = connection.execute(select(table.c.id)).scalars().all()
+        elapsed = time.perf_counter() - start
+    assert len(rows) == len(ids)
+    engine.dispose()
+    return elapsed
+
+
+def main(rows: int = 100_000) -> None:
+    ids = [WorkId() for _ in range(rows)]
+    for name, id_type in [
+        ("CHAR(36)", LegacyWorkUUIDType),
+        ("UUIDType", WorkUUIDType),
+    ]:
+        elapsed = time_hydration(id_type, ids)
+        print(f"{name:>10}: {elapsed * 1000:8.1f} ms for {rows} rows")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
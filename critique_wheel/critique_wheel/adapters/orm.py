@@ -1,8 +1,19 @@
 import logging
 from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Table
-from sqlalchemy.orm import registry, relationship
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Table,
+)
+from sqlalchemy.orm import backref, deferred, registry, relationship, synonym
 
 from critique_wheel.adapters.orm_domain_types import (
     ContentType,
@@ -19,10 +30,12 @@ from critique_wheel.adapters.orm_domain_types import (
     TransactionUUIDType,
     WorkUUIDType,
 )
+from critique_wheel.config import config
 from critique_wheel.credits.models.credit import CreditManager, TransactionType
 from critique_wheel.critiques.models.critique import Critique, CritiqueStatus
 from critique_wheel.members.models.IAM import Member, MemberRole, MemberStatus
 from critique_wheel.ratings.models.rating import Rating, RatingStatus
+from critique_wheel.ratings.value_objects import SCORES
 from critique_wheel.works.models.work import (
     Work,
     WorkAgeRestriction,
@@ -48,6 +61,20 @@ work_table = Table(
     Column("last_update_date", DateTime, default=datetime.now),
     Column("archive_date", DateTime),
     Column("member_id", ForeignKey("members.id")),
+    # Kept in step with each critique insert so the cap check reads one row
+    # instead of the critiques relationship.
+    Column("critique_count", Integer, nullable=False, default=0, server_default="0"),
+    Column(
+        "active_critique_count",
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    ),
+    # Set by an admin to override CRITIQUE_LIMIT_PER_WORK for this work.
+    Column("critique_limit", Integer),
+    Index("ix_works_member_id_status", "member_id", "status"),
+    Index("ix_works_submission_date_id", "submission_date", "id"),
 )
 
 
@@ -65,6 +92,10 @@ critique_table = Table(
     Column("archive_date", DateTime),
     Column("member_id", ForeignKey("members.id")),
     Column("work_id", ForeignKey("works.id")),
+    Index("ix_critiques_work_id_status", "work_id", "status"),
+    Index("ix_critiques_member_id_status", "member_id", "status"),
+    # One critique per member per work, enforced by the database.
+    Index("ix_critiques_work_id_member_id", "work_id", "member_id", unique=True),
 )
 
 rating_table = Table(
@@ -79,6 +110,41 @@ rating_table = Table(
     Column("submission_date", DateTime, default=datetime.now),
     Column("last_update_date", DateTime, default=datetime.now),
     Column("archive_date", DateTime),
+    Index("ix_ratings_critique_id", "critique_id"),
+    Index("ix_ratings_member_id", "member_id"),
+)
+
+
+def rating_aggregate_columns() -> list:
+    # Histogram buckets score_1 .. score_5 next to the running count and total.
+    return [
+        Column("rating_count", Integer, nullable=False, default=0),
+        Column("score_total", Integer, nullable=False, default=0),
+        *(
+            Column(f"score_{score}", Integer, nullable=False, default=0)
+            for score in SCORES
+        ),
+        Column(
+            "last_update_date", DateTime, default=datetime.now, onupdate=datetime.now
+        ),
+    ]
+
+
+# Active rating aggregates per critique and per critic (the critique's
+# author), kept in step by RatingRepository and rebuilt by
+# rating_service.rebuild_aggregates().
+critique_rating_aggregate_table = Table(
+    "critique_rating_aggregates",
+    mapper_registry.metadata,
+    Column("critique_id", ForeignKey("critiques.id"), primary_key=True),
+    *rating_aggregate_columns(),
+)
+
+critic_rating_aggregate_table = Table(
+    "critic_rating_aggregates",
+    mapper_registry.metadata,
+    Column("member_id", ForeignKey("members.id"), primary_key=True),
+    *rating_aggregate_columns(),
 )
 
 credit_table = Table(
@@ -88,9 +154,41 @@ credit_table = Table(
     Column("member_id", ForeignKey("members.id")),
     Column("critique_id", ForeignKey("critiques.id")),
     Column("work_id", ForeignKey("works.id")),
-    Column("amount", Integer),
+    # Critique credits are fractional; same precision as the balances.
+    Column("amount", Numeric(12, 2, asdecimal=False)),
     Column("date_of_transaction", DateTime, default=datetime.now),
     Column("transaction_type", Enum(TransactionType)),
+    # Serves per member lookups and the bounded tail read after a snapshot.
+    Index("ix_credits_member_id_date", "member_id", "date_of_transaction"),
+    Index("ix_credits_critique_id", "critique_id"),
+    Index("ix_credits_work_id", "work_id"),
+    Index("ix_credits_date_of_transaction", "date_of_transaction"),
+)
+
+# Running total of each member's credits ledger, kept in step by
+# CreditRepository.add() and rebuilt by credit_service.reconcile_balances().
+member_credit_balance_table = Table(
+    "member_credit_balances",
+    mapper_registry.metadata,
+    Column("member_id", ForeignKey("members.id"), primary_key=True),
+    Column("balance", Numeric(12, 2, asdecimal=False), nullable=False, default=0),
+    Column("transaction_count", Integer, nullable=False, default=0),
+    # Latest date_of_transaction included in the balance.
+    Column("last_transaction_date", DateTime),
+    Column("last_update_date", DateTime, default=datetime.now, onupdate=datetime.now),
+)
+
+# A member's balance as of snapshot_date, covering every credit dated on or
+# before it. Written every CREDIT_SNAPSHOT_INTERVAL transactions and by
+# credit_service.write_snapshots(); point in time balances start from the
+# nearest one.
+credit_snapshot_table = Table(
+    "credit_snapshots",
+    mapper_registry.metadata,
+    Column("member_id", ForeignKey("members.id"), primary_key=True),
+    Column("snapshot_date", DateTime, primary_key=True),
+    Column("balance", Numeric(12, 2, asdecimal=False), nullable=False),
+    Column("transaction_count", Integer, nullable=False),
 )
 
 member_table = Table(
@@ -106,18 +204,39 @@ member_table = Table(
     Column("last_update_date", DateTime, default=datetime.now),
     Column("created_date", DateTime, default=datetime.now),
     Column("archive_date", DateTime),
+    Column("failed_login_attempts", Integer, nullable=False, server_default="0"),
+    Column("account_locked_until", DateTime),
+    # Registration looks both up before hashing; these catch any race past it.
+    Index("ix_members_email", "email", unique=True),
+    Index("ix_members_username", "username", unique=True),
+)
+
+# Access and refresh tokens revoked before they expire. expires_at is the
+# token's own exp claim in epoch seconds; rows past it can be deleted.
+revoked_token_table = Table(
+    "revoked_tokens",
+    mapper_registry.metadata,
+    Column("jti", String(32), primary_key=True),
+    Column("expires_at", Integer, nullable=False),
+    Index("ix_revoked_tokens_expires_at", "expires_at"),
 )
 
 
-def start_mappers():
-    logger.debug("Starting orm mappers")
+def start_mappers(lazy: Optional[str] = None):
+    # Repositories load what they need through explicit loading plans; the
+    # default here only applies to relationships accessed outside a plan.
+    lazy = lazy or config.ORM_RELATIONSHIP_LOADING
+    logger.debug(f"Starting orm mappers with {lazy} relationship loading")
     # CRITIQUE
     mapper_registry.map_imperatively(
         Critique,
         critique_table,
         properties={
             "ratings": relationship(
-                Rating, backref="critiques", order_by=rating_table.c.id
+                Rating,
+                backref=backref("critiques", lazy=lazy),
+                order_by=rating_table.c.id,
+                lazy=lazy,
             )
         },
     )
@@ -126,8 +245,14 @@ def start_mappers():
         Work,
         work_table,
         properties={
+            # Manuscripts run to thousands of words; load them only on access
+            # or through WorkRepository.get_work_content().
+            "content": deferred(work_table.c.content),
             "critiques": relationship(
-                Critique, backref="works", order_by=critique_table.c.id
+                Critique,
+                backref=backref("works", lazy=lazy),
+                order_by=critique_table.c.id,
+                lazy=lazy,
             ),
         },
     )
@@ -136,13 +261,26 @@ def start_mappers():
         Member,
         member_table,
         properties={
-            "works": relationship(Work, backref="members", order_by=work_table.c.id),
+            "works": relationship(
+                Work,
+                backref=backref("members", lazy=lazy),
+                order_by=work_table.c.id,
+                lazy=lazy,
+            ),
             "critiques": relationship(
-                Critique, backref="members", order_by=critique_table.c.id
+                Critique,
+                backref=backref("members", lazy=lazy),
+                order_by=critique_table.c.id,
+                lazy=lazy,
             ),
             "ratings": relationship(
-                Rating, backref="members", order_by=rating_table.c.id
+                Rating,
+                backref=backref("members", lazy=lazy),
+                order_by=rating_table.c.id,
+                lazy=lazy,
             ),
+            # Member uses both spellings; both are the last_update_date column.
+            "last_updated_date": synonym("last_update_date"),
         },
     )
 
@@ -158,4 +296,13 @@ def start_mappers():
         },
     )
     # CREDIT
-    mapper_registry.map_imperatively(CreditManager, credit_table)
+    # Never loaded; the relationships only tell the unit of work to insert a
+    # critique or work before a ledger row in the same flush references it.
+    mapper_registry.map_imperatively(
+        CreditManager,
+        credit_table,
+        properties={
+            "_critique": relationship(Critique, lazy="noload"),
+            "_work": relationship(Work, lazy="noload"),
+        },
+    )
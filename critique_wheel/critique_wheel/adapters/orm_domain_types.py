@@ -1,7 +1,8 @@
 import uuid
 
-from sqlalchemy import Integer, String
-from sqlalchemy.types import CHAR, TypeDecorator
+from sqlalchemy import Integer, LargeBinary, String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import TypeDecorator
 
 from critique_wheel.credits.value_objects import TransactionId
 from critique_wheel.critiques.value_objects import (
@@ -11,20 +12,46 @@ from critique_wheel.critiques.value_objects import (
     CritiqueSuccesses,
     CritiqueWeaknesses,
 )
+from critique_wheel.hydration import trusted
 from critique_wheel.members.value_objects import MemberId
 from critique_wheel.ratings.value_objects import RatingComment, RatingId, RatingScore
 from critique_wheel.works.value_objects import Content, Title, WorkId
 
 
-class WorkUUIDType(TypeDecorator):
-    impl = CHAR(36)
+class UUIDType(TypeDecorator):
+    """Stores an id value object as a native uuid on Postgres and as 16 raw
+    bytes elsewhere (SQLite)."""
+
+    impl = LargeBinary(16)
     cache_ok = True  # Indicate that this type is safe to cache
+    value_type: type = uuid.UUID
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
 
     def process_bind_param(self, value, dialect):
-        return str(value) if value is not None else None
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = getattr(value, "id", None) or uuid.UUID(str(value))
+        return value if dialect.name == "postgresql" else value.bytes
 
     def process_result_value(self, value, dialect):
-        return WorkId(id=uuid.UUID(value)) if value is not None else None
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            value = uuid.UUID(bytes=value)
+        elif not isinstance(value, uuid.UUID):
+            # Rows written before the migration hold the CHAR(36) form.
+            value = uuid.UUID(value)
+        return trusted(self.value_type, id=value)
+
+
+class WorkUUIDType(UUIDType):
+    cache_ok = True  # Indicate that this type is safe to cache
+    value_type = WorkId
 
 
 class TitleType(TypeDecorator):
@@ -35,7 +62,7 @@ class TitleType(TypeDecorator):
         return value.value if value is not None else None
 
     def process_result_value(self, value, dialect):
-        return Title(value) if value is not None else None
+        return trusted(Title, value=value) if value is not None else None
 
 
 class ContentType(TypeDecorator):
@@ -46,29 +73,17 @@ class ContentType(TypeDecorator):
         return value.value if value is not None else None
 
     def process_result_value(self, value, dialect):
-        return Content(value) if value is not None else None
+        return Content.trusted(value) if value is not None else None
 
 
-class MemberUUIDType(TypeDecorator):
-    impl = CHAR(36)
+class MemberUUIDType(UUIDType):
     cache_ok = True  # Indicate that this type is safe to cache
+    value_type = MemberId
 
-    def process_bind_param(self, value, dialect):
-        return str(value) if value is not None else None
 
-    def process_result_value(self, value, dialect):
-        return MemberId(id=uuid.UUID(value)) if value is not None else None
-
-
-class CritiqueUUIDType(TypeDecorator):
-    impl = CHAR(36)
+class CritiqueUUIDType(UUIDType):
     cache_ok = True  # Indicate that this type is safe to cache
-
-    def process_bind_param(self, value, dialect):
-        return str(value) if value is not None else None
-
-    def process_result_value(self, value, dialect):
-        return CritiqueId(id=uuid.UUID(value)) if value is not None else None
+    value_type = CritiqueId
 
 
 class CritiqueAboutType(TypeDecorator):
@@ -79,7 +94,7 @@ class CritiqueAboutType(TypeDecorator):
         return value.value if value is not None else None
 
     def process_result_value(self, value, dialect):
-        return CritiqueAbout(value) if value is not None else None
+        return CritiqueAbout.trusted(value) if value is not None else None
 
 
 class CritiqueSuccesesType(TypeDecorator):
@@ -90,7 +105,7 @@ class CritiqueSuccesesType(TypeDecorator):
         return value.value if value is not None else None
 
     def process_result_value(self, value, dialect):
-        return CritiqueSuccesses(value) if value is not None else None
+        return CritiqueSuccesses.trusted(value) if value is not None else None
 
 
 class CritiqueWeaknessesType(TypeDecorator):
@@ -101,7 +116,7 @@ class CritiqueWeaknessesType(TypeDecorator):
         return value.value if value is not None else None
 
     def process_result_value(self, value, dialect):
-        return CritiqueWeaknesses(value) if value is not None else None
+        return CritiqueWeaknesses.trusted(value) if value is not None else None
 
 
 class CritiqueIdeasType(TypeDecorator):
@@ -112,18 +127,12 @@ class CritiqueIdeasType(TypeDecorator):
         return value.value if value is not None else None
 
     def process_result_value(self, value, dialect):
-        return CritiqueIdeas(value) if value is not None else None
+        return CritiqueIdeas.trusted(value) if value is not None else None
 
 
-class RatingUUIDType(TypeDecorator):
-    impl = CHAR(36)
+class RatingUUIDType(UUIDType):
     cache_ok = True  # Indicate that this type is safe to cache
-
-    def process_bind_param(self, value, dialect):
-        return str(value) if value is not None else None
-
-    def process_result_value(self, value, dialect):
-        return RatingId(id=uuid.UUID(value)) if value is not None else None
+    value_type = RatingId
 
 
 class RatingScoreType(TypeDecorator):
@@ -134,7 +143,7 @@ class RatingScoreType(TypeDecorator):
         return int(value) if value is not None else None
 
     def process_result_value(self, value, dialect):
-        return RatingScore(value) if value is not None else None
+        return trusted(RatingScore, score=value) if value is not None else None
 
 
 class RatingCommentStringType(TypeDecorator):
@@ -145,15 +154,9 @@ class RatingCommentStringType(TypeDecorator):
         return value.value if value is not None else None
 
     def process_result_value(self, value, dialect):
-        return RatingComment(value) if value is not None else None
+        return RatingComment.trusted(value) if value is not None else None
 
 
-class TransactionUUIDType(TypeDecorator):
-    impl = CHAR(36)
+class TransactionUUIDType(UUIDType):
     cache_ok = True  # Indicate that this type is safe to cache
-
-    def process_bind_param(self, value, dialect):
-        return str(value) if value is not None else None
-
-    def process_result_value(self, value, dialect):
-        return TransactionId(id=uuid.UUID(value)) if value is not None else None
+    value_type = TransactionId
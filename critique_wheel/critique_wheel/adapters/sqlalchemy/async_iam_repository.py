@@ -0,0 +1,64 @@
+from typing import Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from critique_wheel.adapters.sqlalchemy.iam_repository import taken_identifiers
+from critique_wheel.adapters.sqlalchemy.loading import LoadingPlan, loader_options
+from critique_wheel.members.models.IAM import Member
+from critique_wheel.members.models.iam_repository import (
+    AbstractAsyncMemberRepository,
+)
+from critique_wheel.members.value_objects import MemberId
+
+
+class AsyncMemberRepository(AbstractAsyncMemberRepository):
+    # Relationships cannot be lazy loaded on an AsyncSession, so the works and
+    # critiques used by Member.to_dict() are loaded up front.
+    DEFAULT_LOADING: LoadingPlan = {"works": "selectin", "critiques": "selectin"}
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def add(self, member: Member) -> None:
+        self.session.add(member)
+
+    def _select_members(self, loading: Optional[LoadingPlan]):
+        if loading is None:
+            loading = self.DEFAULT_LOADING
+        return select(Member).options(*loader_options(Member, loading))
+
+    async def _one_or_none(
+        self, *criteria, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Member]:
+        result = await self.session.execute(
+            self._select_members(loading).where(*criteria)
+        )
+        return result.unique().scalar_one_or_none()
+
+    async def get_member_by_id(
+        self, member_id: MemberId, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Member]:
+        return await self._one_or_none(Member.id == member_id, loading=loading)
+
+    async def get_member_by_email(
+        self, email: str, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Member]:
+        return await self._one_or_none(Member.email == email, loading=loading)
+
+    async def get_member_by_username(
+        self, username: str, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Member]:
+        return await self._one_or_none(Member.username == username, loading=loading)
+
+    async def taken_identifiers(self, email: str, username: str) -> set[str]:
+        result = await self.session.execute(
+            select(Member.email, Member.username).where(
+                or_(Member.email == email, Member.username == username)
+            )
+        )
+        return taken_identifiers(result.all(), email, username)
+
+    async def list(self, loading: Optional[LoadingPlan] = None) -> list[Member]:
+        result = await self.session.execute(self._select_members(loading))
+        return list(result.unique().scalars().all())
@@ -0,0 +1,33 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from critique_wheel.adapters.orm import (
+    critic_rating_aggregate_table,
+    critique_rating_aggregate_table,
+)
+from critique_wheel.adapters.sqlalchemy.rating_repository import (
+    select_aggregate,
+    to_rating_aggregate,
+)
+from critique_wheel.ratings.models.rating_repository import (
+    AbstractAsyncRatingRepository,
+)
+from critique_wheel.ratings.value_objects import RatingAggregate
+
+
+class AsyncRatingRepository(AbstractAsyncRatingRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_critique_aggregate(self, critique_id) -> RatingAggregate:
+        result = await self.session.execute(
+            select_aggregate(
+                critique_rating_aggregate_table, "critique_id", critique_id
+            )
+        )
+        return to_rating_aggregate(result.first())
+
+    async def get_critic_aggregate(self, member_id) -> RatingAggregate:
+        result = await self.session.execute(
+            select_aggregate(critic_rating_aggregate_table, "member_id", member_id)
+        )
+        return to_rating_aggregate(result.first())
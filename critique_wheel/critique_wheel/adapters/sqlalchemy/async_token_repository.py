@@ -0,0 +1,43 @@
+import logging
+from typing import List, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from critique_wheel.adapters.orm import revoked_token_table
+from critique_wheel.adapters.sqlalchemy.upsert import dialect_insert
+from critique_wheel.members.models.token_repository import (
+    AbstractAsyncRevokedTokenRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRevokedTokenRepository(AbstractAsyncRevokedTokenRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def revoke(self, jti: str, expires_at: int) -> bool:
+        # The primary key makes revocation a compare and set, so a refresh
+        # token replayed concurrently is only accepted once.
+        logger.debug(f"Revoking token {jti}")
+        stmt = (
+            dialect_insert(self.session, revoked_token_table)
+            .values(jti=jti, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=["jti"])
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount == 1
+
+    async def list_active(self, now: int) -> List[Tuple[str, int]]:
+        c = revoked_token_table.c
+        result = await self.session.execute(
+            select(c.jti, c.expires_at).where(c.expires_at > now)
+        )
+        return [tuple(row) for row in result]
+
+    async def delete_expired(self, now: int) -> int:
+        result = await self.session.execute(
+            delete(revoked_token_table).where(revoked_token_table.c.expires_at <= now)
+        )
+        return result.rowcount
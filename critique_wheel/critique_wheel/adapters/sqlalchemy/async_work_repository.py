@@ -0,0 +1,115 @@
+import logging
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from critique_wheel.adapters.orm import work_table
+from critique_wheel.adapters.sqlalchemy.loading import LoadingPlan, loader_options
+from critique_wheel.adapters.sqlalchemy.work_repository import (
+    select_existing_ids,
+    select_work_summaries,
+    to_work_row,
+    to_work_summary,
+    track_touched_works,
+)
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.works.models.work import Work
+from critique_wheel.works.models.work_repository import AbstractAsyncWorkRepository
+from critique_wheel.works.value_objects import (
+    Content,
+    WorkCursor,
+    WorkFilters,
+    WorkId,
+    WorkSummary,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWorkRepository(AbstractAsyncWorkRepository):
+    # Relationships cannot be lazy loaded on an AsyncSession, so the critiques
+    # used by Work.to_dict() are loaded up front.
+    DEFAULT_LOADING: LoadingPlan = {"critiques": "selectin"}
+
+    def __init__(self, session: AsyncSession):
+        logger.debug("Creating async work repository.")
+        self.session = session
+        track_touched_works(session.sync_session)
+
+    def add(self, work: Work) -> None:
+        logger.debug(f"Adding work: {work}")
+        self.session.add(work)
+
+    def _select_works(self, loading: Optional[LoadingPlan]):
+        if loading is None:
+            loading = self.DEFAULT_LOADING
+        return select(Work).options(*loader_options(Work, loading))
+
+    async def get_work_by_id(
+        self, work_id: WorkId, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Work]:
+        logger.debug(f"Getting work by id: {work_id}")
+        result = await self.session.execute(
+            self._select_works(loading).where(Work.id == work_id)
+        )
+        return result.unique().scalar_one_or_none()
+
+    async def get_work_content(self, work_id: WorkId) -> Optional[Content]:
+        logger.debug(f"Getting content of work: {work_id}")
+        result = await self.session.execute(
+            select(work_table.c.content).where(work_table.c.id == work_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_work_by_member_id(
+        self, member_id: MemberId, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Work]:
+        logger.debug(f"Getting work by member id: {member_id}")
+        result = await self.session.execute(
+            self._select_works(loading).where(Work.member_id == member_id)
+        )
+        return result.unique().scalar_one_or_none()
+
+    async def list(self, loading: Optional[LoadingPlan] = None) -> list[Work]:
+        logger.debug("Getting all works.")
+        result = await self.session.execute(self._select_works(loading))
+        return list(result.unique().scalars().all())
+
+    async def list_summaries(
+        self,
+        filters: WorkFilters,
+        limit: int,
+        after: Optional[WorkCursor] = None,
+    ) -> List[WorkSummary]:
+        logger.debug(f"Listing work summaries: {filters}, after {after}")
+        result = await self.session.execute(
+            select_work_summaries(filters, limit, after)
+        )
+        return [to_work_summary(row) for row in result]
+
+    async def existing_ids(self, work_ids: Iterable[WorkId]) -> Set[WorkId]:
+        result = await self.session.execute(select_existing_ids(work_ids))
+        return set(result.scalars())
+
+    async def add_many(self, works: List[Work]) -> List[Tuple[int, str]]:
+        # See WorkRepository.add_many().
+        logger.debug(f"Adding {len(works)} works.")
+        rows = [to_work_row(work) for work in works]
+        if not rows:
+            return []
+        try:
+            async with self.session.begin_nested():
+                await self.session.execute(insert(work_table), rows)
+            return []
+        except IntegrityError as e:
+            logger.warning(f"Batch insert failed, retrying row by row: {e.orig}")
+        failed = []
+        for position, row in enumerate(rows):
+            try:
+                async with self.session.begin_nested():
+                    await self.session.execute(insert(work_table), row)
+            except IntegrityError as e:
+                failed.append((position, str(e.orig)))
+        return failed
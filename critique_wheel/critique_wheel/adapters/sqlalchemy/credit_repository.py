@@ -1,11 +1,26 @@
-from typing import Optional
+import logging
+from datetime import datetime
+from typing import Iterator, List, Optional
 
+from sqlalchemy import case, delete, exists, func, insert, select
 from sqlalchemy.orm import Session
 
+from critique_wheel.adapters.orm import (
+    credit_snapshot_table,
+    credit_table,
+    member_credit_balance_table,
+)
+from critique_wheel.adapters.sqlalchemy.upsert import dialect_insert
+from critique_wheel.config import config
 from critique_wheel.credits.models.credit import CreditManager
-from critique_wheel.credits.models.credit_repository import AbstractCreditRepository
+from critique_wheel.credits.models.credit_repository import (
+    AbstractCreditRepository,
+    LedgerBalance,
+)
 from critique_wheel.credits.value_objects import TransactionId
 
+logger = logging.getLogger(__name__)
+
 
 class CreditRepository(AbstractCreditRepository):
     def __init__(self, session: Session):
@@ -13,6 +28,23 @@ class CreditRepository(AbstractCreditRepository):
 
     def add(self, credit: CreditManager) -> None:
         self.session.add(credit)
+        if credit.member_id is None:
+            return
+        # Same session, so the balance and snapshots commit or roll back with
+        # the ledger row.
+        balance = self._upsert_balance(
+            credit.member_id, credit.amount, 1, credit.date_of_transaction
+        )
+        # Snapshots dated on or after a backdated credit no longer cover it.
+        s = credit_snapshot_table.c
+        self.session.execute(
+            delete(credit_snapshot_table).where(
+                s.member_id == credit.member_id,
+                s.snapshot_date >= credit.date_of_transaction,
+            )
+        )
+        if balance.transaction_count % config.CREDIT_SNAPSHOT_INTERVAL == 0:
+            self._write_snapshot(credit.member_id, *balance)
 
     def get(self, transaction_id: TransactionId) -> Optional[CreditManager]:
         return (
@@ -21,3 +53,179 @@ class CreditRepository(AbstractCreditRepository):
 
     def list(self) -> list[CreditManager]:
         return self.session.query(CreditManager).all()
+
+    def get_balance(self, member_id) -> float:
+        # Primary key lookup on the projection, not a sum over the ledger.
+        c = member_credit_balance_table.c
+        balance = self.session.execute(
+            select(c.balance).where(c.member_id == member_id)
+        ).scalar_one_or_none()
+        return balance or 0
+
+    def iter_ledger_balances(self, batch_size: int) -> Iterator[List[LedgerBalance]]:
+        # Ledger totals and the recorded balance come from one statement, so
+        # each row compares a consistent snapshot. Batches are keyset pages
+        # by member id rather than one streamed cursor, so the caller can
+        # commit between them.
+        c = credit_table.c
+        b = member_credit_balance_table.c
+        after = None
+        while True:
+            members = c.member_id.is_not(None)
+            if after is not None:
+                members = members & (c.member_id > after)
+            totals = (
+                select(
+                    c.member_id,
+                    func.sum(c.amount).label("total"),
+                    func.count().label("count"),
+                )
+                .where(members)
+                .group_by(c.member_id)
+                .order_by(c.member_id)
+                .limit(batch_size)
+                .subquery()
+            )
+            stmt = (
+                select(
+                    totals.c.member_id,
+                    totals.c.total,
+                    totals.c.count,
+                    func.coalesce(b.balance, 0),
+                    func.coalesce(b.transaction_count, 0),
+                )
+                .outerjoin(
+                    member_credit_balance_table, b.member_id == totals.c.member_id
+                )
+                .order_by(totals.c.member_id)
+            )
+            rows = [tuple(row) for row in self.session.execute(stmt)]
+            if not rows:
+                return
+            yield rows
+            after = rows[-1][0]
+
+    def list_balances_without_ledger(self) -> List[LedgerBalance]:
+        b = member_credit_balance_table.c
+        ledger_rows = exists().where(credit_table.c.member_id == b.member_id)
+        rows = self.session.execute(
+            select(b.member_id, b.balance, b.transaction_count).where(~ledger_rows)
+        )
+        return [(member_id, 0, 0, balance, count) for member_id, balance, count in rows]
+
+    def adjust_balance(self, member_id, amount: float, transaction_count: int) -> None:
+        self._upsert_balance(member_id, amount, transaction_count)
+
+    def balance_as_of(self, member_id, as_of: datetime) -> float:
+        # Nearest snapshot at or before as_of, then only the credits after it.
+        s = credit_snapshot_table.c
+        c = credit_table.c
+        snapshot = self.session.execute(
+            select(s.snapshot_date, s.balance)
+            .where(s.member_id == member_id, s.snapshot_date <= as_of)
+            .order_by(s.snapshot_date.desc())
+            .limit(1)
+        ).first()
+        tail = select(func.coalesce(func.sum(c.amount), 0)).where(
+            c.member_id == member_id, c.date_of_transaction <= as_of
+        )
+        if snapshot is None:
+            return self.session.execute(tail).scalar_one()
+        tail = tail.where(c.date_of_transaction > snapshot.snapshot_date)
+        return snapshot.balance + self.session.execute(tail).scalar_one()
+
+    def write_snapshots(self) -> int:
+        # One statement: snapshot every balance that changed since its
+        # member's latest snapshot.
+        b = member_credit_balance_table.c
+        s = credit_snapshot_table.c
+        covered = exists().where(
+            s.member_id == b.member_id, s.snapshot_date >= b.last_transaction_date
+        )
+        stmt = insert(credit_snapshot_table).from_select(
+            ["member_id", "snapshot_date", "balance", "transaction_count"],
+            select(
+                b.member_id, b.last_transaction_date, b.balance, b.transaction_count
+            ).where(b.last_transaction_date.is_not(None), ~covered),
+        )
+        return self.session.execute(stmt).rowcount
+
+    def iter_ledger(
+        self,
+        batch_size: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[List[tuple]]:
+        c = credit_table.c
+        stmt = select(
+            c.id,
+            c.member_id,
+            c.work_id,
+            c.critique_id,
+            c.amount,
+            c.transaction_type,
+            c.date_of_transaction,
+        )
+        if start:
+            stmt = stmt.where(c.date_of_transaction >= start)
+        if end:
+            stmt = stmt.where(c.date_of_transaction < end)
+        stmt = stmt.order_by(c.date_of_transaction, c.id).execution_options(
+            yield_per=batch_size
+        )
+        for partition in self.session.execute(stmt).partitions():
+            yield [tuple(row) for row in partition]
+
+    def _write_snapshot(self, member_id, balance, transaction_count, snapshot_date):
+        stmt = dialect_insert(self.session, credit_snapshot_table).values(
+            member_id=member_id,
+            snapshot_date=snapshot_date,
+            balance=balance,
+            transaction_count=transaction_count,
+        )
+        self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["member_id", "snapshot_date"],
+                set_={
+                    "balance": stmt.excluded.balance,
+                    "transaction_count": stmt.excluded.transaction_count,
+                },
+            )
+        )
+
+    def _upsert_balance(
+        self,
+        member_id,
+        amount: float,
+        transaction_count: int,
+        transaction_date: Optional[datetime] = None,
+    ):
+        # Adds to the row in one atomic statement, creating it if missing,
+        # and returns the new (balance, transaction_count, last_transaction_date).
+        c = member_credit_balance_table.c
+        stmt = dialect_insert(self.session, member_credit_balance_table).values(
+            member_id=member_id,
+            balance=amount,
+            transaction_count=transaction_count,
+            last_transaction_date=transaction_date,
+            last_update_date=datetime.now(),
+        )
+        last_transaction_date = case(
+            (c.last_transaction_date.is_(None), stmt.excluded.last_transaction_date),
+            (
+                stmt.excluded.last_transaction_date > c.last_transaction_date,
+                stmt.excluded.last_transaction_date,
+            ),
+            else_=c.last_transaction_date,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[c.member_id],
+            set_={
+                "balance": c.balance + stmt.excluded.balance,
+                "transaction_count": c.transaction_count
+                + stmt.excluded.transaction_count,
+                "last_transaction_date": last_transaction_date,
+                "last_update_date": stmt.excluded.last_update_date,
+            },
+        ).returning(c.balance, c.transaction_count, c.last_transaction_date)
+        return self.session.execute(stmt).one()
@@ -2,6 +2,7 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from critique_wheel.adapters.sqlalchemy.loading import LoadingPlan, loader_options
 from critique_wheel.critiques.models.critique import Critique
 from critique_wheel.critiques.models.critique_repository import (
     AbstractCritiqueRepository,
@@ -10,14 +11,23 @@ from critique_wheel.critiques.value_objects import CritiqueId
 
 
 class CritiqueRepository(AbstractCritiqueRepository):
+    DEFAULT_LOADING: LoadingPlan = {"ratings": "selectin"}
+
     def __init__(self, session: Session):
         self.session = session
 
     def add(self, critique: Critique) -> None:
         self.session.add(critique)
 
-    def get(self, critique_id: CritiqueId) -> Optional[Critique]:
-        return self.session.query(Critique).filter_by(id=critique_id).one_or_none()
+    def _query(self, loading: Optional[LoadingPlan]):
+        if loading is None:
+            loading = self.DEFAULT_LOADING
+        return self.session.query(Critique).options(*loader_options(Critique, loading))
+
+    def get(
+        self, critique_id: CritiqueId, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Critique]:
+        return self._query(loading).filter_by(id=critique_id).one_or_none()
 
-    def list(self) -> list[Critique]:
-        return self.session.query(Critique).all()
+    def list(self, loading: Optional[LoadingPlan] = None) -> list[Critique]:
+        return self._query(loading).all()
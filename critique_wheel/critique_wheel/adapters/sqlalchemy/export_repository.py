@@ -0,0 +1,150 @@
+"""Streams whole tables as JSON ready dicts in id order.
+
+Rows come off a server side cursor (yield_per), so memory stays at one batch
+however large the table is. Each record carries its id; passing the last one
+seen as `after` resumes an interrupted export."""
+
+import logging
+import uuid
+from datetime import date
+from enum import Enum
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload, undefer
+
+from critique_wheel.adapters.orm import credit_table, critique_table, rating_table
+from critique_wheel.config import config
+from critique_wheel.members.models.IAM import Member
+from critique_wheel.ratings.value_objects import RatingScore
+from critique_wheel.works.models.work import Work
+
+logger = logging.getLogger(__name__)
+
+
+def to_json_value(value):
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, RatingScore):
+        return int(value)
+    return str(value)
+
+
+def row_record(row) -> dict:
+    return {key: to_json_value(value) for key, value in row._mapping.items()}
+
+
+def work_record(work: Work) -> dict:
+    return work.to_dict(include_content=True)
+
+
+def member_record(member: Member) -> dict:
+    record = member.to_dict()
+    # Password hashes never leave the database.
+    del record["password"]
+    return record
+
+
+class Export:
+    def __init__(self, statement, id_column, to_record: Callable, orm: bool):
+        self.statement = statement
+        self.id_column = id_column
+        self.to_record = to_record
+        # ORM exports yield entities (with their relationships loaded a batch
+        # at a time), Core exports yield rows.
+        self.orm = orm
+
+    def select(self, after: Optional[str], batch_size: int):
+        stmt = self.statement
+        if after:
+            stmt = stmt.where(self.id_column > uuid.UUID(after))
+        return stmt.order_by(self.id_column).execution_options(yield_per=batch_size)
+
+
+EXPORT_NAMES = ("works", "members", "critiques", "ratings", "credits")
+
+
+def get_exports() -> Dict[str, Export]:
+    # Built per call: the entity attributes only exist once the mappers start.
+    return {
+        "works": Export(
+            select(Work).options(undefer(Work.content), selectinload(Work.critiques)),
+            Work.id,
+            work_record,
+            orm=True,
+        ),
+        "members": Export(
+            select(Member).options(
+                selectinload(Member.works), selectinload(Member.critiques)
+            ),
+            Member.id,
+            member_record,
+            orm=True,
+        ),
+        "critiques": Export(
+            select(critique_table), critique_table.c.id, row_record, orm=False
+        ),
+        "ratings": Export(
+            select(rating_table), rating_table.c.id, row_record, orm=False
+        ),
+        "credits": Export(
+            select(credit_table), credit_table.c.id, row_record, orm=False
+        ),
+    }
+
+
+class UnknownExportError(Exception):
+    pass
+
+
+def get_export(name: str) -> Export:
+    if name not in EXPORT_NAMES:
+        raise UnknownExportError(f"Nothing to export called '{name}'")
+    return get_exports()[name]
+
+
+class ExportRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def iter_records(
+        self, name: str, after: Optional[str] = None, batch_size: Optional[int] = None
+    ) -> Iterator[dict]:
+        export = get_export(name)
+        batch_size = batch_size or config.EXPORT_BATCH_SIZE
+        logger.debug(f"Exporting {name} after {after} in batches of {batch_size}")
+        stmt = export.select(after, batch_size)
+        result = (
+            self.session.scalars(stmt) if export.orm else self.session.execute(stmt)
+        )
+        for partition in result.partitions():
+            for item in partition:
+                yield export.to_record(item)
+            # Loaded entities are not needed once written out.
+            self.session.expunge_all()
+
+
+class AsyncExportRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def stream_records(
+        self, name: str, after: Optional[str] = None, batch_size: Optional[int] = None
+    ) -> AsyncIterator[dict]:
+        export = get_export(name)
+        batch_size = batch_size or config.EXPORT_BATCH_SIZE
+        logger.debug(f"Exporting {name} after {after} in batches of {batch_size}")
+        stmt = export.select(after, batch_size)
+        if export.orm:
+            result = await self.session.stream_scalars(stmt)
+        else:
+            result = await self.session.stream(stmt)
+        async for partition in result.partitions():
+            for item in partition:
+                yield export.to_record(item)
+            self.session.expunge_all()
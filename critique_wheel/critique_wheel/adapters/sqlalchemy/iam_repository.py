@@ -1,27 +1,62 @@
 from typing import Optional
 
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
+from critique_wheel.adapters.sqlalchemy.loading import LoadingPlan, loader_options
 from critique_wheel.members.models.IAM import Member
 from critique_wheel.members.models.iam_repository import AbstractMemberRepository
 from critique_wheel.members.value_objects import MemberId
 
 
 class MemberRepository(AbstractMemberRepository):
+    # Member.to_dict() reads both collections.
+    DEFAULT_LOADING: LoadingPlan = {"works": "selectin", "critiques": "selectin"}
+
     def __init__(self, session: Session):
         self.session = session
 
     def add(self, member: Member) -> None:
         self.session.add(member)
 
-    def get_member_by_id(self, member_id: MemberId) -> Optional[Member]:
-        return self.session.query(Member).filter_by(id=member_id).one_or_none()
-
-    def get_member_by_email(self, email: str) -> Optional[Member]:
-        return self.session.query(Member).filter_by(email=email).one_or_none()
-
-    def get_member_by_username(self, username: str) -> Optional[Member]:
-        return self.session.query(Member).filter_by(username=username).one_or_none()
-
-    def list(self) -> list[Member]:
-        return self.session.query(Member).all()
+    def _query(self, loading: Optional[LoadingPlan]):
+        if loading is None:
+            loading = self.DEFAULT_LOADING
+        return self.session.query(Member).options(*loader_options(Member, loading))
+
+    def get_member_by_id(
+        self, member_id: MemberId, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Member]:
+        return self._query(loading).filter_by(id=member_id).one_or_none()
+
+    def get_member_by_email(
+        self, email: str, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Member]:
+        return self._query(loading).filter_by(email=email).one_or_none()
+
+    def get_member_by_username(
+        self, username: str, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Member]:
+        return self._query(loading).filter_by(username=username).one_or_none()
+
+    def taken_identifiers(self, email: str, username: str) -> set[str]:
+        # Only the two indexed columns are read; no member is loaded.
+        rows = (
+            self.session.query(Member.email, Member.username)
+            .filter(or_(Member.email == email, Member.username == username))
+            .all()
+        )
+        return taken_identifiers(rows, email, username)
+
+    def list(self, loading: Optional[LoadingPlan] = None) -> list[Member]:
+        return self._query(loading).all()
+
+
+def taken_identifiers(rows, email: str, username: str) -> set[str]:
+    taken = set()
+    for row in rows:
+        if row.email == email:
+            taken.add("email")
+        if row.username == username:
+            taken.add("username")
+    return taken
@@ -0,0 +1,23 @@
+from typing import Dict
+
+from sqlalchemy.orm import joinedload, lazyload, raiseload, selectinload
+
+# A loading plan maps relationship names to one of the strategies below, e.g.
+# {"works": "selectin", "critiques": "raise"}.
+LoadingPlan = Dict[str, str]
+
+LOADING_STRATEGIES = {
+    "select": lazyload,
+    "selectin": selectinload,
+    "joined": joinedload,
+    "raise": raiseload,
+}
+
+
+def loader_options(entity, plan: LoadingPlan) -> list:
+    options = []
+    for relationship, strategy in plan.items():
+        if strategy not in LOADING_STRATEGIES:
+            raise ValueError(f"Unknown loading strategy: '{strategy}'")
+        options.append(LOADING_STRATEGIES[strategy](getattr(entity, relationship)))
+    return options
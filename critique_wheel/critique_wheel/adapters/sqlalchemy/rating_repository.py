@@ -1,10 +1,38 @@
+import logging
 from typing import Optional
 
+from sqlalchemy import case, delete, func, insert, select
 from sqlalchemy.orm import Session
 
-from critique_wheel.ratings.models.rating import Rating
-from critique_wheel.ratings.models.rating_repository import AbstractRatingRepository
-from critique_wheel.ratings.value_objects import RatingId
+from critique_wheel.adapters.orm import (
+    critic_rating_aggregate_table,
+    critique_rating_aggregate_table,
+    critique_table,
+    rating_table,
+)
+from critique_wheel.adapters.sqlalchemy.upsert import dialect_insert
+from critique_wheel.ratings.models.rating import Rating, RatingStatus
+from critique_wheel.ratings.models.rating_repository import (
+    AbstractRatingRepository,
+    RatedCritiqueNotFoundError,
+)
+from critique_wheel.ratings.value_objects import SCORES, RatingAggregate, RatingId
+
+logger = logging.getLogger(__name__)
+
+AGGREGATE_COLUMNS = ["rating_count", "score_total"] + [
+    f"score_{score}" for score in SCORES
+]
+
+
+def select_aggregate(table, key_column, key):
+    return select(*(table.c[name] for name in AGGREGATE_COLUMNS)).where(
+        table.c[key_column] == key
+    )
+
+
+def to_rating_aggregate(row) -> RatingAggregate:
+    return RatingAggregate.from_row(row) if row else RatingAggregate()
 
 
 class RatingRepository(AbstractRatingRepository):
@@ -13,9 +41,97 @@ class RatingRepository(AbstractRatingRepository):
 
     def add(self, rating: Rating) -> None:
         self.session.add(rating)
+        self.apply_score_change(rating.critique_id, None, rating.counted_score)
 
     def get(self, rating_id: RatingId) -> Optional[Rating]:
         return self.session.query(Rating).filter_by(id=rating_id).one_or_none()
 
     def list(self) -> list[Rating]:
         return self.session.query(Rating).all()
+
+    def apply_score_change(
+        self, critique_id, before: Optional[int], after: Optional[int]
+    ) -> None:
+        # Same session as the rating itself, so the aggregates commit or roll
+        # back with it.
+        change = RatingAggregate.change(before, after)
+        if not change:
+            return
+        self._upsert_aggregate(
+            critique_rating_aggregate_table, "critique_id", critique_id, change
+        )
+        # A Core select does not autoflush, and the critique may still be
+        # pending in this session.
+        self.session.flush()
+        critic_id = self.session.execute(
+            select(critique_table.c.member_id).where(critique_table.c.id == critique_id)
+        ).scalar_one_or_none()
+        if critic_id is None:
+            raise RatedCritiqueNotFoundError(f"Critique {critique_id} not found")
+        self._upsert_aggregate(
+            critic_rating_aggregate_table, "member_id", critic_id, change
+        )
+
+    def get_critique_aggregate(self, critique_id) -> RatingAggregate:
+        row = self.session.execute(
+            select_aggregate(
+                critique_rating_aggregate_table, "critique_id", critique_id
+            )
+        ).first()
+        return to_rating_aggregate(row)
+
+    def get_critic_aggregate(self, member_id) -> RatingAggregate:
+        row = self.session.execute(
+            select_aggregate(critic_rating_aggregate_table, "member_id", member_id)
+        ).first()
+        return to_rating_aggregate(row)
+
+    def rebuild_aggregates(self) -> dict:
+        # Recount both tables from the active ratings, two INSERT ... SELECTs.
+        r = rating_table.c
+        sums = [
+            func.count().label("rating_count"),
+            func.sum(r.score).label("score_total"),
+            *(
+                func.sum(case((r.score == score, 1), else_=0)).label(f"score_{score}")
+                for score in SCORES
+            ),
+        ]
+        active = r.status == RatingStatus.ACTIVE
+        by_critique = select(r.critique_id, *sums).where(active).group_by(r.critique_id)
+        by_critic = (
+            select(critique_table.c.member_id, *sums)
+            .join(critique_table, critique_table.c.id == r.critique_id)
+            .where(active)
+            .group_by(critique_table.c.member_id)
+        )
+        counts = {}
+        for name, table, key_column, stmt in (
+            ("critiques", critique_rating_aggregate_table, "critique_id", by_critique),
+            ("critics", critic_rating_aggregate_table, "member_id", by_critic),
+        ):
+            self.session.execute(delete(table))
+            counts[name] = self.session.execute(
+                insert(table).from_select([key_column] + AGGREGATE_COLUMNS, stmt)
+            ).rowcount
+        logger.debug(f"Rebuilt rating aggregates: {counts}")
+        return counts
+
+    def _upsert_aggregate(self, table, key_column, key, change: RatingAggregate):
+        # Adds the change in one atomic statement, creating the row if missing.
+        values = dict(
+            zip(
+                AGGREGATE_COLUMNS,
+                (change.rating_count, change.score_total, *change.histogram),
+            )
+        )
+        stmt = dialect_insert(self.session, table).values({key_column: key, **values})
+        self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[key_column],
+                set_={
+                    name: table.c[name] + stmt.excluded[name]
+                    for name in AGGREGATE_COLUMNS
+                },
+            )
+        )
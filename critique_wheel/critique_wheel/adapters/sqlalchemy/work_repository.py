@@ -1,35 +1,233 @@
 import logging
-from typing import Optional
+from datetime import datetime
+from itertools import chain
+from typing import Iterable, List, Optional, Set, Tuple
 
+from sqlalchemy import and_, event, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from critique_wheel.adapters.orm import work_table
+from critique_wheel.adapters.sqlalchemy.loading import LoadingPlan, loader_options
+from critique_wheel.critiques.models.critique import Critique
 from critique_wheel.members.value_objects import MemberId
 from critique_wheel.works.models.work import Work
 from critique_wheel.works.models.work_repository import AbstractWorkRepository
-from critique_wheel.works.value_objects import WorkId
+from critique_wheel.works.value_objects import (
+    Content,
+    CritiqueCapacity,
+    WorkCursor,
+    WorkFilters,
+    WorkId,
+    WorkStatus,
+    WorkSummary,
+)
 
 logger = logging.getLogger(__name__)
 
+TOUCHED_WORKS = "touched_work_ids"
+
+
+def touched_work_ids(session: Session) -> Set[WorkId]:
+    """Ids of the works written in the session's current transaction, for
+    the unit of work to invalidate in the work cache once it commits."""
+    return session.info.setdefault(TOUCHED_WORKS, set())
+
+
+def pop_touched_work_ids(session: Session) -> Set[WorkId]:
+    return session.info.pop(TOUCHED_WORKS, set())
+
+
+def collect_touched_works(session: Session, flush_context, instances) -> None:
+    # Works flushed through the ORM, and works whose critiques were, since
+    # Work.to_dict() lists them.
+    touched = touched_work_ids(session)
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, Work):
+            touched.add(instance.id)
+        elif isinstance(instance, Critique):
+            touched.add(instance.work_id)
+
+
+def track_touched_works(session: Session) -> None:
+    if not event.contains(session, "before_flush", collect_touched_works):
+        event.listen(session, "before_flush", collect_touched_works)
+
+
+def select_work_summaries(
+    filters: WorkFilters, limit: int, after: Optional[WorkCursor] = None
+):
+    # Every column but content, newest first. Paging continues from the
+    # (submission_date, id) of the previous page's last row so the database
+    # seeks through ix_works_submission_date_id instead of skipping offsets.
+    c = work_table.c
+    stmt = select(
+        c.id,
+        c.title,
+        c.member_id,
+        c.age_restriction,
+        c.genre,
+        c.status,
+        c.word_count,
+        c.submission_date,
+    )
+    if filters.genre:
+        stmt = stmt.where(c.genre == filters.genre)
+    if filters.age_restriction:
+        stmt = stmt.where(c.age_restriction == filters.age_restriction)
+    if filters.status:
+        stmt = stmt.where(c.status == filters.status)
+    if filters.member_id:
+        stmt = stmt.where(c.member_id == filters.member_id)
+    if after:
+        stmt = stmt.where(
+            or_(
+                c.submission_date < after.submission_date,
+                and_(c.submission_date == after.submission_date, c.id < after.id),
+            )
+        )
+    return stmt.order_by(c.submission_date.desc(), c.id.desc()).limit(limit)
+
+
+def to_work_summary(row) -> WorkSummary:
+    return WorkSummary(**row._mapping)
+
+
+def to_work_row(work: Work) -> dict:
+    # Column values for a Core INSERT, bypassing the unit of work's per object
+    # bookkeeping for bulk imports.
+    return {column.name: getattr(work, column.name) for column in work_table.columns}
+
+
+def select_existing_ids(work_ids: Iterable[WorkId]):
+    return select(work_table.c.id).where(work_table.c.id.in_(list(work_ids)))
+
 
 class WorkRepository(AbstractWorkRepository):
+    # Work.to_dict() reads the critiques.
+    DEFAULT_LOADING: LoadingPlan = {"critiques": "selectin"}
+
     def __init__(self, session: Session):
         logger.debug("Creating work repository.")
         self.session = session
+        track_touched_works(session)
 
     def add(self, work: Work) -> None:
         logger.debug(f"Adding work: {work}")
         self.session.add(work)
 
-    def get_work_by_id(self, work_id: WorkId) -> Optional[Work]:
+    def _query(self, loading: Optional[LoadingPlan]):
+        if loading is None:
+            loading = self.DEFAULT_LOADING
+        return self.session.query(Work).options(*loader_options(Work, loading))
+
+    def get_work_by_id(
+        self, work_id: WorkId, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Work]:
         logger.debug(f"Getting work by id: {work_id}")
-        return self.session.query(Work).filter_by(id=str(work_id)).one_or_none()
+        return self._query(loading).filter_by(id=str(work_id)).one_or_none()
 
-    def get_work_by_member_id(self, member_id: MemberId) -> Optional[Work]:
+    def get_work_content(self, work_id: WorkId) -> Optional[Content]:
+        logger.debug(f"Getting content of work: {work_id}")
+        return self.session.execute(
+            select(work_table.c.content).where(work_table.c.id == work_id)
+        ).scalar_one_or_none()
+
+    def get_work_by_member_id(
+        self, member_id: MemberId, loading: Optional[LoadingPlan] = None
+    ) -> Optional[Work]:
         logger.debug(f"Getting work by member id: {member_id}")
-        return (
-            self.session.query(Work).filter_by(member_id=str(member_id)).one_or_none()
-        )
+        return self._query(loading).filter_by(member_id=str(member_id)).one_or_none()
 
-    def list(self) -> list[Work]:
+    def list(self, loading: Optional[LoadingPlan] = None) -> list[Work]:
         logger.debug("Getting all works.")
-        return self.session.query(Work).all()
+        return self._query(loading).all()
+
+    def list_summaries(
+        self,
+        filters: WorkFilters,
+        limit: int,
+        after: Optional[WorkCursor] = None,
+    ) -> List[WorkSummary]:
+        logger.debug(f"Listing work summaries: {filters}, after {after}")
+        rows = self.session.execute(select_work_summaries(filters, limit, after))
+        return [to_work_summary(row) for row in rows]
+
+    def existing_ids(self, work_ids: Iterable[WorkId]) -> Set[WorkId]:
+        return set(self.session.execute(select_existing_ids(work_ids)).scalars())
+
+    def add_many(self, works: List[Work]) -> List[Tuple[int, str]]:
+        """Insert the works with one executemany. If the database rejects the
+        batch, each row is retried in its own savepoint so only the offending
+        rows are lost; returns their (position, error)."""
+        logger.debug(f"Adding {len(works)} works.")
+        rows = [to_work_row(work) for work in works]
+        if not rows:
+            return []
+        try:
+            with self.session.begin_nested():
+                self.session.execute(insert(work_table), rows)
+            return []
+        except IntegrityError as e:
+            logger.warning(f"Batch insert failed, retrying row by row: {e.orig}")
+        failed = []
+        for position, row in enumerate(rows):
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(insert(work_table), row)
+            except IntegrityError as e:
+                failed.append((position, str(e.orig)))
+        return failed
+
+    def reserve_critique_slot(
+        self, work_id: WorkId, limit: int, active: bool = True
+    ) -> bool:
+        # One conditional UPDATE: the row lock it takes serialises concurrent
+        # critiques of the same work, so the cap cannot be overrun.
+        logger.debug(f"Reserving critique slot on work: {work_id}")
+        touched_work_ids(self.session).add(work_id)
+        c = work_table.c
+        stmt = (
+            update(work_table)
+            .where(
+                c.id == work_id,
+                c.status == WorkStatus.ACTIVE,
+                c.critique_count < func.coalesce(c.critique_limit, limit),
+            )
+            .values(
+                critique_count=c.critique_count + 1,
+                active_critique_count=c.active_critique_count + int(active),
+                last_update_date=datetime.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return self.session.execute(stmt).rowcount == 1
+
+    def get_critique_capacity(self, work_id: WorkId) -> Optional[CritiqueCapacity]:
+        c = work_table.c
+        row = self.session.execute(
+            select(
+                c.status,
+                c.critique_count,
+                c.active_critique_count,
+                c.critique_limit,
+            ).where(c.id == work_id)
+        ).one_or_none()
+        return CritiqueCapacity(**row._mapping) if row else None
+
+    def get_word_count(self, work_id: WorkId) -> Optional[int]:
+        c = work_table.c
+        return self.session.execute(
+            select(c.word_count).where(c.id == work_id)
+        ).scalar_one_or_none()
+
+    def adjust_active_critique_count(self, work_id: WorkId, delta: int) -> None:
+        logger.debug(f"Adjusting active critique count of work {work_id} by {delta}")
+        touched_work_ids(self.session).add(work_id)
+        c = work_table.c
+        self.session.execute(
+            update(work_table)
+            .where(c.id == work_id)
+            .values(active_critique_count=c.active_critique_count + delta)
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,177 @@
+"""Maintenance jobs, run from the project root:
+
+python -m critique_wheel.cli reconcile-balances [--batch-size N] [--dry-run]
+python -m critique_wheel.cli snapshot-balances
+python -m critique_wheel.cli export-ledger DIRECTORY [--start] [--end] [--period]
+python -m critique_wheel.cli rebuild-rating-aggregates
+python -m critique_wheel.cli import-works FILE.jsonl [--batch-size N]
+python -m critique_wheel.cli export {works,members,critiques,ratings,credits}
+    [--output FILE] [--after ID] [--batch-size N]
+"""
+
+import argparse
+import json
+import logging
+import sys
+from datetime import datetime
+from typing import Optional
+
+from critique_wheel.adapters import orm
+from critique_wheel.adapters.sqlalchemy import export_repository
+from critique_wheel.credits.services import credit_service
+from critique_wheel.credits.services.unit_of_work import CreditUnitOfWork
+from critique_wheel.infrastructure import database
+from critique_wheel.logging_conf import configure_logging
+from critique_wheel.ratings.services import rating_service
+from critique_wheel.ratings.services.unit_of_work import RatingUnitOfWork
+from critique_wheel.works.services import work_service
+from critique_wheel.works.services.unit_of_work import WorkUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile_balances(args) -> int:
+    report = credit_service.reconcile_balances(
+        CreditUnitOfWork(), batch_size=args.batch_size, repair=not args.dry_run
+    )
+    for drift in report.drift:
+        print(
+            f"{drift.member_id}: recorded {drift.recorded} "
+            f"({drift.recorded_count} transactions), ledger {drift.expected} "
+            f"({drift.expected_count} transactions)"
+        )
+    action = "repaired" if report.repaired else "found"
+    print(
+        f"Checked {report.members_checked} members, {action} {report.drifted} drifted"
+    )
+    return 1 if report.drift and not report.repaired else 0
+
+
+def snapshot_balances(args) -> int:
+    written = credit_service.write_snapshots(CreditUnitOfWork())
+    print(f"Wrote {written} balance snapshots")
+    return 0
+
+
+def export_ledger(args) -> int:
+    counts = credit_service.export_ledger(
+        CreditUnitOfWork(),
+        args.directory,
+        start=args.start,
+        end=args.end,
+        period=args.period,
+    )
+    for partition, count in counts.items():
+        print(f"credits_{partition}.csv: {count} rows")
+    return 0
+
+
+def rebuild_rating_aggregates(args) -> int:
+    counts = rating_service.rebuild_aggregates(RatingUnitOfWork())
+    print(
+        f"Rebuilt rating aggregates for {counts['critiques']} critiques "
+        f"and {counts['critics']} critics"
+    )
+    return 0
+
+
+def read_json_lines(path: str):
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def import_works(args) -> int:
+    # One work per line; rows are streamed, never all held in memory.
+    report = work_service.import_works(
+        WorkUnitOfWork(), read_json_lines(args.file), batch_size=args.batch_size
+    )
+    for error in report["errors"]:
+        print(f"row {error['row']}: {error['error']}")
+    print(f"Imported {report['imported']} works, {len(report['errors'])} rejected")
+    return 1 if report["errors"] else 0
+
+
+def export_records(args) -> int:
+    session = database.get_session_factory()()
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    count = 0
+    try:
+        repository = export_repository.ExportRepository(session)
+        for record in repository.iter_records(args.name, args.after, args.batch_size):
+            output.write(json.dumps(record) + "\n")
+            count += 1
+    finally:
+        session.close()
+        if output is not sys.stdout:
+            output.close()
+    print(f"Exported {count} {args.name}", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="critique_wheel")
+    commands = parser.add_subparsers(dest="command", required=True)
+    reconcile = commands.add_parser(
+        "reconcile-balances",
+        help="Rebuild member credit balances from the credits ledger.",
+    )
+    reconcile.add_argument("--batch-size", type=int, default=None)
+    reconcile.add_argument(
+        "--dry-run", action="store_true", help="Report drift without repairing it."
+    )
+    reconcile.set_defaults(handler=reconcile_balances)
+    snapshot = commands.add_parser(
+        "snapshot-balances",
+        help="Snapshot balances that changed since their last snapshot.",
+    )
+    snapshot.set_defaults(handler=snapshot_balances)
+    export = commands.add_parser(
+        "export-ledger",
+        help="Export the credits ledger as one CSV file per day or month.",
+    )
+    export.add_argument("directory")
+    export.add_argument("--start", type=datetime.fromisoformat, default=None)
+    export.add_argument("--end", type=datetime.fromisoformat, default=None)
+    export.add_argument("--period", choices=["day", "month"], default="day")
+    export.set_defaults(handler=export_ledger)
+    rebuild_ratings = commands.add_parser(
+        "rebuild-rating-aggregates",
+        help="Recount rating aggregates per critique and critic from the ratings.",
+    )
+    rebuild_ratings.set_defaults(handler=rebuild_rating_aggregates)
+    import_parser = commands.add_parser(
+        "import-works",
+        help="Bulk import works from a JSON Lines file, one work per line.",
+    )
+    import_parser.add_argument("file")
+    import_parser.add_argument("--batch-size", type=int, default=None)
+    import_parser.set_defaults(handler=import_works)
+    export_parser = commands.add_parser(
+        "export",
+        help="Stream a table as newline delimited JSON, in id order.",
+    )
+    export_parser.add_argument("name", choices=export_repository.EXPORT_NAMES)
+    export_parser.add_argument("--output", default=None)
+    export_parser.add_argument(
+        "--after", default=None, help="Resume after the record with this id."
+    )
+    export_parser.add_argument("--batch-size", type=int, default=None)
+    export_parser.set_defaults(handler=export_records)
+    return parser
+
+
+def main(argv: Optional[list] = None) -> int:
+    configure_logging()
+    args = build_parser().parse_args(argv)
+    orm.start_mappers()
+    database.check_schema(database.get_engine())
+    try:
+        return args.handler(args)
+    finally:
+        database.dispose_engine()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
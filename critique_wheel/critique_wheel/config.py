@@ -22,6 +22,12 @@ class GlobalConfig(BaseConfig):
     CRITIQUE_SUCCESSES_MIN_WORDS: Optional[int] = 40
     CRITIQUE_WEAKNESSES_MIN_WORDS: Optional[int] = 40
     CRITIQUE_IDEAS_MIN_WORDS: Optional[int] = 40
+    WORK_PAGE_SIZE: Optional[int] = 20
+    WORK_PAGE_SIZE_MAX: Optional[int] = 100
+    # Works inserted per statement and transaction by bulk imports.
+    WORK_IMPORT_BATCH_SIZE: Optional[int] = 500
+    # Rows fetched per round trip by the streaming exports.
+    EXPORT_BATCH_SIZE: Optional[int] = 1000
     LOG_FILE: Optional[str] = None
     LOGTAIL_API_KEY: Optional[str] = None
     FORCE_ROLLBACK: Optional[bool] = False
@@ -29,9 +35,64 @@ class GlobalConfig(BaseConfig):
     DB_PASSWORD: Optional[str] = "abc123"
     DB_USER: Optional[str] = "abc123"
     DB_NAME: Optional[str] = "abc123"
+    # Database engine configuration
+    DATABASE_TYPE: Optional[str] = "postgresql"
+    DB_POOL_SIZE: Optional[int] = 5
+    DB_MAX_OVERFLOW: Optional[int] = 10
+    DB_POOL_RECYCLE: Optional[int] = 1800
+    DB_POOL_TIMEOUT: Optional[int] = 30
+    DB_POOL_PRE_PING: Optional[bool] = True
+    DB_CREATE_SCHEMA: Optional[bool] = True
+    # Default loader for ORM relationships; "raise" turns any access that the
+    # repository loading plans did not load into an error.
+    ORM_RELATIONSHIP_LOADING: Optional[str] = "select"
+    # Password hashing policy; stored hashes with other settings are rehashed
+    # on the next successful login.
+    PASSWORD_HASH_ALGORITHM: Optional[str] = "bcrypt"
+    PASSWORD_HASH_ROUNDS: Optional[int] = 12
+    # Password hashing worker pool ("thread" or "process")
+    PASSWORD_HASH_WORKERS: Optional[int] = 4
+    PASSWORD_HASH_QUEUE_SIZE: Optional[int] = 32
+    PASSWORD_HASH_EXECUTOR: Optional[str] = "thread"
+    # Seconds between checks of credit_rules.yaml for changes; 0 disables
+    # hot reloading.
+    CREDIT_RULES_RELOAD_INTERVAL: Optional[float] = 5.0
+    # Members per batch when rebuilding credit balances from the ledger.
+    CREDIT_RECONCILE_BATCH_SIZE: Optional[int] = 1000
+    # Critiques a work may receive unless an admin raises its limit.
+    CRITIQUE_LIMIT_PER_WORK: Optional[int] = 5
+    # A member's balance is snapshotted every this many credit transactions.
+    CREDIT_SNAPSHOT_INTERVAL: Optional[int] = 100
+    # Read-through cache of work lookups ("memory", "shared" or "none").
+    # "shared" uses the Redis server at WORK_CACHE_URL, or an in-process
+    # stand-in when no URL is set.
+    WORK_CACHE_BACKEND: Optional[str] = "memory"
+    WORK_CACHE_SIZE: Optional[int] = 1024
+    WORK_CACHE_TTL: Optional[float] = 60.0
+    WORK_CACHE_URL: Optional[str] = None
     API_HOST: Optional[str] = "localhost"
-    # JWT_ALGORITHM: Optional[str] = None
-    # JWT_SECRET_KEY: Optional[str] = None
+    # Signing key for access and refresh tokens; without one a random key is
+    # generated per process and tokens do not survive a restart.
+    JWT_ALGORITHM: Optional[str] = "HS256"
+    JWT_SECRET_KEY: Optional[str] = None
+    # Token lifetimes in seconds.
+    ACCESS_TOKEN_TTL: Optional[int] = 900
+    REFRESH_TOKEN_TTL: Optional[int] = 1209600
+    # Seconds between reloads of the revoked token list from the database.
+    TOKEN_REVOCATION_REFRESH_INTERVAL: Optional[float] = 30.0
+    # Failed logins in a row before an email is locked, and for how many
+    # seconds. Counted in the login throttle, so unknown emails lock too.
+    LOGIN_MAX_FAILED_ATTEMPTS: Optional[int] = 5
+    LOGIN_LOCKOUT_SECONDS: Optional[int] = 1800
+    # Sliding window login throttle ("memory", "shared" or "none"): failed
+    # logins per account and attempts per client address per window seconds.
+    # "shared" uses the Redis server at LOGIN_THROTTLE_URL, or an in-process
+    # stand-in when no URL is set.
+    LOGIN_THROTTLE_BACKEND: Optional[str] = "memory"
+    LOGIN_THROTTLE_WINDOW: Optional[float] = 300.0
+    LOGIN_THROTTLE_ACCOUNT_LIMIT: Optional[int] = 10
+    LOGIN_THROTTLE_ADDRESS_LIMIT: Optional[int] = 30
+    LOGIN_THROTTLE_URL: Optional[str] = None
     # MAILGUN_API_KEY: Optional[str] = None
     # MAILGUN_DOMAIN: Optional[str] = None
     # B2_API_KEY_ID: Optional[str] = None
@@ -43,14 +104,21 @@ class GlobalConfig(BaseConfig):
 
 
 class DevConfig(GlobalConfig):
+    PASSWORD_HASH_ROUNDS: Optional[int] = 8
+
     model_config = SettingsConfigDict(env_prefix="DEV_")
 
 
 class ProdConfig(GlobalConfig):
+    ORM_RELATIONSHIP_LOADING: Optional[str] = "raise"
+    PASSWORD_HASH_ROUNDS: Optional[int] = 13
+
     model_config = SettingsConfigDict(env_prefix="PROD_")
 
 
 class TestConfig(GlobalConfig):
+    PASSWORD_HASH_ROUNDS: Optional[int] = 4
+
     model_config = SettingsConfigDict(env_prefix="TEST_")
 
 
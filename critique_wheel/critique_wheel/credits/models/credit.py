@@ -1,12 +1,18 @@
+import logging
 import os
+import time
 from datetime import datetime
 from enum import Enum
+from typing import Iterable, List
 
 import yaml
 from dotenv import load_dotenv
 
+from critique_wheel.config import config
+from critique_wheel.credits.models.credit_rules import CreditRuleBook
 from critique_wheel.credits.value_objects import TransactionId
 
+logger = logging.getLogger(__name__)
 load_dotenv()
 
 CREDIT_RULES_FILE_PATH = os.getenv("CREDIT_RULES_FILE_PATH")
@@ -29,6 +35,12 @@ mock_db = {"transactions": []}
 
 class CreditManager:
     CREDIT_RULES = {}
+    # Compiled form of CREDIT_RULES used for pricing, and the file it came
+    # from so that edits can be picked up without a restart.
+    COMPILED_CREDIT_RULES = None
+    _rules_file_path = None
+    _rules_file_mtime = None
+    _rules_check_due = 0.0
 
     def __init__(
         self,
@@ -53,7 +65,51 @@ class CreditManager:
         with open(filepath, "r") as file:  # type: ignore
             credit_settings = yaml.safe_load(file)
         cls.validate_credit_rules(credit_settings.get("rules", {}))
+        compiled_rules = CreditRuleBook.compile(credit_settings.get("rules", {}))
         cls.CREDIT_RULES = credit_settings.get("rules", {})
+        cls.COMPILED_CREDIT_RULES = compiled_rules
+        cls._rules_file_path = filepath
+        cls._rules_file_mtime = os.stat(filepath).st_mtime  # type: ignore
+        cls._schedule_rules_check()
+
+    @classmethod
+    def _schedule_rules_check(cls):
+        interval = config.CREDIT_RULES_RELOAD_INTERVAL
+        if not interval:
+            cls._rules_check_due = float("inf")
+            return
+        cls._rules_check_due = time.monotonic() + interval
+
+    @classmethod
+    def reload_credit_rules_if_changed(cls):
+        if cls._rules_file_path is None:
+            cls.load_credit_rules_from_yaml()
+            return True
+        try:
+            mtime = os.stat(cls._rules_file_path).st_mtime
+        except OSError as e:
+            logger.warning(f"Keeping current credit rules, cannot stat file: {e}")
+            return False
+        if mtime == cls._rules_file_mtime:
+            return False
+        try:
+            cls.load_credit_rules_from_yaml(filepath=cls._rules_file_path)
+        except (OSError, AttributeError, KeyError, ValueError, yaml.YAMLError) as e:
+            # A half written or invalid file must not take pricing down.
+            logger.exception(f"Keeping current credit rules, reload failed: {e}")
+            cls._rules_file_mtime = mtime
+            return False
+        logger.info(f"Reloaded credit rules from {cls._rules_file_path}")
+        return True
+
+    @classmethod
+    def get_compiled_credit_rules(cls) -> CreditRuleBook:
+        # Rules loaded from a file are rechecked at most once per
+        # CREDIT_RULES_RELOAD_INTERVAL; until then this is one clock read.
+        if time.monotonic() >= cls._rules_check_due:
+            cls._schedule_rules_check()
+            cls.reload_credit_rules_if_changed()
+        return cls.COMPILED_CREDIT_RULES  # type: ignore
 
     @classmethod
     def validate_credit_rules(cls, credit_rules):
@@ -118,12 +174,16 @@ class CreditManager:
 
     @classmethod
     def credits_for_submission(cls, word_count):
-        for setting in cls.CREDIT_RULES["submission"]:
-            if setting["max_words"] == "max" or word_count < setting["max_words"]:
-                return setting["credits"]
+        return cls.get_compiled_credit_rules().submission.credits_for(word_count)
 
     @classmethod
     def credits_for_critique(cls, word_count):
-        for setting in cls.CREDIT_RULES["critique"]:
-            if setting["max_words"] == "max" or word_count < setting["max_words"]:
-                return setting["credits"]
+        return cls.get_compiled_credit_rules().critique.credits_for(word_count)
+
+    @classmethod
+    def credits_for_submissions(cls, word_counts: Iterable[int]) -> List:
+        return cls.get_compiled_credit_rules().submission.credits_for_many(word_counts)
+
+    @classmethod
+    def credits_for_critiques(cls, word_counts: Iterable[int]) -> List:
+        return cls.get_compiled_credit_rules().critique.credits_for_many(word_counts)
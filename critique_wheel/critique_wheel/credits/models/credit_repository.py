@@ -1,9 +1,13 @@
 import abc
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from critique_wheel.credits.models.credit import CreditManager
 
+# (member_id, ledger total, ledger count, recorded balance, recorded count)
+LedgerBalance = Tuple[object, float, int, float, int]
+
 
 class AbstractCreditRepository(abc.ABC):
     @abc.abstractmethod
@@ -17,3 +21,36 @@ class AbstractCreditRepository(abc.ABC):
     @abc.abstractmethod
     def list(self) -> List[CreditManager]:
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_balance(self, member_id) -> float:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_ledger_balances(self, batch_size: int) -> Iterator[List[LedgerBalance]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list_balances_without_ledger(self) -> List[LedgerBalance]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def adjust_balance(self, member_id, amount: float, transaction_count: int) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def balance_as_of(self, member_id, as_of: datetime) -> float:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def write_snapshots(self) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_ledger(
+        self,
+        batch_size: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[List[tuple]]:
+        raise NotImplementedError
@@ -0,0 +1,61 @@
+import logging
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Credits = Union[int, float]
+
+
+@dataclass(frozen=True)
+class CreditTiers:
+    """One rule list compiled to ascending exclusive word count limits, so a
+    lookup is a single bisect rather than a walk over the rules."""
+
+    limits: Tuple[int, ...]
+    credits: Tuple[Credits, ...]
+    # Credits of the "max" rule, for counts beyond every limit.
+    over_limit: Optional[Credits] = None
+
+    @classmethod
+    def compile(cls, rules: list) -> "CreditTiers":
+        limits: List[int] = []
+        credits: List[Credits] = []
+        for rule in rules:
+            if rule["max_words"] == "max":
+                # Rules after "max" can never match.
+                return cls(tuple(limits), tuple(credits), rule["credits"])
+            # A limit no higher than an earlier one is shadowed by it.
+            if limits and rule["max_words"] <= limits[-1]:
+                continue
+            limits.append(rule["max_words"])
+            credits.append(rule["credits"])
+        return cls(tuple(limits), tuple(credits))
+
+    def credits_for(self, word_count: int) -> Optional[Credits]:
+        tier = bisect_right(self.limits, word_count)
+        if tier < len(self.credits):
+            return self.credits[tier]
+        return self.over_limit
+
+    def credits_for_many(self, word_counts: Iterable[int]) -> List[Optional[Credits]]:
+        # Local names keep the per item cost to one bisect and one index.
+        limits, over_limit = self.limits, self.over_limit
+        table = self.credits + (over_limit,)
+        return [table[bisect_right(limits, count)] for count in word_counts]
+
+
+@dataclass(frozen=True)
+class CreditRuleBook:
+    submission: CreditTiers
+    critique: CreditTiers
+
+    @classmethod
+    def compile(cls, rules: dict) -> "CreditRuleBook":
+        book = cls(
+            submission=CreditTiers.compile(rules["submission"]),
+            critique=CreditTiers.compile(rules["critique"]),
+        )
+        logger.debug(f"Compiled credit rules {book}")
+        return book
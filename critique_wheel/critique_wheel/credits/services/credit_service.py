@@ -0,0 +1,181 @@
+import csv
+import logging
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Optional
+
+from critique_wheel.config import config
+from critique_wheel.credits.models.credit import CreditManager, TransactionType
+from critique_wheel.credits.services import unit_of_work as uow
+from critique_wheel.credits.value_objects import BalanceDrift, ReconciliationReport
+
+logger = logging.getLogger(__name__)
+
+
+def add_credit(
+    uow: uow.AbstractUnitOfWork,
+    member_id,
+    amount,
+    transaction_type: TransactionType,
+    work_id=None,
+    critique_id=None,
+) -> dict:
+    with uow:
+        credit = CreditManager.create(
+            member_id=member_id,
+            amount=amount,
+            transaction_type=transaction_type,
+            work_id=work_id,
+            critique_id=critique_id,
+        )
+        uow.credits.add(credit)
+        balance = uow.credits.get_balance(member_id)
+        uow.commit()
+        logger.debug(f"Credit {credit.id} added, balance is now {balance}")
+        return {"id": str(credit.id), "balance": balance}
+
+
+def get_balance(uow: uow.AbstractUnitOfWork, member_id) -> float:
+    with uow:
+        return uow.credits.get_balance(member_id)
+
+
+def _drift(row) -> Optional[BalanceDrift]:
+    member_id, expected, expected_count, recorded, recorded_count = row
+    if round(recorded, 2) == round(expected, 2) and recorded_count == expected_count:
+        return None
+    return BalanceDrift(
+        member_id=member_id,
+        recorded=recorded,
+        expected=expected,
+        recorded_count=recorded_count,
+        expected_count=expected_count,
+    )
+
+
+def _reconcile(uow: uow.AbstractUnitOfWork, report, rows, repair: bool) -> None:
+    report.members_checked += len(rows)
+    drift = [drift for drift in map(_drift, rows) if drift]
+    report.drift.extend(drift)
+    if not (repair and drift):
+        return
+    for member_drift in drift:
+        uow.credits.adjust_balance(
+            member_drift.member_id,
+            member_drift.expected - member_drift.recorded,
+            member_drift.expected_count - member_drift.recorded_count,
+        )
+    uow.commit()
+    report.repaired = True
+
+
+def reconcile_balances(
+    uow: uow.AbstractUnitOfWork,
+    batch_size: Optional[int] = None,
+    repair: bool = True,
+) -> ReconciliationReport:
+    """Recompute every balance from the credits ledger a batch of members at
+    a time, and report (and by default repair) any that drifted. Each batch's
+    repairs are committed before the next is read, so a failure late in the
+    run keeps the earlier ones. Repairs add the difference rather than
+    overwrite, so credits committed while the job runs are not lost."""
+    batch_size = batch_size or config.CREDIT_RECONCILE_BATCH_SIZE
+    report = ReconciliationReport()
+    with uow:
+        for rows in uow.credits.iter_ledger_balances(batch_size):
+            _reconcile(uow, report, rows, repair)
+        # Balances left behind for members with no ledger rows at all.
+        _reconcile(uow, report, uow.credits.list_balances_without_ledger(), repair)
+    logger.info(
+        f"Reconciled {report.members_checked} credit balances, {report.drifted} drifted"
+    )
+    return report
+
+
+def balance_as_of(uow: uow.AbstractUnitOfWork, member_id, as_of: datetime) -> float:
+    with uow:
+        return uow.credits.balance_as_of(member_id, as_of)
+
+
+def write_snapshots(uow: uow.AbstractUnitOfWork) -> int:
+    """Snapshot every member whose balance changed since their last snapshot;
+    run daily so point in time queries read at most a day of ledger."""
+    with uow:
+        written = uow.credits.write_snapshots()
+        uow.commit()
+    logger.info(f"Wrote {written} credit balance snapshots")
+    return written
+
+
+LEDGER_EXPORT_COLUMNS = [
+    "id",
+    "member_id",
+    "work_id",
+    "critique_id",
+    "amount",
+    "transaction_type",
+    "date_of_transaction",
+]
+
+LEDGER_PARTITIONS = {"day": "%Y-%m-%d", "month": "%Y-%m"}
+
+
+def export_ledger(
+    uow: uow.AbstractUnitOfWork,
+    directory,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    period: str = "day",
+    batch_size: Optional[int] = None,
+) -> Dict[str, int]:
+    """Stream the ledger in date order into one CSV file per day or month,
+    credits_<partition>.csv, and return the row count of each file."""
+    if period not in LEDGER_PARTITIONS:
+        raise ValueError(f"Unknown ledger partition period: {period}")
+    date_format = LEDGER_PARTITIONS[period]
+    batch_size = batch_size or config.CREDIT_RECONCILE_BATCH_SIZE
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    counts: Dict[str, int] = {}
+    partition, file, writer = None, None, None
+    try:
+        with uow:
+            for rows in uow.credits.iter_ledger(batch_size, start=start, end=end):
+                for row in rows:
+                    row_partition = row[-1].strftime(date_format)
+                    if row_partition != partition:
+                        # Rows arrive in date order, so each file is
+                        # written once, start to finish.
+                        if file:
+                            file.close()
+                        partition = row_partition
+                        file = open(
+                            directory / f"credits_{partition}.csv",
+                            "w",
+                            newline="",
+                            encoding="utf-8",
+                        )
+                        writer = csv.writer(file)
+                        writer.writerow(LEDGER_EXPORT_COLUMNS)
+                        counts[partition] = 0
+                    writer.writerow(_export_value(value) for value in row)  # type: ignore
+                    counts[partition] += 1
+    finally:
+        if file:
+            file.close()
+    logger.info(f"Exported {sum(counts.values())} credits in {len(counts)} files")
+    return counts
+
+
+def _export_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (int, float)):
+        return value
+    # Id value objects
+    return str(value)
@@ -0,0 +1,46 @@
+# pylint: disable=attribute-defined-outside-init
+from __future__ import annotations
+
+import abc
+
+from critique_wheel.adapters.sqlalchemy import credit_repository as repository
+from critique_wheel.credits.models.credit_repository import AbstractCreditRepository
+from critique_wheel.infrastructure import database as db_config
+
+
+class AbstractUnitOfWork(abc.ABC):
+    credits: AbstractCreditRepository
+
+    def __enter__(self) -> AbstractUnitOfWork:
+        return self
+
+    def __exit__(self, *args):
+        self.rollback()
+
+    @abc.abstractmethod
+    def commit(self):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def rollback(self):
+        raise NotImplementedError
+
+
+class CreditUnitOfWork(AbstractUnitOfWork):
+    def __init__(self, session_factory=None):
+        self.session_factory = session_factory or db_config.get_session_factory()
+
+    def __enter__(self):
+        self.session = self.session_factory()  # type: Session
+        self.credits = repository.CreditRepository(self.session)
+        return super().__enter__()
+
+    def __exit__(self, *args):
+        super().__exit__(*args)
+        self.session.close()
+
+    def commit(self):
+        self.session.commit()
+
+    def rollback(self):
+        self.session.rollback()
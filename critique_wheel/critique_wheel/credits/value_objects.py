@@ -23,3 +23,23 @@ class TransactionId:
 
     def get_uuid(self):
         return str(self.id)
+
+
+@dataclass(frozen=True)
+class BalanceDrift:
+    member_id: object
+    recorded: float
+    expected: float
+    recorded_count: int
+    expected_count: int
+
+
+@dataclass
+class ReconciliationReport:
+    members_checked: int = 0
+    drift: list = field(default_factory=list)
+    repaired: bool = False
+
+    @property
+    def drifted(self) -> int:
+        return len(self.drift)
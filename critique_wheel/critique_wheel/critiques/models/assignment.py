@@ -0,0 +1,182 @@
+import heapq
+import logging
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from critique_wheel.config import config
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.works.models.work import Work
+from critique_wheel.works.value_objects import WorkAgeRestriction, WorkGenre, WorkId
+
+logger = logging.getLogger(__name__)
+
+BucketKey = Tuple[WorkGenre, WorkAgeRestriction]
+
+
+@dataclass(frozen=True)
+class AssignableWork:
+    work_id: WorkId
+    author_id: MemberId
+    genre: WorkGenre
+    age_restriction: WorkAgeRestriction
+    critique_count: int = 0
+    # Work.critique_limit, set by an admin to override the default limit.
+    critique_limit: Optional[int] = None
+
+    @classmethod
+    def from_works(cls, works: Iterable[Work]) -> List["AssignableWork"]:
+        # Only works open for critique enter the pool.
+        return [
+            cls(
+                work_id=work.id,
+                author_id=work.member_id,
+                genre=work.genre,
+                age_restriction=work.age_restriction,
+                critique_count=work.critique_count,
+                critique_limit=work.critique_limit,
+            )
+            for work in works
+            if work.is_available_for_critique()
+        ]
+
+
+@dataclass(frozen=True)
+class Critic:
+    member_id: MemberId
+    # Critiques the member owes; they receive at most this many works.
+    owed: int
+    # Empty means any genre / any age restriction.
+    genres: FrozenSet[WorkGenre] = frozenset()
+    age_restrictions: FrozenSet[WorkAgeRestriction] = frozenset()
+    critiqued: FrozenSet[WorkId] = frozenset()
+
+    def accepts(self, key: BucketKey) -> bool:
+        genre, age_restriction = key
+        return (not self.genres or genre in self.genres) and (
+            not self.age_restrictions or age_restriction in self.age_restrictions
+        )
+
+
+@dataclass(frozen=True)
+class Assignment:
+    work_id: WorkId
+    member_id: MemberId
+
+
+def assign_critiques(
+    works: Iterable[AssignableWork],
+    critics: Iterable[Critic],
+    critique_limit: Optional[int] = None,
+) -> List[Assignment]:
+    """Match works needing critiques to members who owe them.
+
+    Works sit in one min-heap per (genre, age restriction), ordered by how many
+    critiques they already have and then by input order, so pass them oldest
+    first. Critics come off a min-heap ordered by how many works they have been
+    given in this run, so load is spread round robin. Each assignment is a
+    couple of heap operations plus a scan of the bucket tops the critic
+    accepts (at most one per genre/age pair), giving O((W + C + A) log n)
+    overall. A critic is never given their own work, a work they have already
+    critiqued, or the same work twice."""
+    default_limit = (
+        config.CRITIQUE_LIMIT_PER_WORK if critique_limit is None else critique_limit
+    )
+    works = list(works)
+    # Members are numbered so the hot loop compares and hashes small ints
+    # rather than id value objects.
+    member_numbers: Dict[MemberId, int] = {}
+    # Buckets are addressed by position; heap entries are
+    # (critique_count, work_position, author_number, limit).
+    bucket_index: Dict[BucketKey, int] = {}
+    buckets: List[list] = []
+    for position, work in enumerate(works):
+        limit = default_limit if work.critique_limit is None else work.critique_limit
+        if work.critique_count >= limit:
+            continue
+        key = (work.genre, work.age_restriction)
+        index = bucket_index.get(key)
+        if index is None:
+            index = bucket_index[key] = len(buckets)
+            buckets.append([])
+        author = member_numbers.setdefault(work.author_id, len(member_numbers))
+        buckets[index].append((work.critique_count, position, author, limit))
+    for heap in buckets:
+        heapq.heapify(heap)
+
+    critics = [critic for critic in critics if critic.owed > 0]
+    critic_members = [
+        member_numbers.setdefault(critic.member_id, len(member_numbers))
+        for critic in critics
+    ]
+    critic_heap = [(0, position) for position in range(len(critics))]
+    heapq.heapify(critic_heap)
+    work_positions: Optional[Dict[WorkId, int]] = None
+
+    # Critics sharing a preference set share its list of buckets.
+    accepted_buckets: Dict[Tuple[FrozenSet, FrozenSet], List[list]] = {}
+    assignments: List[Assignment] = []
+    seen_by_critic: Dict[int, Set[int]] = {}
+    while critic_heap:
+        load, position = heapq.heappop(critic_heap)
+        critic = critics[position]
+        preferences = (critic.genres, critic.age_restrictions)
+        accepted = accepted_buckets.get(preferences)
+        if accepted is None:
+            accepted = accepted_buckets[preferences] = [
+                buckets[index]
+                for key, index in bucket_index.items()
+                if critic.accepts(key)
+            ]
+        seen = seen_by_critic.get(position)
+        if seen is None:
+            seen = seen_by_critic[position] = set()
+            if critic.critiqued:
+                if work_positions is None:
+                    work_positions = {
+                        work.work_id: index for index, work in enumerate(works)
+                    }
+                seen.update(
+                    work_positions[work_id]
+                    for work_id in critic.critiqued
+                    if work_id in work_positions
+                )
+        heap, entry = _pop_eligible(accepted, critic_members[position], seen)
+        if entry is None:
+            # Nothing left this critic may take; they drop out of the run.
+            continue
+        count, work_position, author, limit = entry
+        assignments.append(
+            Assignment(work_id=works[work_position].work_id, member_id=critic.member_id)
+        )
+        seen.add(work_position)
+        if count + 1 < limit:
+            heapq.heappush(heap, (count + 1, work_position, author, limit))
+        if load + 1 < critic.owed:
+            heapq.heappush(critic_heap, (load + 1, position))
+    logger.debug(f"Assigned {len(assignments)} critiques")
+    return assignments
+
+
+def _pop_eligible(accepted: List[list], member: int, seen: Set[int]):
+    # Try the accepted buckets, least critiqued top first; heaps compare by
+    # their top entry. Works the critic may not take are set aside and pushed
+    # back once a choice is made, so the cost is bounded by the critic's own
+    # and already seen works.
+    candidates = [heap for heap in accepted if heap]
+    while candidates:
+        best = min(candidates)
+        set_aside = []
+        chosen = None
+        while best:
+            entry = heapq.heappop(best)
+            if entry[2] == member or entry[1] in seen:
+                set_aside.append(entry)
+                continue
+            chosen = entry
+            break
+        for entry in set_aside:
+            heapq.heappush(best, entry)
+        if chosen is not None:
+            return best, chosen
+        candidates = [heap for heap in candidates if heap is not best]
+    return None, None
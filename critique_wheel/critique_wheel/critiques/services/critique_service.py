@@ -0,0 +1,162 @@
+import logging
+import uuid
+
+from critique_wheel import unit_of_work
+from critique_wheel.config import config
+from critique_wheel.credits.models.credit import CreditManager, TransactionType
+from critique_wheel.critiques import value_objects
+from critique_wheel.critiques.models.critique import Critique
+from critique_wheel.critiques.services.unit_of_work import AbstractUnitOfWork
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.works.exceptions import exceptions as work_exceptions
+from critique_wheel.works.value_objects import WorkId, WorkStatus
+
+logger = logging.getLogger(__name__)
+
+
+class BaseCritiqueServiceError(Exception):
+    pass
+
+
+class WorkNotFoundError(BaseCritiqueServiceError):
+    pass
+
+
+class CritiqueNotFoundError(BaseCritiqueServiceError):
+    pass
+
+
+def build_critique(
+    work_id: str,
+    member_id: str,
+    critique_about: str,
+    critique_successes: str,
+    critique_weaknesses: str,
+    critique_ideas: str,
+) -> Critique:
+    return Critique.create(
+        critique_about=value_objects.CritiqueAbout(critique_about),
+        critique_successes=value_objects.CritiqueSuccesses(critique_successes),
+        critique_weaknesses=value_objects.CritiqueWeaknesses(critique_weaknesses),
+        critique_ideas=value_objects.CritiqueIdeas(critique_ideas),
+        member_id=MemberId.from_string(member_id),
+        work_id=WorkId.from_string(work_id),
+    )
+
+
+def reserve_critique_slot(uow, critique: Critique) -> None:
+    """Take one of the work's critique slots, or raise why there is none.
+
+    The cap is checked by the conditional UPDATE on the work row, so neither
+    the work's critiques nor its other columns are loaded."""
+    limit = config.CRITIQUE_LIMIT_PER_WORK
+    active = critique.status == value_objects.CritiqueStatus.ACTIVE
+    if uow.works.reserve_critique_slot(critique.work_id, limit, active):
+        return
+    # Only on refusal is the row read, to say why.
+    capacity = uow.works.get_critique_capacity(critique.work_id)
+    if capacity is None:
+        raise WorkNotFoundError(f"Work {critique.work_id} not found")
+    if capacity.status != WorkStatus.ACTIVE:
+        raise work_exceptions.WorkNotAvailableForCritiqueError(
+            "This work is not available for critique"
+        )
+    raise work_exceptions.CritiqueLimitReachedError(
+        f"This work has reached its limit of {capacity.limit(limit)} critiques"
+    )
+
+
+def add_critique(
+    uow: AbstractUnitOfWork,
+    work_id: str,
+    member_id: str,
+    critique_about: str,
+    critique_successes: str,
+    critique_weaknesses: str,
+    critique_ideas: str,
+) -> dict:
+    """Store a critique and bump the work's counters in one transaction.
+
+    The one-critique-per-member rule is kept by the unique (work_id,
+    member_id) index."""
+    critique = build_critique(
+        work_id,
+        member_id,
+        critique_about,
+        critique_successes,
+        critique_weaknesses,
+        critique_ideas,
+    )
+    with uow:
+        reserve_critique_slot(uow, critique)
+        uow.critiques.add(critique)
+        uow.commit()
+        logger.debug(f"Added critique {critique.id} to work {work_id}")
+        return {"id": str(critique.id), "work_id": work_id, "member_id": member_id}
+
+
+def submit_critique(
+    uow: unit_of_work.AbstractUnitOfWork,
+    work_id: str,
+    member_id: str,
+    critique_about: str,
+    critique_successes: str,
+    critique_weaknesses: str,
+    critique_ideas: str,
+) -> dict:
+    """Store a critique and credit its author, priced by the work's word
+    count, in one transaction: either both happen or neither does."""
+    critique = build_critique(
+        work_id,
+        member_id,
+        critique_about,
+        critique_successes,
+        critique_weaknesses,
+        critique_ideas,
+    )
+    with uow:
+        reserve_critique_slot(uow, critique)
+        uow.critiques.add(critique)
+        amount = CreditManager.credits_for_critique(
+            uow.works.get_word_count(critique.work_id) or 0
+        )
+        credit = CreditManager.create(
+            member_id=critique.member_id,
+            amount=amount,
+            transaction_type=TransactionType.CRITIQUE_GIVEN,
+            work_id=critique.work_id,
+            critique_id=critique.id,
+        )
+        uow.credits.add(credit)
+        balance = uow.credits.get_balance(critique.member_id)
+        uow.commit()
+        logger.debug(f"Added critique {critique.id} to work {work_id} for {amount}")
+        return {
+            "id": str(critique.id),
+            "work_id": work_id,
+            "member_id": member_id,
+            "credits": amount,
+            "balance": balance,
+        }
+
+
+def change_critique_status(
+    uow: AbstractUnitOfWork, critique_id: str, status: str
+) -> None:
+    """Move a critique to another status, keeping the work's active count in
+    step."""
+    new_status = value_objects.CritiqueStatus(status)
+    with uow:
+        critique = uow.critiques.get(
+            value_objects.CritiqueId(uuid.UUID(critique_id)), loading={}
+        )
+        if critique is None:
+            raise CritiqueNotFoundError(f"Critique {critique_id} not found")
+        was_active = critique.status == value_objects.CritiqueStatus.ACTIVE
+        is_active = new_status == value_objects.CritiqueStatus.ACTIVE
+        critique.status = new_status
+        if was_active != is_active:
+            uow.works.adjust_active_critique_count(
+                critique.work_id, 1 if is_active else -1
+            )
+        uow.commit()
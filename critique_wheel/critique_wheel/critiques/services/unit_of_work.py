@@ -0,0 +1,76 @@
+# pylint: disable=attribute-defined-outside-init
+from __future__ import annotations
+
+import abc
+
+from sqlalchemy.exc import IntegrityError
+
+from critique_wheel.adapters.sqlalchemy import critique_repository, work_repository
+from critique_wheel.critiques.models.critique_repository import (
+    AbstractCritiqueRepository,
+)
+from critique_wheel.infrastructure import database as db_config
+from critique_wheel.infrastructure.cache import get_work_cache
+from critique_wheel.works.exceptions import exceptions
+from critique_wheel.works.models.work_repository import AbstractWorkRepository
+
+
+def raise_for_duplicate_critique(error: IntegrityError) -> None:
+    # Postgres reports the violated index name, SQLite the table and columns.
+    message = str(error.orig)
+    if (
+        "ix_critiques_work_id_member_id" in message
+        or "critiques.work_id, critiques.member_id" in message
+    ):
+        raise exceptions.CritiqueDuplicateError(
+            "Member has already critiqued this work"
+        ) from error
+
+
+class AbstractUnitOfWork(abc.ABC):
+    works: AbstractWorkRepository
+    critiques: AbstractCritiqueRepository
+
+    def __enter__(self) -> AbstractUnitOfWork:
+        return self
+
+    def __exit__(self, *args):
+        self.rollback()
+
+    @abc.abstractmethod
+    def commit(self):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def rollback(self):
+        raise NotImplementedError
+
+
+class CritiqueUnitOfWork(AbstractUnitOfWork):
+    def __init__(self, session_factory=None, cache=None):
+        self.session_factory = session_factory or db_config.get_session_factory()
+        self.cache = cache or get_work_cache()
+
+    def __enter__(self):
+        self.session = self.session_factory()  # type: Session
+        self.works = work_repository.WorkRepository(self.session)
+        self.critiques = critique_repository.CritiqueRepository(self.session)
+        return super().__enter__()
+
+    def __exit__(self, *args):
+        super().__exit__(*args)
+        self.session.close()
+
+    def commit(self):
+        try:
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise_for_duplicate_critique(e)
+            raise
+        # Critiques change their work's critique list and counters.
+        self.cache.invalidate(work_repository.pop_touched_work_ids(self.session))
+
+    def rollback(self):
+        self.session.rollback()
+        work_repository.pop_touched_work_ids(self.session)
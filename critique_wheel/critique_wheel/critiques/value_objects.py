@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from critique_wheel.config import config
+from critique_wheel.text import Text, exceeds_word_count
 
 
 class BaseCritiqueDomainError(Exception):
@@ -37,7 +38,7 @@ class CritiqueId:
 
 
 @dataclass(frozen=True)
-class CritiqueAbout:
+class CritiqueAbout(Text):
     value: str
     minimum_words = config.CRITIQUE_ABOUT_MIN_WORDS
 
@@ -50,12 +51,9 @@ class CritiqueAbout:
     def __len__(self):
         return len(self.value)
 
-    def word_count(self):
-        return len(self.value.split())
-
 
 @dataclass(frozen=True)
-class CritiqueSuccesses:
+class CritiqueSuccesses(Text):
     value: str
     minimum_words = config.CRITIQUE_SUCCESSES_MIN_WORDS
 
@@ -68,12 +66,9 @@ class CritiqueSuccesses:
     def __len__(self):
         return len(self.value)
 
-    def word_count(self):
-        return len(self.value.split())
-
 
 @dataclass(frozen=True)
-class CritiqueWeaknesses:
+class CritiqueWeaknesses(Text):
     value: str
     minimum_words = config.CRITIQUE_WEAKNESSES_MIN_WORDS
 
@@ -86,12 +81,9 @@ class CritiqueWeaknesses:
     def __len__(self):
         return len(self.value)
 
-    def word_count(self):
-        return len(self.value.split())
-
 
 @dataclass(frozen=True)
-class CritiqueIdeas:
+class CritiqueIdeas(Text):
     value: str
     minimum_words = config.CRITIQUE_IDEAS_MIN_WORDS
 
@@ -104,9 +96,6 @@ class CritiqueIdeas:
     def __len__(self):
         return len(self.value)
 
-    def word_count(self):
-        return len(self.value.split())
-
 
 def satisfies_minimum_word_count(value, minimum_words):
-    return len(value.split()) <= minimum_words
+    return not exceeds_word_count(value, minimum_words)
@@ -0,0 +1,68 @@
+import logging
+from typing import Optional
+
+import fastapi
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from critique_wheel.infrastructure import tokens
+from critique_wheel.members.models.IAM import Member, MemberRole
+
+logger = logging.getLogger(__name__)
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def unauthenticated(detail: str = "Not authenticated") -> fastapi.HTTPException:
+    return fastapi.HTTPException(
+        status_code=401, detail=detail, headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+async def get_token_claims(
+    request: fastapi.Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = fastapi.Depends(
+        bearer_scheme
+    ),
+) -> tokens.TokenClaims:
+    """Validate the bearer access token in memory: signature, expiry and the
+    revocation list. The member id and role are placed on the request state.
+    Declared async so FastAPI runs it inline rather than in a thread."""
+    if credentials is None:
+        raise unauthenticated()
+    try:
+        claims = tokens.authenticate(credentials.credentials)
+    except tokens.TokenError as e:
+        logger.debug(f"Rejected access token: {e}")
+        raise unauthenticated(str(e))
+    request.state.member_id = claims.member_id
+    request.state.member_role = claims.role
+    return claims
+
+
+async def get_member_role(
+    request: fastapi.Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = fastapi.Depends(
+        bearer_scheme
+    ),
+) -> MemberRole:
+    # A role already placed on the request state by middleware wins;
+    # otherwise the bearer token supplies it.
+    role = getattr(request.state, "member_role", None)
+    if role is None:
+        role = (await get_token_claims(request, credentials)).role
+    return MemberRole(role)
+
+
+def require_permission(action: str, resource: str):
+    """Dependency that authorizes the caller's role against the compiled
+    permission index; no database access."""
+
+    async def check_permission(
+        role: MemberRole = fastapi.Depends(get_member_role),
+    ) -> MemberRole:
+        if not Member.get_permission_index().allows(role, action, resource):
+            logger.debug(f"{role.value} may not {action} {resource}")
+            raise fastapi.HTTPException(status_code=403, detail="Permission denied")
+        return role
+
+    return check_permission
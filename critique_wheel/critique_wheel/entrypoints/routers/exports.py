@@ -0,0 +1,51 @@
+import json
+import logging
+import uuid
+from typing import Optional
+
+import fastapi
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from critique_wheel.adapters.sqlalchemy import export_repository
+from critique_wheel.entrypoints.dependencies import require_permission
+from critique_wheel.infrastructure import database as db_config
+
+logger = logging.getLogger(__name__)
+
+router = fastapi.APIRouter()
+
+
+async def get_db_session():
+    db = db_config.get_async_session_factory()
+    yield db
+
+
+@router.get("/exports/{name}")
+async def export_records(
+    name: str,
+    after: Optional[str] = None,
+    batch_size: Optional[int] = fastapi.Query(None, ge=1),
+    session_factory: async_sessionmaker = fastapi.Depends(get_db_session),
+    role=fastapi.Depends(require_permission("Export", "Records")),
+):
+    """Newline delimited JSON, one record per line in id order. Pass the id
+    of the last record received as `after` to resume. Admins only: exports
+    carry every member's email."""
+    if name not in export_repository.EXPORT_NAMES:
+        raise fastapi.HTTPException(status_code=404, detail=f"Unknown export {name}")
+    if after:
+        try:
+            uuid.UUID(after)
+        except ValueError:
+            raise fastapi.HTTPException(status_code=400, detail="Invalid cursor")
+
+    async def lines():
+        # The session lives as long as the response body is being sent.
+        async with session_factory() as session:
+            repository = export_repository.AsyncExportRepository(session)
+            async for record in repository.stream_records(name, after, batch_size):
+                yield json.dumps(record) + "\n"
+
+    logger.debug(f"Streaming {name} export after {after}")
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
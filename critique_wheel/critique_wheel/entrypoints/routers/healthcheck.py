@@ -2,6 +2,9 @@ import logging
 
 import fastapi
 
+from critique_wheel.infrastructure.cache import get_work_cache
+from critique_wheel.infrastructure.password_hasher import get_password_hasher
+
 logger = logging.getLogger(__name__)
 
 router = fastapi.APIRouter()
@@ -10,3 +13,11 @@ router = fastapi.APIRouter()
 @router.get("/healthcheck")
 async def healthcheck():
     return {"status": "ok"}
+
+
+@router.get("/metrics")
+async def metrics():
+    return {
+        "password_hasher": get_password_hasher().metrics(),
+        "work_cache": get_work_cache().metrics(),
+    }
@@ -1,12 +1,20 @@
 import logging
+from typing import Optional
 
 import fastapi
 import fastapi.exception_handlers
-from sqlalchemy.orm import Session
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from critique_wheel.entrypoints.dependencies import bearer_scheme, unauthenticated
 from critique_wheel.entrypoints.schemas import schemas
 from critique_wheel.infrastructure import database as db_config
-from critique_wheel.members.services import iam_service, unit_of_work
+from critique_wheel.members.services import async_iam_service, unit_of_work
+from critique_wheel.members.services.exceptions import (
+    InvalidCredentialsError,
+    InvalidTokenError,
+    LoginThrottledError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,8 +23,8 @@ router = fastapi.APIRouter(
 )
 
 
-def get_db_session():
-    db: Session = db_config.get_postgres_session_local()
+async def get_db_session():
+    db: async_sessionmaker = db_config.get_async_session_factory()
     yield db
 
 
@@ -25,13 +33,13 @@ def get_db_session():
     response_model=schemas.UserMember,
     status_code=201,
 )
-def create_member(
+async def create_member(
     member: schemas.UserMemberIn,
-    db: Session = fastapi.Depends(get_db_session),
+    db: async_sessionmaker = fastapi.Depends(get_db_session),
 ):
     logger.debug("Creating member.")
-    result = iam_service.add_member(
-        uow=unit_of_work.IAMUnitOfWork(session_factory=db),
+    result = await async_iam_service.add_member(
+        uow=unit_of_work.AsyncIAMUnitOfWork(session_factory=db),
         username=member.username,
         email=member.email,
         password=member.password,
@@ -44,13 +52,13 @@ def create_member(
     response_model=schemas.RegisterMemberSuccess,
     status_code=201,
 )
-def register_member(
+async def register_member(
     member: schemas.RegisterMemberIn,
-    db: Session = fastapi.Depends(get_db_session),
+    db: async_sessionmaker = fastapi.Depends(get_db_session),
 ):
     logger.debug("Registering member.")
-    iam_service.register_member(
-        uow=unit_of_work.IAMUnitOfWork(session_factory=db),
+    await async_iam_service.register_member(
+        uow=unit_of_work.AsyncIAMUnitOfWork(session_factory=db),
         username=member.username,
         email=member.email,
         password=member.password,
@@ -59,3 +67,61 @@ def register_member(
     return {
         "detail": "User created. Please confirm your email",
     }
+
+
+@router.post("/login", response_model=schemas.TokenOut)
+async def login(
+    credentials: schemas.LoginIn,
+    request: fastapi.Request,
+    db: async_sessionmaker = fastapi.Depends(get_db_session),
+):
+    try:
+        return await async_iam_service.issue_tokens(
+            uow=unit_of_work.AsyncIAMUnitOfWork(session_factory=db),
+            email=credentials.email,
+            password=credentials.password,
+            client_address=request.client.host if request.client else None,
+        )
+    except InvalidCredentialsError:
+        raise unauthenticated("Invalid credentials")
+    except LoginThrottledError as e:
+        raise fastapi.HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+
+@router.post("/token/refresh", response_model=schemas.TokenOut)
+async def refresh_token(
+    token: schemas.RefreshTokenIn,
+    db: async_sessionmaker = fastapi.Depends(get_db_session),
+):
+    try:
+        return await async_iam_service.refresh_tokens(
+            uow=unit_of_work.AsyncIAMUnitOfWork(session_factory=db),
+            refresh_token=token.refresh_token,
+        )
+    except InvalidTokenError as e:
+        raise unauthenticated(str(e))
+
+
+@router.post("/logout", status_code=204)
+async def logout(
+    token: Optional[schemas.LogoutIn] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = fastapi.Depends(
+        bearer_scheme
+    ),
+    db: async_sessionmaker = fastapi.Depends(get_db_session),
+):
+    if credentials is None:
+        raise unauthenticated()
+    try:
+        await async_iam_service.revoke_tokens(
+            uow=unit_of_work.AsyncIAMUnitOfWork(session_factory=db),
+            access_token=credentials.credentials,
+            refresh_token=token.refresh_token if token else None,
+        )
+    except InvalidTokenError as e:
+        raise unauthenticated(str(e))
+    return fastapi.Response(status_code=204)
@@ -0,0 +1,48 @@
+import logging
+
+import fastapi
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from critique_wheel.entrypoints.schemas import schemas
+from critique_wheel.infrastructure import database as db_config
+from critique_wheel.members.models import exceptions as member_exceptions
+from critique_wheel.ratings.services import rating_service, unit_of_work
+
+logger = logging.getLogger(__name__)
+
+router = fastapi.APIRouter()
+
+
+async def get_db_session():
+    db = db_config.get_async_session_factory()
+    yield db
+
+
+@router.get(
+    "/critiques/{critique_id}/ratings", response_model=schemas.CritiqueRatingsOut
+)
+async def get_critique_ratings(
+    critique_id: str,
+    session_factory: async_sessionmaker = fastapi.Depends(get_db_session),
+):
+    try:
+        return await rating_service.get_critique_aggregate(
+            uow=unit_of_work.AsyncRatingUnitOfWork(session_factory=session_factory),
+            critique_id=critique_id,
+        )
+    except ValueError as e:
+        raise fastapi.HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/critics/{member_id}/ratings", response_model=schemas.CriticRatingsOut)
+async def get_critic_ratings(
+    member_id: str,
+    session_factory: async_sessionmaker = fastapi.Depends(get_db_session),
+):
+    try:
+        return await rating_service.get_critic_aggregate(
+            uow=unit_of_work.AsyncRatingUnitOfWork(session_factory=session_factory),
+            member_id=member_id,
+        )
+    except member_exceptions.InvalidEntryError as e:
+        raise fastapi.HTTPException(status_code=400, detail=str(e))
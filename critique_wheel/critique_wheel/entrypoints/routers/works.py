@@ -1,12 +1,16 @@
 import logging
+from typing import Optional
 
 import fastapi
 import fastapi.exception_handlers
-from sqlalchemy.orm import Session
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from critique_wheel.entrypoints.dependencies import require_permission
 from critique_wheel.entrypoints.schemas import schemas
 from critique_wheel.infrastructure import database as db_config
-from critique_wheel.works.services import unit_of_work, work_service
+from critique_wheel.works.services import async_work_service, unit_of_work
+from critique_wheel.works.services.work_service import InvalidDataError
 
 logger = logging.getLogger(__name__)
 
@@ -14,18 +18,18 @@ router = fastapi.APIRouter()
 
 
 async def get_db_session():
-    db = db_config.get_postgres_session_local()
+    db = db_config.get_async_session_factory()
     yield db
 
 
 @router.post("/works", response_model=schemas.UserWork, status_code=201)
 async def create_work(
     work: schemas.UserWorkIn,
-    session_factory: Session = fastapi.Depends(get_db_session),
+    session_factory: async_sessionmaker = fastapi.Depends(get_db_session),
 ):
     logger.debug("Creating work.")
-    result = work_service.add_work(
-        uow=unit_of_work.WorkUnitOfWork(session_factory=session_factory),
+    result = await async_work_service.add_work(
+        uow=unit_of_work.AsyncWorkUnitOfWork(session_factory=session_factory),
         title=work.title,
         content=work.content,
         member_id=work.member_id,
@@ -35,13 +39,77 @@ async def create_work(
     return result
 
 
-@router.get("/work/{work_id}")
-async def get_work_by_id(work_id: str):
-    work = work_service.get_work_by_id(
-        work_id=work_id, uow=unit_of_work.WorkUnitOfWork()
+@router.post("/works/bulk", response_model=schemas.WorkImportOut)
+async def import_works(
+    payload: schemas.WorkImportIn,
+    batch_size: Optional[int] = fastapi.Query(None, ge=1),
+    session_factory: async_sessionmaker = fastapi.Depends(get_db_session),
+    role=fastapi.Depends(require_permission("Import", "Works")),
+):
+    """Admins only: imported works may be attributed to any member."""
+    logger.debug(f"Importing {len(payload.works)} works.")
+    return await async_work_service.import_works(
+        uow=unit_of_work.AsyncWorkUnitOfWork(session_factory=session_factory),
+        rows=(row.model_dump() for row in payload.works),
+        batch_size=batch_size,
+    )
+
+
+@router.get("/works", response_model=schemas.WorkPageOut)
+async def list_works(
+    genre: Optional[str] = None,
+    age_restriction: Optional[str] = None,
+    status: Optional[str] = None,
+    member_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = fastapi.Query(None, ge=1),
+    session_factory: async_sessionmaker = fastapi.Depends(get_db_session),
+):
+    try:
+        return await async_work_service.list_work_summaries(
+            uow=unit_of_work.AsyncWorkUnitOfWork(session_factory=session_factory),
+            genre=genre,
+            age_restriction=age_restriction,
+            status=status,
+            member_id=member_id,
+            cursor=cursor,
+            page_size=page_size,
+        )
+    except InvalidDataError as e:
+        raise fastapi.HTTPException(status_code=400, detail=str(e))
+
+
+# The service answers from the work cache with JSON-ready dicts, so they are
+# sent as they are; WorkOut only documents the shape.
+@router.get("/work/{work_id}", responses={200: {"model": schemas.WorkOut}})
+async def get_work_by_id(
+    work_id: str,
+    include_content: bool = False,
+    session_factory: async_sessionmaker = fastapi.Depends(get_db_session),
+):
+    work = await async_work_service.get_work_by_id(
+        work_id=work_id,
+        uow=unit_of_work.AsyncWorkUnitOfWork(session_factory=session_factory),
+        include_content=include_content,
     )
     if not work:
         raise fastapi.HTTPException(
             status_code=404, detail=f"Work with id {work_id} not found"
         )
-    return work
+    return JSONResponse(work)
+
+
+@router.get("/work/{work_id}/content", response_model=schemas.WorkContentOut)
+async def get_work_content(
+    work_id: str,
+    session_factory: async_sessionmaker = fastapi.Depends(get_db_session),
+):
+    content = await async_work_service.get_work_content(
+        work_id=work_id,
+        uow=unit_of_work.AsyncWorkUnitOfWork(session_factory=session_factory),
+    )
+    if content is None:
+        raise fastapi.HTTPException(
+            status_code=404, detail=f"Work with id {work_id} not found"
+        )
+    return {"id": work_id, "content": content}
@@ -1,4 +1,16 @@
-from pydantic import BaseModel, ConfigDict
+import uuid
+from datetime import datetime
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict
+
+# Fields that read a value object (WorkId, MemberId, Title...) or the plain
+# value it wraps. The wrapped UUID or string is unwrapped during validation, so
+# pydantic-core writes it out natively instead of calling __str__ per value.
+IdValue = Annotated[
+    uuid.UUID, BeforeValidator(lambda value: getattr(value, "id", value))
+]
+StrValue = Annotated[str, BeforeValidator(lambda value: getattr(value, "value", value))]
 
 
 class UserCritiquesIn(BaseModel):
@@ -28,6 +40,26 @@ class RegisterMemberSuccess(BaseModel):
     detail: str
 
 
+class LoginIn(BaseModel):
+    email: str
+    password: str
+
+
+class RefreshTokenIn(BaseModel):
+    refresh_token: str
+
+
+class LogoutIn(BaseModel):
+    refresh_token: Optional[str] = None
+
+
+class TokenOut(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str
+    expires_in: int
+
+
 class UserWorkIn(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -43,6 +75,83 @@ class UserWork(UserWorkIn):
     id: str
 
 
+class WorkImportRowIn(BaseModel):
+    # Rows are validated by the import service so one bad row is reported
+    # rather than rejecting the request.
+    id: Optional[str] = None
+    title: Optional[str] = None
+    content: Optional[str] = None
+    age_restriction: Optional[str] = None
+    genre: Optional[str] = None
+    member_id: Optional[str] = None
+
+
+class WorkImportIn(BaseModel):
+    works: list[WorkImportRowIn]
+
+
+class ImportRowErrorOut(BaseModel):
+    row: int
+    error: str
+
+
+class WorkImportOut(BaseModel):
+    imported: int
+    errors: list[ImportRowErrorOut]
+
+
+class WorkSummaryOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: IdValue
+    title: StrValue
+    age_restriction: str
+    genre: str
+    status: str
+    word_count: int
+    submission_date: datetime
+    member_id: IdValue
+
+
+class WorkPageOut(BaseModel):
+    works: list[WorkSummaryOut]
+    next_cursor: Optional[str]
+
+
+class WorkOut(BaseModel):
+    id: str
+    title: str
+    age_restriction: str
+    genre: str
+    status: str
+    word_count: int
+    submission_date: str
+    last_update_date: str
+    archive_date: Optional[str]
+    member_id: str
+    critiques: list[str]
+    content: Optional[str] = None
+
+
+class WorkContentOut(BaseModel):
+    id: str
+    content: str
+
+
+class RatingAggregateOut(BaseModel):
+    rating_count: int
+    average: Optional[float]
+    histogram: dict[str, int]
+
+
+class CritiqueRatingsOut(RatingAggregateOut):
+    critique_id: str
+
+
+class CriticRatingsOut(RatingAggregateOut):
+    member_id: str
+
+
 class UserMemberIn(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -0,0 +1,329 @@
+import abc
+import json
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from critique_wheel import config
+
+logger = logging.getLogger(__name__)
+
+# One work cache per process, see get_work_cache().
+_work_cache: Optional["AbstractCache"] = None
+
+
+class AbstractCache(abc.ABC):
+    """Holds JSON-ready dicts under hashable keys. Every cache counts hits,
+    misses, evictions and invalidations for the /metrics endpoint.
+
+    A reader takes generation(key) before loading from the database and hands
+    it to set(); an invalidation in between moves the generation on, so the
+    value loaded before it is never cached."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[dict]:
+        value = self._get(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def invalidate(self, keys: Iterable[Hashable]) -> None:
+        keys = list(keys)
+        if not keys:
+            return
+        self._delete(keys)
+        with self._lock:
+            self._invalidations += len(keys)
+        logger.debug(f"Invalidated {len(keys)} cache entries")
+
+    def _evicted(self, count: int = 1) -> None:
+        with self._lock:
+            self._evictions += count
+
+    @abc.abstractmethod
+    def _get(self, key: Hashable) -> Optional[dict]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def generation(self, key: Hashable) -> Optional[int]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, key: Hashable, value: dict, generation: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _delete(self, keys: list) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def size(self) -> Optional[int]:
+        return None
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "backend": type(self).__name__,
+                "size": self.size(),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+class NullCache(AbstractCache):
+    """Caches nothing; every lookup is a miss."""
+
+    def _get(self, key):
+        return None
+
+    def generation(self, key):
+        return None
+
+    def set(self, key, value, generation=None):
+        pass
+
+    def _delete(self, keys):
+        pass
+
+    def clear(self):
+        pass
+
+
+class LRUCache(AbstractCache):
+    """In-process cache bounded by max_size entries, least recently used
+    first out, with entries expiring ttl seconds after they were set. Expired
+    and size evicted entries both count as evictions. One generation counts
+    every invalidation, so a set() racing any invalidation is dropped."""
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, dict]]" = OrderedDict()
+        self._generation = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= self._clock():
+                del self._entries[key]
+                self._evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def generation(self, key):
+        with self._lock:
+            return self._generation
+
+    def set(self, key, value, generation=None):
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _delete(self, keys):
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def size(self):
+        return len(self._entries)
+
+
+def _check_seconds(seconds) -> None:
+    # Redis rejects fractional expiries; so does the stand-in, to catch them.
+    if seconds is not None and (
+        not isinstance(seconds, int) or isinstance(seconds, bool)
+    ):
+        raise TypeError(f"Expiry must be whole seconds, not {seconds!r}")
+
+
+class LocalSharedClient:
+    """Stand-in for a Redis client holding the few commands the shared
+    backends use, for development and tests without a Redis server."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._values: Dict[str, Tuple[Optional[float], bytes]] = {}
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._values.get(name)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires <= self._clock():
+                del self._values[name]
+                return None
+            return value
+
+    def mget(self, names: Iterable[str]) -> list:
+        return [self.get(name) for name in names]
+
+    def set(self, name: str, value: bytes, ex: Optional[int] = None) -> bool:
+        _check_seconds(ex)
+        with self._lock:
+            expires = self._clock() + ex if ex else None
+            self._values[name] = (expires, value)
+        return True
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        with self._lock:
+            expires, value = self._values.get(name, (None, b"0"))
+            if expires is not None and expires <= self._clock():
+                expires, value = None, b"0"
+            count = int(value) + amount
+            self._values[name] = (expires, str(count).encode())
+        return count
+
+    def expire(self, name: str, seconds: int) -> bool:
+        _check_seconds(seconds)
+        with self._lock:
+            if name not in self._values:
+                return False
+            self._values[name] = (self._clock() + seconds, self._values[name][1])
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._values.pop(name, None) is not None for name in names)
+
+    def flushdb(self) -> bool:
+        with self._lock:
+            self._values.clear()
+        return True
+
+
+class SharedCache(AbstractCache):
+    """Cache kept in a Redis compatible store, so every process sees the same
+    entries and invalidations. Expiry and eviction happen in the store and are
+    not counted here.
+
+    Each key has a generation counter in the store, bumped on invalidation.
+    Entries carry the generation they were loaded under and read as a miss
+    once it has moved on, which needs no compare-and-set in the store."""
+
+    def __init__(self, client, ttl: float = 60.0, prefix: str = "work:"):
+        super().__init__()
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _name(self, key: Hashable) -> str:
+        return f"{self.prefix}{key}"
+
+    def _generation_name(self, key: Hashable) -> str:
+        return f"{self.prefix}generation:{key}"
+
+    def _get(self, key):
+        value, generation = self.client.mget(
+            [self._name(key), self._generation_name(key)]
+        )
+        if value is None:
+            return None
+        entry = json.loads(value)
+        if entry["generation"] != int(generation or 0):
+            return None
+        return entry["value"]
+
+    def generation(self, key):
+        return int(self.client.get(self._generation_name(key)) or 0)
+
+    def set(self, key, value, generation=None):
+        if generation is None:
+            generation = self.generation(key)
+        entry = {"generation": generation, "value": value}
+        self.client.set(
+            self._name(key), json.dumps(entry).encode(), ex=math.ceil(self.ttl)
+        )
+
+    def _delete(self, keys):
+        # Bump before deleting, so a reader stamped with the old generation
+        # misses even if its set() lands between the two.
+        for key in keys:
+            self.client.incr(self._generation_name(key))
+        self.client.delete(*(self._name(key) for key in keys))
+
+    def clear(self):
+        self.client.flushdb()
+
+
+def build_cache(
+    backend: str = "memory",
+    max_size: int = 1024,
+    ttl: float = 60.0,
+    url: Optional[str] = None,
+) -> AbstractCache:
+    if backend == "none":
+        return NullCache()
+    if backend == "memory":
+        return LRUCache(max_size=max_size, ttl=ttl)
+    if backend == "shared":
+        return SharedCache(get_shared_client(url), ttl=ttl)
+    raise ValueError(f"Unsupported cache backend: {backend}")
+
+
+def get_shared_client(url: Optional[str] = None):
+    if not url:
+        return LocalSharedClient()
+    # Only deployments sharing a Redis server need the client library; it is
+    # listed in requirements.txt.
+    import redis
+
+    return redis.Redis.from_url(url)
+
+
+def get_work_cache() -> AbstractCache:
+    global _work_cache
+    if _work_cache is None:
+        logger.debug(f"Creating {config.config.WORK_CACHE_BACKEND} work cache.")
+        _work_cache = build_cache(
+            backend=config.config.WORK_CACHE_BACKEND,
+            max_size=config.config.WORK_CACHE_SIZE,
+            ttl=config.config.WORK_CACHE_TTL,
+            url=config.config.WORK_CACHE_URL,
+        )
+    return _work_cache
+
+
+def reset_work_cache() -> None:
+    global _work_cache
+    _work_cache = None
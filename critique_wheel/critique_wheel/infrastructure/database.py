@@ -1,14 +1,30 @@
 import logging
+from typing import Optional
 
 import sqlalchemy
 import sqlalchemy.ext.declarative
 import sqlalchemy.orm
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from critique_wheel import config
 from critique_wheel.adapters.orm import mapper_registry
+from critique_wheel.infrastructure import migrations
 
 logger = logging.getLogger(__name__)
 
+# One engine (and therefore one connection pool) per process. Routers and the
+# unit of work default factories share it through get_session_factory().
+_engine: Optional[Engine] = None
+_session_factory: Optional[sqlalchemy.orm.sessionmaker] = None
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+class SchemaMismatchError(Exception):
+    pass
+
 
 # Postgres DB configuration
 def get_postgres_uri():
@@ -29,49 +45,199 @@ def get_sqlite_uri():
     return "sqlite:///:memory:"
 
 
-def get_postgres_engine():
-    logger.debug(f"Using {config.BaseConfig().ENV_STATE} state")
-    logger.debug("Creating database engine...")
-    engine = sqlalchemy.create_engine(
-        get_postgres_uri(),
-    )
-    mapper_registry.metadata.create_all(engine)
-    logger.debug(f"Database {get_postgres_uri()} created.")
-    return engine
-
-
-def get_sqlite_engine():
+def get_database_uri():
+    if config.config.DATABASE_TYPE == "sqlite":
+        return get_sqlite_uri()
+    return get_postgres_uri()
+
+
+def get_engine_options(uri: str) -> dict:
+    if uri.startswith("sqlite"):
+        # A single shared connection keeps an in memory database alive for
+        # every session handed out by the registry.
+        return {
+            "connect_args": {"check_same_thread": False},
+            "poolclass": StaticPool,
+        }
+    return {
+        "pool_size": config.config.DB_POOL_SIZE,
+        "max_overflow": config.config.DB_MAX_OVERFLOW,
+        "pool_recycle": config.config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.config.DB_POOL_PRE_PING,
+        "pool_timeout": config.config.DB_POOL_TIMEOUT,
+    }
+
+
+def init_engine(uri: Optional[str] = None, **engine_options) -> Engine:
+    global _engine, _session_factory
+    dispose_engine()
+    uri = uri or get_database_uri()
+    options = get_engine_options(uri)
+    options.update(engine_options)
     logger.debug(f"Using {config.BaseConfig().ENV_STATE} state")
     logger.debug("Creating database engine...")
-    engine = sqlalchemy.create_engine(
-        get_sqlite_uri(),
-        connect_args={"check_same_thread": False},
-        # echo=True,
+    _engine = sqlalchemy.create_engine(uri, **options)
+    _session_factory = sqlalchemy.orm.sessionmaker(bind=_engine)
+    logger.debug(f"Engine {_engine} created.")
+    return _engine
+
+
+def get_engine() -> Engine:
+    if _engine is None:
+        return init_engine()
+    return _engine
+
+
+def get_session_factory() -> sqlalchemy.orm.sessionmaker:
+    if _session_factory is None:
+        init_engine()
+    return _session_factory  # type: ignore
+
+
+def dispose_engine() -> None:
+    global _engine, _session_factory
+    if _engine is not None:
+        logger.debug(f"Disposing engine {_engine}.")
+        _engine.dispose()
+    _engine = None
+    _session_factory = None
+
+
+def get_missing_indexes(engine: Engine) -> list[sqlalchemy.Index]:
+    inspector = sqlalchemy.inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    missing_indexes = []
+    for table in mapper_registry.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {
+            index["name"] for index in inspector.get_indexes(table.name)
+        }
+        missing_indexes.extend(
+            index for index in table.indexes if index.name not in existing_indexes
+        )
+    return missing_indexes
+
+
+def check_schema(engine: Optional[Engine] = None, create_missing=None) -> None:
+    engine = engine or get_engine()
+    if create_missing is None:
+        create_missing = config.config.DB_CREATE_SCHEMA
+    existing_tables = set(sqlalchemy.inspect(engine).get_table_names())
+    missing_tables = [
+        table.name
+        for table in mapper_registry.metadata.sorted_tables
+        if table.name not in existing_tables
+    ]
+    if missing_tables:
+        if not create_missing:
+            raise SchemaMismatchError(f"Missing database tables: {missing_tables}")
+        logger.info(f"Creating missing database tables: {missing_tables}")
+        mapper_registry.metadata.create_all(engine)
+    legacy_uuid_columns = migrations.get_legacy_uuid_columns(engine)
+    if legacy_uuid_columns:
+        if not create_missing:
+            raise SchemaMismatchError(
+                f"Id columns need migrating to uuid: {legacy_uuid_columns}"
+            )
+        migrations.migrate_uuid_columns(engine)
+    integer_columns = migrations.get_integer_numeric_columns(engine)
+    if integer_columns:
+        column_names = [
+            f"{column.table.name}.{column.name}" for column in integer_columns
+        ]
+        if not create_missing:
+            raise SchemaMismatchError(
+                f"Columns need migrating to numeric: {column_names}"
+            )
+        logger.info(f"Migrating columns to numeric: {column_names}")
+        migrations.migrate_numeric_columns(engine, integer_columns)
+    missing_columns = migrations.get_missing_columns(engine)
+    if missing_columns:
+        column_names = [
+            f"{column.table.name}.{column.name}" for column in missing_columns
+        ]
+        if not create_missing:
+            raise SchemaMismatchError(f"Missing database columns: {column_names}")
+        logger.info(f"Adding missing database columns: {column_names}")
+        migrations.add_missing_columns(engine, missing_columns)
+    retired_indexes = migrations.get_retired_indexes(engine)
+    if retired_indexes:
+        if not create_missing:
+            raise SchemaMismatchError(f"Retired database indexes: {retired_indexes}")
+        logger.info(f"Dropping retired database indexes: {retired_indexes}")
+        migrations.drop_indexes(engine, retired_indexes)
+    # Tables created before an index was declared only pick it up here.
+    missing_indexes = get_missing_indexes(engine)
+    if not missing_indexes:
+        logger.debug("Database schema is up to date.")
+        return
+    index_names = [index.name for index in missing_indexes]
+    # Rows written before a unique index existed have to be merged by hand.
+    duplicates = migrations.get_unique_index_duplicates(engine, missing_indexes)
+    if duplicates:
+        raise SchemaMismatchError(
+            f"Duplicate values block unique indexes: {duplicates}"
+        )
+    if not create_missing:
+        raise SchemaMismatchError(f"Missing database indexes: {index_names}")
+    logger.info(f"Creating missing database indexes: {index_names}")
+    for index in missing_indexes:
+        index.create(engine)
+
+
+async def check_async_schema(
+    engine: Optional[AsyncEngine] = None, create_missing=None
+) -> None:
+    """check_schema() for the async engine. An SQLite memory database is
+    private to its engine, so the async one needs its own tables."""
+    engine = engine or get_async_engine()
+    async with engine.connect() as connection:
+        await connection.run_sync(
+            lambda sync_connection: check_schema(sync_connection.engine, create_missing)
+        )
+
+
+def get_async_uri(uri: str) -> str:
+    if uri.startswith("sqlite://"):
+        return uri.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if uri.startswith("postgresql://"):
+        return uri.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return uri
+
+
+def init_async_engine(uri: Optional[str] = None, **engine_options) -> AsyncEngine:
+    global _async_engine, _async_session_factory
+    uri = get_async_uri(uri or get_database_uri())
+    options = get_engine_options(uri)
+    options.update(engine_options)
+    logger.debug("Creating async database engine...")
+    _async_engine = create_async_engine(uri, **options)
+    # Objects are read after commit when building responses, so they must
+    # not be expired: an async session cannot lazily refresh them.
+    _async_session_factory = async_sessionmaker(
+        bind=_async_engine, expire_on_commit=False
     )
-    mapper_registry.metadata.create_all(engine)
-    logger.debug(f"Engine {engine} created.")
-    return engine
+    logger.debug(f"Async engine {_async_engine} created.")
+    return _async_engine
 
 
-def get_sqlite_session():
-    logger.debug(f"Using {config.BaseConfig().ENV_STATE} state")
-    logger.debug("Creating sqlite database sessionfactory...")
-    LocalSessionMaker = sqlalchemy.orm.sessionmaker(
-        # autocommit=False,
-        # autoflush=False,
-        bind=get_sqlite_engine(),
-    )
+def get_async_engine() -> AsyncEngine:
+    if _async_engine is None:
+        return init_async_engine()
+    return _async_engine
 
-    return LocalSessionMaker
 
+def get_async_session_factory() -> async_sessionmaker:
+    if _async_session_factory is None:
+        init_async_engine()
+    return _async_session_factory  # type: ignore
 
-def get_postgres_session_local():
-    logger.debug(f"Using {config.BaseConfig().ENV_STATE} state")
-    logger.debug("Creating postgres database sessionfactory...")
-    LocalSessionMaker = sqlalchemy.orm.sessionmaker(
-        # autocommit=False,
-        # autoflush=False,
-        bind=get_postgres_engine(),
-    )
 
-    return LocalSessionMaker
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        logger.debug(f"Disposing async engine {_async_engine}.")
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
@@ -0,0 +1,267 @@
+import logging
+import uuid
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+
+from critique_wheel.adapters.orm import critique_table, mapper_registry, work_table
+from critique_wheel.adapters.orm_domain_types import UUIDType
+from critique_wheel.critiques.value_objects import CritiqueStatus
+
+logger = logging.getLogger(__name__)
+
+
+def get_uuid_columns() -> list[tuple[str, str]]:
+    return [
+        (table.name, column.name)
+        for table in mapper_registry.metadata.sorted_tables
+        for column in table.columns
+        if isinstance(column.type, UUIDType)
+    ]
+
+
+def get_legacy_uuid_columns(engine: Engine) -> list[tuple[str, str]]:
+    """Id columns still holding the CHAR(36) text form of their uuids."""
+    inspector = sqlalchemy.inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    uuid_columns = [
+        (table, column)
+        for table, column in get_uuid_columns()
+        if table in existing_tables
+    ]
+    if engine.dialect.name == "postgresql":
+        column_types = {
+            (table, column["name"]): column["type"]
+            for table in {table for table, _ in uuid_columns}
+            for column in inspector.get_columns(table)
+        }
+        return [
+            (table, column)
+            for table, column in uuid_columns
+            if not isinstance(column_types[(table, column)], sqlalchemy.Uuid)
+        ]
+    legacy_columns = []
+    with engine.connect() as connection:
+        for table, column in uuid_columns:
+            stmt = sqlalchemy.text(
+                f'SELECT 1 FROM "{table}" WHERE typeof("{column}") = \'text\' LIMIT 1'
+            )
+            if connection.execute(stmt).first():
+                legacy_columns.append((table, column))
+    return legacy_columns
+
+
+def migrate_uuid_columns(engine: Engine) -> None:
+    legacy_columns = get_legacy_uuid_columns(engine)
+    if not legacy_columns:
+        return
+    logger.info(f"Migrating uuid columns: {legacy_columns}")
+    if engine.dialect.name == "postgresql":
+        _migrate_postgres_uuid_columns(engine, legacy_columns)
+    else:
+        _migrate_sqlite_uuid_columns(engine, legacy_columns)
+
+
+def _migrate_postgres_uuid_columns(
+    engine: Engine, legacy_columns: list[tuple[str, str]]
+) -> None:
+    # Foreign keys cannot span a CHAR and a uuid column, so they are dropped
+    # while the key columns change type and recreated afterwards.
+    inspector = sqlalchemy.inspect(engine)
+    tables = {table for table, _ in legacy_columns}
+    foreign_keys = [
+        (table, foreign_key)
+        for table in tables
+        for foreign_key in inspector.get_foreign_keys(table)
+    ]
+    with engine.begin() as connection:
+        for table, foreign_key in foreign_keys:
+            connection.execute(
+                sqlalchemy.text(
+                    f'ALTER TABLE "{table}" DROP CONSTRAINT "{foreign_key["name"]}"'
+                )
+            )
+        for table, column in legacy_columns:
+            connection.execute(
+                sqlalchemy.text(
+                    f'ALTER TABLE "{table}" ALTER COLUMN "{column}" '
+                    f'TYPE uuid USING "{column}"::uuid'
+                )
+            )
+        for table, foreign_key in foreign_keys:
+            columns = ", ".join(foreign_key["constrained_columns"])
+            referred_columns = ", ".join(foreign_key["referred_columns"])
+            connection.execute(
+                sqlalchemy.text(
+                    f'ALTER TABLE "{table}" ADD CONSTRAINT "{foreign_key["name"]}" '
+                    f"FOREIGN KEY ({columns}) "
+                    f'REFERENCES "{foreign_key["referred_table"]}" ({referred_columns})'
+                )
+            )
+
+
+def _migrate_sqlite_uuid_columns(
+    engine: Engine, legacy_columns: list[tuple[str, str]]
+) -> None:
+    with engine.begin() as connection:
+        for table, column in legacy_columns:
+            select_stmt = sqlalchemy.text(
+                f'SELECT DISTINCT "{column}" FROM "{table}" '
+                f"WHERE typeof(\"{column}\") = 'text'"
+            )
+            update_stmt = sqlalchemy.text(
+                f'UPDATE "{table}" SET "{column}" = :new WHERE "{column}" = :old'
+            )
+            params = [
+                {"old": old, "new": uuid.UUID(old).bytes}
+                for old in connection.execute(select_stmt).scalars()
+            ]
+            connection.execute(update_stmt, params)
+
+
+def get_integer_numeric_columns(engine: Engine) -> list[sqlalchemy.Column]:
+    """Numeric columns still declared INTEGER, which round fractions away.
+    SQLite keeps fractions in INTEGER columns, so only Postgres has any."""
+    if engine.dialect.name != "postgresql":
+        return []
+    inspector = sqlalchemy.inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    integer_columns = []
+    for table in mapper_registry.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        column_types = {
+            column["name"]: column["type"]
+            for column in inspector.get_columns(table.name)
+        }
+        integer_columns.extend(
+            column
+            for column in table.columns
+            if isinstance(column.type, sqlalchemy.Numeric)
+            and not isinstance(column.type, sqlalchemy.Float)
+            and isinstance(column_types.get(column.name), sqlalchemy.Integer)
+        )
+    return integer_columns
+
+
+def migrate_numeric_columns(engine: Engine, columns: list[sqlalchemy.Column]) -> None:
+    with engine.begin() as connection:
+        for column in columns:
+            connection.execute(
+                sqlalchemy.text(
+                    f'ALTER TABLE "{column.table.name}" ALTER COLUMN "{column.name}" '
+                    f"TYPE {column.type.compile(dialect=engine.dialect)}"
+                )
+            )
+
+
+# Indexes no longer declared by the mapping, by table. Databases created
+# before they were dropped still carry them and pay their write cost.
+RETIRED_INDEXES = {
+    # Superseded by ix_credits_member_id_date.
+    "credits": ["ix_credits_member_id"],
+}
+
+
+def get_retired_indexes(engine: Engine) -> list[str]:
+    inspector = sqlalchemy.inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    retired_indexes = []
+    for table, index_names in RETIRED_INDEXES.items():
+        if table not in existing_tables:
+            continue
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table)}
+        retired_indexes.extend(name for name in index_names if name in existing_indexes)
+    return retired_indexes
+
+
+def drop_indexes(engine: Engine, index_names: list[str]) -> None:
+    with engine.begin() as connection:
+        for name in index_names:
+            connection.execute(sqlalchemy.text(f'DROP INDEX "{name}"'))
+
+
+def get_unique_index_duplicates(
+    engine: Engine, indexes: list[sqlalchemy.Index]
+) -> dict[str, list]:
+    """Values repeated in the columns of each unique index, which would make
+    creating it fail."""
+    duplicates = {}
+    with engine.connect() as connection:
+        for index in indexes:
+            if not index.unique:
+                continue
+            columns = list(index.columns)
+            repeated = connection.execute(
+                sqlalchemy.select(*columns)
+                .group_by(*columns)
+                .having(sqlalchemy.func.count() > 1)
+            ).all()
+            if repeated:
+                duplicates[index.name] = [
+                    row[0] if len(columns) == 1 else tuple(row) for row in repeated
+                ]
+    return duplicates
+
+
+def get_missing_columns(engine: Engine) -> list[sqlalchemy.Column]:
+    inspector = sqlalchemy.inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    missing_columns = []
+    for table in mapper_registry.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_columns = {
+            column["name"] for column in inspector.get_columns(table.name)
+        }
+        missing_columns.extend(
+            column for column in table.columns if column.name not in existing_columns
+        )
+    return missing_columns
+
+
+def add_missing_columns(engine: Engine, columns: list[sqlalchemy.Column]) -> None:
+    # Only nullable columns or ones with a server default can be added to
+    # tables that already hold rows.
+    with engine.begin() as connection:
+        for column in columns:
+            definition = (
+                f'"{column.name}" {column.type.compile(dialect=engine.dialect)}'
+            )
+            if column.server_default is not None:
+                definition += f" DEFAULT {column.server_default.arg}"
+            if not column.nullable:
+                definition += " NOT NULL"
+            connection.execute(
+                sqlalchemy.text(
+                    f'ALTER TABLE "{column.table.name}" ADD COLUMN {definition}'
+                )
+            )
+    if any(column.table is work_table for column in columns):
+        backfill_critique_counts(engine)
+
+
+def backfill_critique_counts(engine: Engine) -> None:
+    """Recount works.critique_count and active_critique_count from the
+    critiques table, for works created before the counters existed."""
+    logger.info("Backfilling work critique counts.")
+    critiques = critique_table.c
+    total = (
+        sqlalchemy.select(sqlalchemy.func.count())
+        .where(critiques.work_id == work_table.c.id)
+        .scalar_subquery()
+    )
+    active = (
+        sqlalchemy.select(sqlalchemy.func.count())
+        .where(
+            critiques.work_id == work_table.c.id,
+            critiques.status == CritiqueStatus.ACTIVE,
+        )
+        .scalar_subquery()
+    )
+    with engine.begin() as connection:
+        connection.execute(
+            sqlalchemy.update(work_table).values(
+                critique_count=total, active_critique_count=active
+            )
+        )
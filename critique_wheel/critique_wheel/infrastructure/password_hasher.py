@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from critique_wheel import config
+from critique_wheel.members.models.password_policy import (
+    PasswordHashingPolicy,
+    get_password_policy,
+)
+
+logger = logging.getLogger(__name__)
+
+# One hasher (and therefore one worker pool) per process, see get_password_hasher().
+_password_hasher: Optional["PasswordHasher"] = None
+
+
+class PasswordHasherBusyError(Exception):
+    pass
+
+
+class PasswordHasher:
+    """Runs bcrypt on a bounded worker pool so hashing does not block the event
+    loop. Once max_workers are busy and max_queue calls are waiting, further
+    calls fail fast with PasswordHasherBusyError."""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue: int = 32,
+        executor: str = "thread",
+        policy: Optional[PasswordHashingPolicy] = None,
+    ):
+        self.policy = policy or get_password_policy()
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=max_workers)
+            if executor == "process"
+            else ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="password-hasher"
+            )
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise PasswordHasherBusyError("Password hasher is saturated")
+            self._pending += 1
+
+    def _release(self, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+            self._total_seconds += elapsed
+            self._max_seconds = max(self._max_seconds, elapsed)
+
+    async def _run(self, function, *args):
+        self._acquire()
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, function, *args)
+        finally:
+            self._release(started)
+
+    # The policy is a frozen dataclass, so its bound methods pickle into a
+    # process pool.
+    async def hash(self, password: str) -> str:
+        return await self._run(self.policy.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self.policy.verify, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self.policy.needs_rehash(hashed_password)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "in_flight": min(self._pending, self.max_workers),
+                "queue_depth": max(self._pending - self.max_workers, 0),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "average_latency_ms": round(
+                    self._total_seconds / self._completed * 1000, 2
+                )
+                if self._completed
+                else 0.0,
+                "max_latency_ms": round(self._max_seconds * 1000, 2),
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+def get_password_hasher() -> PasswordHasher:
+    global _password_hasher
+    if _password_hasher is None:
+        logger.debug("Creating password hasher.")
+        _password_hasher = PasswordHasher(
+            max_workers=config.config.PASSWORD_HASH_WORKERS,
+            max_queue=config.config.PASSWORD_HASH_QUEUE_SIZE,
+            executor=config.config.PASSWORD_HASH_EXECUTOR,
+        )
+    return _password_hasher
+
+
+def shutdown_password_hasher() -> None:
+    global _password_hasher
+    if _password_hasher is not None:
+        logger.debug("Shutting down password hasher.")
+        _password_hasher.shutdown()
+    _password_hasher = None
@@ -0,0 +1,381 @@
+import abc
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+from critique_wheel import config
+from critique_wheel.infrastructure.cache import get_shared_client
+
+logger = logging.getLogger(__name__)
+
+# One login throttle per process, see get_login_throttle().
+_login_throttle: Optional["LoginThrottle"] = None
+
+
+class AbstractWindowCounter(abc.ABC):
+    """Counts events per key over a sliding window, approximated from two
+    fixed windows: the current one plus the previous one weighted by how much
+    of it the sliding window still covers. That is two integers per key
+    whatever the event rate."""
+
+    def __init__(self, window: float, clock: Callable[[], float] = time.time):
+        self.window = window
+        self._clock = clock
+
+    def _position(self) -> Tuple[int, float]:
+        index, offset = divmod(self._clock(), self.window)
+        return int(index), offset
+
+    @abc.abstractmethod
+    def _counts(self, key: str, index: int) -> Tuple[int, int]:
+        """(previous, current) fixed window counts."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _increment(self, key: str, index: int) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def reset(self, key: str) -> None:
+        raise NotImplementedError
+
+    def count(self, key: str) -> float:
+        index, offset = self._position()
+        previous, current = self._counts(key, index)
+        return previous * (1 - offset / self.window) + current
+
+    def hit(self, key: str) -> None:
+        self._increment(key, self._position()[0])
+
+    def retry_after(self, key: str, limit: int) -> Optional[int]:
+        """Whole seconds until the key drops below limit, or None if it
+        already has."""
+        index, offset = self._position()
+        previous, current = self._counts(key, index)
+        if previous * (1 - offset / self.window) + current < limit:
+            return None
+        # The previous window's weight shrinks as the current one goes on.
+        # When the current count alone reaches the limit it only starts
+        # shrinking once it becomes the previous window.
+        if current >= limit:
+            clears_at = self.window + (1 - limit / current) * self.window
+        else:
+            clears_at = (1 - (limit - current) / previous) * self.window
+        # The count only drops below the limit just after clears_at.
+        return math.floor(clears_at - offset) + 1
+
+
+class LocalWindowCounter(AbstractWindowCounter):
+    """In-process counters for at most max_keys keys, least recently counted
+    first out."""
+
+    def __init__(
+        self,
+        window: float,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(window, clock)
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        # key -> [window index, previous count, current count]
+        self._windows: "OrderedDict[str, List[int]]" = OrderedDict()
+
+    def _rolled(self, key: str, index: int) -> Optional[List[int]]:
+        entry = self._windows.get(key)
+        if entry is None or entry[0] == index:
+            return entry
+        previous = entry[2] if entry[0] == index - 1 else 0
+        entry[:] = [index, previous, 0]
+        return entry
+
+    def _counts(self, key, index):
+        with self._lock:
+            entry = self._rolled(key, index)
+            return (entry[1], entry[2]) if entry else (0, 0)
+
+    def _increment(self, key, index):
+        with self._lock:
+            entry = self._rolled(key, index)
+            if entry is None:
+                entry = self._windows[key] = [index, 0, 0]
+            entry[2] += 1
+            self._windows.move_to_end(key)
+            while len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+
+    def reset(self, key):
+        with self._lock:
+            self._windows.pop(key, None)
+
+
+class SharedWindowCounter(AbstractWindowCounter):
+    """Counters kept in a Redis compatible store so every process sees the
+    same counts; each fixed window is one key expiring after two windows."""
+
+    def __init__(
+        self,
+        client,
+        window: float,
+        prefix: str = "throttle:",
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(window, clock)
+        self.client = client
+        self.prefix = prefix
+
+    def _name(self, key: str, index: int) -> str:
+        return f"{self.prefix}{key}:{index}"
+
+    def _counts(self, key, index):
+        previous = self.client.get(self._name(key, index - 1))
+        current = self.client.get(self._name(key, index))
+        return int(previous or 0), int(current or 0)
+
+    def _increment(self, key, index):
+        name = self._name(key, index)
+        self.client.incr(name)
+        self.client.expire(name, math.ceil(2 * self.window))
+
+    def reset(self, key):
+        index = self._position()[0]
+        self.client.delete(self._name(key, index - 1), self._name(key, index))
+
+
+class AbstractLockout(abc.ABC):
+    """Locks a key for lockout seconds once max_failures failures are counted
+    against it in a row, forgetting failures lockout seconds after the last
+    one. A success clears the key."""
+
+    def __init__(
+        self,
+        max_failures: int = 5,
+        lockout: float = 1800.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_failures = max_failures
+        self.lockout = lockout
+        self._clock = clock
+
+    @abc.abstractmethod
+    def locked_until(self, key: str) -> Optional[float]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def fail(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def lock(self, key: str, until: float) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def reset(self, key: str) -> None:
+        raise NotImplementedError
+
+    def retry_after(self, key: str) -> Optional[int]:
+        """Whole seconds until the key unlocks, or None if it is not locked."""
+        until = self.locked_until(key)
+        remaining = until - self._clock() if until is not None else 0
+        return math.ceil(remaining) if remaining > 0 else None
+
+
+class LocalLockout(AbstractLockout):
+    """In-process lockouts for at most max_keys keys, least recently failed
+    first out."""
+
+    def __init__(
+        self,
+        max_failures: int = 5,
+        lockout: float = 1800.0,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(max_failures, lockout, clock)
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        # key -> (failures, last failure, locked until)
+        self._entries: "OrderedDict[str, Tuple[int, float, float]]" = OrderedDict()
+
+    def locked_until(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[2] if entry and entry[2] > self._clock() else None
+
+    def fail(self, key):
+        now = self._clock()
+        with self._lock:
+            failures, last, until = self._entries.get(key, (0, now, 0.0))
+            failures = failures + 1 if now - last < self.lockout else 1
+            if failures >= self.max_failures:
+                failures, until = 0, now + self.lockout
+            self._entries[key] = (failures, now, until)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+
+    def lock(self, key, until):
+        with self._lock:
+            self._entries[key] = (0, self._clock(), until)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+
+    def reset(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SharedLockout(AbstractLockout):
+    """Lockouts kept in a Redis compatible store: a failure count and a lock
+    holding its deadline, both expiring with the lockout."""
+
+    def __init__(
+        self,
+        client,
+        max_failures: int = 5,
+        lockout: float = 1800.0,
+        prefix: str = "lockout:",
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(max_failures, lockout, clock)
+        self.client = client
+        self.prefix = prefix
+
+    def _failures_name(self, key: str) -> str:
+        return f"{self.prefix}failures:{key}"
+
+    def _locked_name(self, key: str) -> str:
+        return f"{self.prefix}locked:{key}"
+
+    def locked_until(self, key):
+        until = self.client.get(self._locked_name(key))
+        return float(until) if until is not None else None
+
+    def fail(self, key):
+        name = self._failures_name(key)
+        failures = self.client.incr(name)
+        self.client.expire(name, math.ceil(self.lockout))
+        if failures >= self.max_failures:
+            self.lock(key, self._clock() + self.lockout)
+
+    def lock(self, key, until):
+        # Redis only takes whole seconds for the expiry.
+        expires = math.ceil(until - self._clock())
+        if expires > 0:
+            self.client.set(self._locked_name(key), str(until).encode(), ex=expires)
+        self.client.delete(self._failures_name(key))
+
+    def reset(self, key):
+        self.client.delete(self._failures_name(key), self._locked_name(key))
+
+
+class LoginThrottle:
+    """Limits failed logins per account and login attempts per client
+    address over a sliding window, and locks accounts after repeated
+    failures, checked before any password is hashed.
+
+    Accounts are keyed on the email as typed, whether or not a member has it,
+    so known and unknown emails are throttled and locked alike."""
+
+    def __init__(
+        self,
+        accounts: AbstractWindowCounter,
+        addresses: AbstractWindowCounter,
+        account_limit: int = 10,
+        address_limit: int = 30,
+        lockout: Optional[AbstractLockout] = None,
+    ):
+        self.accounts = accounts
+        self.addresses = addresses
+        self.account_limit = account_limit
+        self.address_limit = address_limit
+        self.lockout = lockout
+
+    @staticmethod
+    def account_key(email: str) -> str:
+        return f"account:{email.strip().lower()}"
+
+    @staticmethod
+    def address_key(address: str) -> str:
+        return f"address:{address}"
+
+    def retry_after(self, email: str, address: Optional[str] = None) -> Optional[int]:
+        waits = [self.accounts.retry_after(self.account_key(email), self.account_limit)]
+        if self.lockout is not None:
+            waits.append(self.lockout.retry_after(self.account_key(email)))
+        if address:
+            waits.append(
+                self.addresses.retry_after(
+                    self.address_key(address), self.address_limit
+                )
+            )
+        waits = [wait for wait in waits if wait is not None]
+        return max(waits) if waits else None
+
+    def record_attempt(self, address: Optional[str] = None) -> None:
+        if address:
+            self.addresses.hit(self.address_key(address))
+
+    def record_failure(self, email: str) -> None:
+        self.accounts.hit(self.account_key(email))
+        if self.lockout is not None:
+            self.lockout.fail(self.account_key(email))
+
+    def lock(self, email: str, until: float) -> None:
+        if self.lockout is not None:
+            self.lockout.lock(self.account_key(email), until)
+
+    def record_success(self, email: str) -> None:
+        self.accounts.reset(self.account_key(email))
+        if self.lockout is not None:
+            self.lockout.reset(self.account_key(email))
+
+
+def build_login_throttle(
+    backend: str = "memory",
+    window: float = 300.0,
+    account_limit: int = 10,
+    address_limit: int = 30,
+    max_failures: int = 5,
+    lockout: float = 1800.0,
+    url: Optional[str] = None,
+) -> Optional[LoginThrottle]:
+    if backend == "none":
+        return None
+    if backend == "memory":
+        accounts: AbstractWindowCounter = LocalWindowCounter(window)
+        addresses: AbstractWindowCounter = LocalWindowCounter(window)
+        lockouts: AbstractLockout = LocalLockout(max_failures, lockout)
+    elif backend == "shared":
+        client = get_shared_client(url)
+        accounts = SharedWindowCounter(client, window, prefix="throttle:")
+        addresses = accounts
+        lockouts = SharedLockout(client, max_failures, lockout, prefix="lockout:")
+    else:
+        raise ValueError(f"Unsupported login throttle backend: {backend}")
+    return LoginThrottle(accounts, addresses, account_limit, address_limit, lockouts)
+
+
+def get_login_throttle() -> Optional[LoginThrottle]:
+    global _login_throttle
+    if _login_throttle is None and config.config.LOGIN_THROTTLE_BACKEND != "none":
+        logger.debug(f"Creating {config.config.LOGIN_THROTTLE_BACKEND} login throttle.")
+        _login_throttle = build_login_throttle(
+            backend=config.config.LOGIN_THROTTLE_BACKEND,
+            window=config.config.LOGIN_THROTTLE_WINDOW,
+            account_limit=config.config.LOGIN_THROTTLE_ACCOUNT_LIMIT,
+            address_limit=config.config.LOGIN_THROTTLE_ADDRESS_LIMIT,
+            max_failures=config.config.LOGIN_MAX_FAILED_ATTEMPTS,
+            lockout=config.config.LOGIN_LOCKOUT_SECONDS,
+            url=config.config.LOGIN_THROTTLE_URL,
+        )
+    return _login_throttle
+
+
+def reset_login_throttle() -> None:
+    global _login_throttle
+    _login_throttle = None
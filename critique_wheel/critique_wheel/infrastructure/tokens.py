@@ -0,0 +1,256 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from critique_wheel import config
+
+logger = logging.getLogger(__name__)
+
+ACCESS = "access"
+REFRESH = "refresh"
+
+# Digests of the supported HMAC signing algorithms.
+ALGORITHMS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384}
+
+# One signer and one revocation list per process, see get_token_signer() and
+# get_revocation_list().
+_token_signer: Optional["TokenSigner"] = None
+_revocation_list: Optional["RevocationList"] = None
+
+
+class TokenError(Exception):
+    pass
+
+
+class ExpiredTokenError(TokenError):
+    pass
+
+
+class RevokedTokenError(TokenError):
+    pass
+
+
+def b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def dump_json(value: dict) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    member_id: str
+    role: str
+    token_type: str
+    jti: str
+    issued_at: int
+    expires_at: int
+
+    def to_payload(self) -> dict:
+        return {
+            "sub": self.member_id,
+            "role": self.role,
+            "typ": self.token_type,
+            "jti": self.jti,
+            "iat": self.issued_at,
+            "exp": self.expires_at,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "TokenClaims":
+        return cls(
+            member_id=payload["sub"],
+            role=payload["role"],
+            token_type=payload["typ"],
+            jti=payload["jti"],
+            issued_at=int(payload["iat"]),
+            expires_at=int(payload["exp"]),
+        )
+
+
+class TokenSigner:
+    """Issues and checks HMAC signed JSON Web Tokens carrying the member id
+    and role, so a request is authorized without a database read or a
+    password hash."""
+
+    def __init__(
+        self,
+        secret: str,
+        algorithm: str = "HS256",
+        access_ttl: int = 900,
+        refresh_ttl: int = 1209600,
+        clock: Callable[[], float] = time.time,
+    ):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unsupported token signing algorithm: {algorithm}")
+        self._key = secret.encode()
+        self._digest = ALGORITHMS[algorithm]
+        # Every token this signer accepts carries exactly this header, which
+        # rules out "alg": "none" and algorithm substitution.
+        self._header = b64encode(dump_json({"alg": algorithm, "typ": "JWT"}))
+        self.access_ttl = access_ttl
+        self.refresh_ttl = refresh_ttl
+        self._clock = clock
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        return b64encode(hmac.new(self._key, signing_input, self._digest).digest())
+
+    def encode(self, claims: TokenClaims) -> str:
+        signing_input = self._header + b"." + b64encode(dump_json(claims.to_payload()))
+        return (signing_input + b"." + self._sign(signing_input)).decode("ascii")
+
+    def issue(self, member_id, role, token_type: str = ACCESS) -> str:
+        now = int(self._clock())
+        ttl = self.access_ttl if token_type == ACCESS else self.refresh_ttl
+        return self.encode(
+            TokenClaims(
+                member_id=str(member_id),
+                role=str(role),
+                token_type=token_type,
+                jti=uuid.uuid4().hex,
+                issued_at=now,
+                expires_at=now + ttl,
+            )
+        )
+
+    def issue_pair(self, member_id, role) -> dict:
+        return {
+            "access_token": self.issue(member_id, role, ACCESS),
+            "refresh_token": self.issue(member_id, role, REFRESH),
+            "token_type": "bearer",
+            "expires_in": self.access_ttl,
+        }
+
+    def decode(self, token: str, token_type: str = ACCESS) -> TokenClaims:
+        try:
+            header, payload, signature = token.encode("ascii").split(b".")
+        except (UnicodeEncodeError, ValueError) as e:
+            raise TokenError("Malformed token") from e
+        if header != self._header:
+            raise TokenError("Unsupported token header")
+        if not hmac.compare_digest(signature, self._sign(header + b"." + payload)):
+            raise TokenError("Invalid token signature")
+        try:
+            claims = TokenClaims.from_payload(json.loads(b64decode(payload)))
+        except (ValueError, KeyError, TypeError) as e:
+            raise TokenError("Malformed token payload") from e
+        if claims.token_type != token_type:
+            raise TokenError(f"Expected a {token_type} token")
+        if claims.expires_at <= self._clock():
+            raise ExpiredTokenError("Token has expired")
+        return claims
+
+
+class RevocationList:
+    """Revoked token ids that have not yet expired, held as 16 byte keys
+    mapped to their expiry. Tokens expire on their own, so entries only live
+    as long as the longest token lifetime. The database copy is merged in
+    every refresh_interval seconds so revocations made by other processes
+    take effect here too."""
+
+    def __init__(
+        self,
+        refresh_interval: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._revoked: Dict[bytes, int] = {}
+
+    @staticmethod
+    def _key(jti: str) -> bytes:
+        return uuid.UUID(hex=jti).bytes
+
+    def __contains__(self, jti: str) -> bool:
+        try:
+            return self._key(jti) in self._revoked
+        except ValueError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def revoke(self, jti: str, expires_at: int) -> None:
+        self._revoked[self._key(jti)] = expires_at
+
+    def merge(self, revocations: Iterable[Tuple[str, int]]) -> None:
+        # Revocations are never lifted, so merging cannot drop one made here
+        # after the database copy was read. Expired entries are pruned.
+        now = self._clock()
+        revoked = {
+            key: expires for key, expires in self._revoked.items() if expires > now
+        }
+        for jti, expires_at in revocations:
+            if expires_at > now:
+                revoked[self._key(jti)] = expires_at
+        self._revoked = revoked
+
+    async def refresh_forever(
+        self, load: Callable[[], Awaitable[Iterable[Tuple[str, int]]]]
+    ) -> None:
+        while True:
+            try:
+                self.merge(await load())
+                logger.debug(f"Refreshed revoked tokens, {len(self)} active")
+            except Exception as e:
+                logger.exception(f"Keeping current revoked tokens, refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+
+def authenticate(
+    token: str,
+    token_type: str = ACCESS,
+    signer: Optional[TokenSigner] = None,
+    revocations: Optional[RevocationList] = None,
+) -> TokenClaims:
+    # An empty RevocationList is falsy, hence the explicit None checks.
+    if signer is None:
+        signer = get_token_signer()
+    if revocations is None:
+        revocations = get_revocation_list()
+    claims = signer.decode(token, token_type)
+    if claims.jti in revocations:
+        raise RevokedTokenError("Token has been revoked")
+    return claims
+
+
+def get_token_signer() -> TokenSigner:
+    global _token_signer
+    if _token_signer is None:
+        secret = config.config.JWT_SECRET_KEY
+        if not secret:
+            # Tokens signed with a per process key die with the process and
+            # are refused by every other worker, which only suits dev and test.
+            if isinstance(config.config, config.ProdConfig):
+                raise TokenError("JWT_SECRET_KEY must be set in production.")
+            logger.warning("JWT_SECRET_KEY is not set, using a per process key.")
+            secret = secrets.token_urlsafe(32)
+        _token_signer = TokenSigner(
+            secret,
+            algorithm=config.config.JWT_ALGORITHM,
+            access_ttl=config.config.ACCESS_TOKEN_TTL,
+            refresh_ttl=config.config.REFRESH_TOKEN_TTL,
+        )
+    return _token_signer
+
+
+def get_revocation_list() -> RevocationList:
+    global _revocation_list
+    if _revocation_list is None:
+        _revocation_list = RevocationList(
+            refresh_interval=config.config.TOKEN_REVOCATION_REFRESH_INTERVAL
+        )
+    return _revocation_list
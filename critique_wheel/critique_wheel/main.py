@@ -1,26 +1,67 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager, suppress
 
 import fastapi
 import fastapi.exception_handlers
 from asgi_correlation_id import CorrelationIdMiddleware
+from fastapi.responses import JSONResponse
 
 from critique_wheel.adapters import orm
-from critique_wheel.entrypoints.routers import healthcheck, members, works
+from critique_wheel.entrypoints.routers import (
+    exports,
+    healthcheck,
+    members,
+    ratings,
+    works,
+)
+from critique_wheel.infrastructure import database, password_hasher, tokens
 from critique_wheel.logging_conf import configure_logging
+from critique_wheel.members.services import async_iam_service, unit_of_work
 
 configure_logging()
 logger = logging.getLogger(__name__)
 logger.debug(f"Starting {__name__}...")
 
 
+@asynccontextmanager
+async def lifespan(app: fastapi.FastAPI):
+    logger.debug("Checking database schema...")
+    database.check_schema(database.get_engine())
+    await database.check_async_schema()
+    # Refuse to start without a signing key rather than on the first login.
+    tokens.get_token_signer()
+    # Revocations made by other processes reach this one's list in the
+    # background, keeping token checks free of database reads.
+    revocation_refresher = asyncio.create_task(
+        tokens.get_revocation_list().refresh_forever(
+            lambda: async_iam_service.load_revoked_tokens(
+                unit_of_work.AsyncIAMUnitOfWork()
+            )
+        )
+    )
+    yield
+    revocation_refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await revocation_refresher
+    database.dispose_engine()
+    await database.dispose_async_engine()
+    password_hasher.shutdown_password_hasher()
+
+
 app = fastapi.FastAPI(
-    title="Critique Wheel API", version="0.0.1", openapi_url="/openapi.json"
+    title="Critique Wheel API",
+    version="0.0.1",
+    openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 app.add_middleware(CorrelationIdMiddleware)
 
 app.include_router(members.router)
 app.include_router(healthcheck.router)
 app.include_router(works.router)
+app.include_router(ratings.router)
+app.include_router(exports.router)
 
 
 @app.exception_handler(fastapi.HTTPException)
@@ -29,6 +70,16 @@ async def http_exception_handle_logging(request, exc):
     return await fastapi.exception_handlers.http_exception_handler(request, exc)
 
 
+@app.exception_handler(password_hasher.PasswordHasherBusyError)
+async def password_hasher_busy_handler(request, exc):
+    logger.warning(f"Password hasher saturated: {exc}")
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Service busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
 if __name__ == "__main__":
     orm.start_mappers()
     import uvicorn
@@ -2,14 +2,19 @@ import logging
 import os
 import random
 import string
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
+from typing import Optional
 
-import bcrypt
 import yaml
 from dotenv import load_dotenv
 
 from critique_wheel.members.models import exceptions
+from critique_wheel.members.models.password_policy import get_password_policy
+from critique_wheel.members.models.permissions import (
+    PermissionIndex,
+    compile_permissions,
+)
 from critique_wheel.members.value_objects import MemberId
 
 logger = logging.getLogger(__name__)
@@ -20,7 +25,6 @@ ROLES_FILE_PATH = os.getenv("ROLES_FILE_PATH")
 assert os.path.exists(ROLES_FILE_PATH), f"File not found at {ROLES_FILE_PATH}"  # type: ignore
 # Mock database to facilitate testing and building domain logic without a database
 mock_db = {}
-bcrypt.gensalt(rounds=4)  # Set the number of rounds for testing to 4
 
 
 class MemberStatus(str, Enum):
@@ -40,7 +44,7 @@ class Member:
     # low number of roles, the in-memory approach is efficient and offers fast permission checks.
     # The potential drawbacks are manageable and can be addressed as the application grows or requirements change.
     # This avoid the need to query the yaml file for every request.
-    ROLES_AND_PERMISSIONS = {}
+    ROLES_AND_PERMISSIONS: PermissionIndex = PermissionIndex({})
 
     def __init__(
         self,
@@ -64,13 +68,12 @@ class Member:
         self.last_login: datetime = datetime.now()
         self.last_updated_date: datetime = datetime.now()
         self.created_date: datetime = datetime.now()
+        self.failed_login_attempts: int = 0
+        self.account_locked_until: Optional[datetime] = None
 
     @staticmethod
     def hash_password(password: str) -> str:
-        bcrypt.gensalt(rounds=4)  # Set the number of rounds for testing to 4
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(password.encode(), salt)
-        return hashed_password.decode("utf-8")
+        return get_password_policy().hash(password)
 
     @classmethod
     def create(
@@ -82,9 +85,11 @@ class Member:
         status=MemberStatus.INACTIVE,
         works=None,
         critiques=None,
+        password_hash=None,
     ):
         cls.validate_password_strength(password)
-        hashed_password = cls.hash_password(password)
+        # Callers that hash off the request thread pass the result in.
+        hashed_password = password_hash or cls.hash_password(password)
         if not username or not email or not password:
             raise exceptions.MissingEntryError("Missing required fields")
         return cls(
@@ -106,15 +111,15 @@ class Member:
             "password": str(self.password),
             "member_type": str(self.member_type.value),
             "status": str(self.status.value),
-            "works": [str(work) for work in self.works],
-            "critiques": [str(critique) for critique in self.critiques],
+            "works": [str(work.id) for work in self.works],
+            "critiques": [str(critique.id) for critique in self.critiques],
             "last_login": self.last_login.isoformat(),
             "last_updated_date": self.last_updated_date.isoformat(),
             "created_date": self.created_date.isoformat(),
         }
 
     @classmethod
-    def register(cls, username, email, password, confirm_password):
+    def register(cls, username, email, password, confirm_password, password_hash=None):
         cls._validate_registration_parameters(
             username, email, password, confirm_password
         )
@@ -125,7 +130,7 @@ class Member:
             raise exceptions.WeakPasswordError(
                 "Password does not meet the policy requirements"
             )
-        member = cls.create(username, email, password)
+        member = cls.create(username, email, password, password_hash=password_hash)
         return member
 
     @staticmethod
@@ -164,14 +169,46 @@ class Member:
 
     def change_password(self, old_password, new_password):
         self.validate_password_strength(new_password)
-        stored_password = self.password.encode()
-        if not bcrypt.checkpw(old_password.encode(), stored_password):
+        if not self.verify_password(old_password):
             raise exceptions.IncorrectCredentialsError("Incorrect old password")
         self.password = self.hash_password(new_password)
 
     def verify_password(self, password):
-        stored_password = self.password.encode()
-        return bcrypt.checkpw(password.encode(), stored_password)
+        return get_password_policy().verify(password, self.password)
+
+    def needs_password_rehash(self) -> bool:
+        return get_password_policy().needs_rehash(self.password)
+
+    def locked_for(self, now: Optional[datetime] = None) -> Optional[timedelta]:
+        """Time left on the account lockout, or None if not locked."""
+        if self.account_locked_until is None:
+            return None
+        remaining = self.account_locked_until - (now or datetime.now())
+        return remaining if remaining > timedelta(0) else None
+
+    def record_failed_login(
+        self, max_attempts: int, lockout: timedelta, now: Optional[datetime] = None
+    ) -> bool:
+        """Count a failed login, locking the account once max_attempts is
+        reached. Returns True when this attempt locked it."""
+        self.failed_login_attempts += 1
+        if self.failed_login_attempts < max_attempts:
+            return False
+        self.account_locked_until = (now or datetime.now()) + lockout
+        self.failed_login_attempts = 0
+        logger.info(f"Member {self.id} locked until {self.account_locked_until}")
+        return True
+
+    def record_successful_login(self, now: Optional[datetime] = None) -> None:
+        self.last_login = now or datetime.now()
+        self.failed_login_attempts = 0
+        self.account_locked_until = None
+
+    def unlock_member(self, member) -> None:
+        if self.member_type != MemberRole.ADMIN:
+            raise exceptions.AdminOnlyError("Only admins can unlock members.")
+        member.failed_login_attempts = 0
+        member.account_locked_until = None
 
     def deactivate_self(self):
         self.status = MemberStatus.INACTIVE
@@ -208,14 +245,22 @@ class Member:
     def load_roles_from_yaml(cls, file_path=ROLES_FILE_PATH):
         with open(file_path, "r") as file:
             data = yaml.safe_load(file)
-        cls.ROLES_AND_PERMISSIONS = data.get("roles", {})
+        cls.ROLES_AND_PERMISSIONS = compile_permissions(
+            data.get("roles", {}), role_type=MemberRole
+        )
+
+    @classmethod
+    def get_permission_index(cls) -> PermissionIndex:
+        if not cls.ROLES_AND_PERMISSIONS:
+            cls.load_roles_from_yaml()
+        return cls.ROLES_AND_PERMISSIONS
+
+    @classmethod
+    def role_has_permission(cls, role, action, resource) -> bool:
+        return cls.ROLES_AND_PERMISSIONS.allows(role, action, resource)
 
     def has_permission(self, action, resource):
-        role_permissions = self.ROLES_AND_PERMISSIONS.get(self.member_type, [])
-        for permission in role_permissions:
-            if permission["action"] == action and permission["resource"] == resource:
-                return True
-        return False
+        return self.role_has_permission(self.member_type, action, resource)
 
     def list_works(self) -> list:
         return self.works
@@ -1,5 +1,5 @@
 import abc
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from critique_wheel.members.models.IAM import Member
 from critique_wheel.members.value_objects import MemberId
@@ -22,6 +22,36 @@ class AbstractMemberRepository(abc.ABC):
     def get_member_by_username(self, username: str) -> Optional[Member]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def taken_identifiers(self, email: str, username: str) -> Set[str]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def list(self) -> List[Member]:
         raise NotImplementedError
+
+
+class AbstractAsyncMemberRepository(abc.ABC):
+    @abc.abstractmethod
+    def add(self, member: Member) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_member_by_id(self, member_id: MemberId) -> Optional[Member]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_member_by_email(self, email: str) -> Optional[Member]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_member_by_username(self, username: str) -> Optional[Member]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def taken_identifiers(self, email: str, username: str) -> Set[str]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def list(self) -> List[Member]:
+        raise NotImplementedError
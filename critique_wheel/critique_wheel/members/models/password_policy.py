@@ -0,0 +1,59 @@
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import bcrypt
+
+from critique_wheel.config import config
+
+logger = logging.getLogger(__name__)
+
+# Hash prefix written by each supported algorithm, e.g. "$2b$12$...".
+ALGORITHM_PREFIXES = {"bcrypt": "2b"}
+
+
+@dataclass(frozen=True)
+class PasswordHashingPolicy:
+    algorithm: str = "bcrypt"
+    rounds: int = 12
+
+    def __post_init__(self):
+        if self.algorithm not in ALGORITHM_PREFIXES:
+            raise ValueError(
+                f"Unsupported password hashing algorithm: {self.algorithm}"
+            )
+
+    @classmethod
+    def from_config(cls):
+        return cls(
+            algorithm=config.PASSWORD_HASH_ALGORITHM,
+            rounds=config.PASSWORD_HASH_ROUNDS,
+        )
+
+    def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        return bcrypt.hashpw(password.encode(), salt).decode("utf-8")
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return bcrypt.checkpw(password.encode(), hashed_password.encode())
+
+    @staticmethod
+    def identify(hashed_password: str) -> Optional[Tuple[str, int]]:
+        # "$2b$12$<salt+hash>" -> ("2b", 12)
+        try:
+            _, prefix, rounds, _ = hashed_password.split("$", 3)
+            return prefix, int(rounds)
+        except ValueError:
+            return None
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        version = self.identify(hashed_password)
+        return version != (ALGORITHM_PREFIXES[self.algorithm], self.rounds)
+
+
+@lru_cache()
+def get_password_policy() -> PasswordHashingPolicy:
+    policy = PasswordHashingPolicy.from_config()
+    logger.debug(f"Using password hashing policy {policy}")
+    return policy
@@ -0,0 +1,77 @@
+import logging
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Hashable, Iterator, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+WILDCARD = "*"
+
+Permission = Tuple[str, str]
+
+
+class PermissionIndex(Mapping):
+    """Role -> frozenset of (action, resource) grants, with inherited grants
+    already folded in, so a check is at most four set lookups."""
+
+    def __init__(self, grants: Dict[Hashable, FrozenSet[Permission]]):
+        self._grants = MappingProxyType(dict(grants))
+
+    def __getitem__(self, role) -> FrozenSet[Permission]:
+        return self._grants[role]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._grants)
+
+    def __len__(self) -> int:
+        return len(self._grants)
+
+    def allows(self, role, action: str, resource: str) -> bool:
+        grants = self._grants.get(role)
+        if not grants:
+            return False
+        return (
+            (action, resource) in grants
+            or (action, WILDCARD) in grants
+            or (WILDCARD, resource) in grants
+            or (WILDCARD, WILDCARD) in grants
+        )
+
+
+def compile_permissions(
+    roles: dict, role_type: Callable[[str], Hashable] = str
+) -> PermissionIndex:
+    """Compile the `roles` section of rbac.yaml. A role is either a list of
+    {action, resource} entries or a mapping with `permissions` and
+    `inherits` (a list of role names)."""
+    declared: Dict[str, Set[Permission]] = {}
+    parents: Dict[str, list] = {}
+    for name, definition in (roles or {}).items():
+        if isinstance(definition, dict):
+            entries = definition.get("permissions") or []
+            parents[name] = list(definition.get("inherits") or [])
+        else:
+            entries = definition or []
+            parents[name] = []
+        declared[name] = {(entry["action"], entry["resource"]) for entry in entries}
+
+    resolved: Dict[str, FrozenSet[Permission]] = {}
+
+    def resolve(name: str, path: Tuple[str, ...]) -> FrozenSet[Permission]:
+        if name in resolved:
+            return resolved[name]
+        if name in path:
+            raise ValueError(
+                f"Circular role inheritance: {' -> '.join(path + (name,))}"
+            )
+        if name not in declared:
+            raise ValueError(f"Unknown role in inheritance: {name}")
+        grants = set(declared[name])
+        for parent in parents[name]:
+            grants |= resolve(parent, path + (name,))
+        resolved[name] = frozenset(grants)
+        return resolved[name]
+
+    index = PermissionIndex({role_type(name): resolve(name, ()) for name in declared})
+    logger.debug(f"Compiled permissions for roles {list(declared)}")
+    return index
@@ -0,0 +1,17 @@
+import abc
+from typing import List, Tuple
+
+
+class AbstractAsyncRevokedTokenRepository(abc.ABC):
+    @abc.abstractmethod
+    async def revoke(self, jti: str, expires_at: int) -> bool:
+        """Record the token as revoked; False if it already was."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def list_active(self, now: int) -> List[Tuple[str, int]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete_expired(self, now: int) -> int:
+        raise NotImplementedError
@@ -0,0 +1,227 @@
+import logging
+import time
+from typing import List, Optional, Tuple
+
+from critique_wheel.infrastructure import tokens
+from critique_wheel.infrastructure.password_hasher import (
+    PasswordHasher,
+    get_password_hasher,
+)
+from critique_wheel.infrastructure.throttle import LoginThrottle, get_login_throttle
+from critique_wheel.members.models import IAM as model
+from critique_wheel.members.models import exceptions as domain_exceptions
+from critique_wheel.members.services import exceptions as service_exceptions
+from critique_wheel.members.services import unit_of_work as uow
+from critique_wheel.members.services.iam_service import (
+    check_identifiers_free,
+    check_login_allowed,
+    check_member_unlocked,
+    record_failed_login,
+)
+from critique_wheel.members.value_objects import MemberId
+
+logger = logging.getLogger(__name__)
+
+
+async def add_member(
+    uow: uow.AbstractAsyncUnitOfWork,
+    username: str,
+    email: str,
+    password: str,
+    hasher: Optional[PasswordHasher] = None,
+) -> dict:
+    hasher = hasher or get_password_hasher()
+    async with uow:
+        try:
+            model.Member.validate_password_strength(password)
+            new_member = model.Member.create(
+                username=username,
+                email=email,
+                password=password,
+                password_hash=await hasher.hash(password),
+            )
+            uow.members.add(new_member)
+            await uow.commit()
+            return new_member.to_dict()
+        except domain_exceptions.InvalidEntryError as e:
+            logger.exception(f"An error occurred while creating a member: {e}")
+            raise service_exceptions.InvalidEntryError("Invalid entry")
+        except domain_exceptions.IncorrectCredentialsError as e:
+            logger.exception(f"An error occurred while creating a member: {e}")
+            raise service_exceptions.InvalidCredentialsError("Invalid entry") from e
+
+
+async def login_member(
+    uow: uow.AbstractAsyncUnitOfWork,
+    email: str,
+    password: str,
+    hasher: Optional[PasswordHasher] = None,
+    client_address: Optional[str] = None,
+    throttle: Optional[LoginThrottle] = None,
+) -> dict:
+    # See iam_service.login_member().
+    hasher = hasher or get_password_hasher()
+    throttle = throttle or get_login_throttle()
+    check_login_allowed(throttle, email, client_address)
+    async with uow:
+        try:
+            member = await uow.members.get_member_by_email(email)
+        except domain_exceptions.BaseIAMDomainError as e:
+            logger.exception(f"An error occurred while logging in: {e}")
+            raise service_exceptions.InvalidCredentialsError("Invalid credentials")
+        check_member_unlocked(member, throttle, email)
+        if throttle is not None:
+            throttle.record_attempt(client_address)
+        if member and await hasher.verify(password, member.password):
+            if hasher.needs_rehash(member.password):
+                member.password = await hasher.hash(password)
+            member.record_successful_login()
+            if throttle is not None:
+                throttle.record_success(email)
+            await uow.commit()
+            return member.to_dict()
+        record_failed_login(member, throttle, email)
+        if member:
+            await uow.commit()
+        raise service_exceptions.InvalidCredentialsError("Invalid credentials")
+
+
+async def issue_tokens(
+    uow: uow.AbstractAsyncUnitOfWork,
+    email: str,
+    password: str,
+    hasher: Optional[PasswordHasher] = None,
+    signer: Optional[tokens.TokenSigner] = None,
+    client_address: Optional[str] = None,
+) -> dict:
+    """Log the member in and return an access token and a refresh token
+    carrying their id and role."""
+    member = await login_member(
+        uow, email, password, hasher, client_address=client_address
+    )
+    signer = signer or tokens.get_token_signer()
+    return signer.issue_pair(member["id"], member["member_type"])
+
+
+def check_token(
+    token: str,
+    token_type: str,
+    signer: Optional[tokens.TokenSigner] = None,
+    revocations: Optional[tokens.RevocationList] = None,
+) -> tokens.TokenClaims:
+    try:
+        return tokens.authenticate(token, token_type, signer, revocations)
+    except tokens.TokenError as e:
+        logger.info(f"Rejected {token_type} token: {e}")
+        raise service_exceptions.InvalidTokenError(str(e)) from e
+
+
+async def refresh_tokens(
+    uow: uow.AbstractAsyncUnitOfWork,
+    refresh_token: str,
+    signer: Optional[tokens.TokenSigner] = None,
+    revocations: Optional[tokens.RevocationList] = None,
+) -> dict:
+    """Exchange a refresh token for a new pair. Each refresh token is used
+    once, so a stolen one stops working when its owner next refreshes, and
+    the role is read again so role changes reach the new tokens."""
+    signer = signer or tokens.get_token_signer()
+    if revocations is None:
+        revocations = tokens.get_revocation_list()
+    claims = check_token(refresh_token, tokens.REFRESH, signer, revocations)
+    async with uow:
+        member = await uow.members.get_member_by_id(
+            MemberId.from_string(claims.member_id), loading={}
+        )
+        if not member:
+            raise service_exceptions.InvalidTokenError("Member no longer exists")
+        role = member.member_type.value
+        if not await uow.revoked_tokens.revoke(claims.jti, claims.expires_at):
+            raise service_exceptions.InvalidTokenError("Token has been revoked")
+        await uow.commit()
+    revocations.revoke(claims.jti, claims.expires_at)
+    return signer.issue_pair(claims.member_id, role)
+
+
+async def revoke_tokens(
+    uow: uow.AbstractAsyncUnitOfWork,
+    access_token: str,
+    refresh_token: Optional[str] = None,
+    signer: Optional[tokens.TokenSigner] = None,
+    revocations: Optional[tokens.RevocationList] = None,
+) -> None:
+    if revocations is None:
+        revocations = tokens.get_revocation_list()
+    revoked = [check_token(access_token, tokens.ACCESS, signer, revocations)]
+    if refresh_token:
+        claims = check_token(refresh_token, tokens.REFRESH, signer, revocations)
+        if claims.member_id != revoked[0].member_id:
+            raise service_exceptions.InvalidTokenError(
+                "Tokens belong to different members"
+            )
+        revoked.append(claims)
+    async with uow:
+        for claims in revoked:
+            await uow.revoked_tokens.revoke(claims.jti, claims.expires_at)
+        await uow.commit()
+    for claims in revoked:
+        revocations.revoke(claims.jti, claims.expires_at)
+
+
+async def load_revoked_tokens(
+    uow: uow.AbstractAsyncUnitOfWork, now: Optional[int] = None
+) -> List[Tuple[str, int]]:
+    # Feeds RevocationList.refresh_forever(), pruning expired rows as it goes.
+    now = int(time.time()) if now is None else now
+    async with uow:
+        deleted = await uow.revoked_tokens.delete_expired(now)
+        revoked = await uow.revoked_tokens.list_active(now)
+        await uow.commit()
+    logger.debug(f"Loaded {len(revoked)} revoked tokens, pruned {deleted}")
+    return revoked
+
+
+async def register_member(
+    uow: uow.AbstractAsyncUnitOfWork,
+    username: str,
+    email: str,
+    password: str,
+    confirm_password: str,
+    hasher: Optional[PasswordHasher] = None,
+) -> dict:
+    if not password:
+        raise service_exceptions.MissingPasswordError("Missing password")
+    if password != confirm_password:
+        raise service_exceptions.PasswordMismatchError(
+            "Password and confirm password do not match"
+        )
+    if not username:
+        raise service_exceptions.MissingUsernameError("Missing username")
+    if not email:
+        raise service_exceptions.MissingEmailError("Missing email")
+    hasher = hasher or get_password_hasher()
+    async with uow:
+        check_identifiers_free(await uow.members.taken_identifiers(email, username))
+        try:
+            model.Member.validate_password_strength(password)
+            new_member = model.Member.register(
+                username,
+                email,
+                password,
+                confirm_password,
+                password_hash=await hasher.hash(password),
+            )
+            uow.members.add(new_member)
+            # The unique indexes on email and username reject duplicates here.
+            try:
+                await uow.commit()
+            except service_exceptions.DuplicateEntryError as e:
+                logger.exception(f"An error occurred while registering a member: {e}")
+                raise
+            except service_exceptions.DuplicateUsernameError as e:
+                logger.exception(f"An error occurred while registering a member: {e}")
+                raise
+            return new_member.to_dict()
+        except domain_exceptions.BaseIAMDomainError as e:
+            logger.exception(f"An error occurred while registering a member: {e}")
+            raise service_exceptions.InvalidEntryError(f"Invalid entry: {e}")
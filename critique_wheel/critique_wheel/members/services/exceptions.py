@@ -6,6 +6,20 @@ class InvalidCredentialsError(MemberServiceError):
     pass
 
 
+class InvalidTokenError(MemberServiceError):
+    pass
+
+
+class LoginThrottledError(MemberServiceError):
+    """Too many login attempts for the account or client address, or the
+    account is locked; retry_after is in seconds. Both cases read the same so
+    responses do not reveal which accounts exist."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class MemberNotFoundError(MemberServiceError):
     pass
 
@@ -1,9 +1,14 @@
 import logging
+import math
+import time
+from datetime import timedelta
+from typing import Optional
 
+from critique_wheel.config import config
 from critique_wheel.critiques.models.critique import Critique
+from critique_wheel.infrastructure.throttle import LoginThrottle, get_login_throttle
 from critique_wheel.members.models import IAM as model
 from critique_wheel.members.models import exceptions as domain_exceptions
-from critique_wheel.members.models.iam_repository import AbstractMemberRepository
 from critique_wheel.members.services import exceptions as service_exceptions
 from critique_wheel.members.services import unit_of_work as uow
 from critique_wheel.members.value_objects import MemberId
@@ -25,9 +30,6 @@ def add_member(
                 email=email,
                 password=password,
             )
-            if uow.members.get_member_by_email(email):
-                raise service_exceptions.DuplicateEntryError("Email already in use")
-                logger.exception("An error occurred while creating a member.")
             uow.members.add(new_member)
             uow.commit()
             return new_member.to_dict()
@@ -39,22 +41,100 @@ def add_member(
             raise service_exceptions.InvalidCredentialsError("Invalid entry") from e
 
 
+def check_login_allowed(
+    throttle: Optional[LoginThrottle], email: str, client_address: Optional[str]
+) -> None:
+    if throttle is None:
+        return
+    retry_after = throttle.retry_after(email, client_address)
+    if retry_after:
+        logger.warning(f"Throttled login for {email} from {client_address}")
+        raise service_exceptions.LoginThrottledError(
+            "Too many login attempts", retry_after
+        )
+
+
+def lock_email(
+    member: model.Member, throttle: Optional[LoginThrottle], email: str
+) -> None:
+    # The member's lock may come from another process, or from before a
+    # restart. Copying it onto the email makes later attempts answer like
+    # any locked email, member or not.
+    locked_for = member.locked_for()
+    if throttle is not None and locked_for:
+        throttle.lock(email, time.time() + locked_for.total_seconds())
+
+
+def check_member_unlocked(
+    member: Optional[model.Member],
+    throttle: Optional[LoginThrottle] = None,
+    email: Optional[str] = None,
+) -> None:
+    locked_for = member.locked_for() if member else None
+    if locked_for:
+        lock_email(member, throttle, email)
+        raise service_exceptions.LoginThrottledError(
+            "Too many login attempts", math.ceil(locked_for.total_seconds())
+        )
+
+
+def record_failed_login(
+    member: Optional[model.Member], throttle: Optional[LoginThrottle], email: str
+) -> None:
+    if throttle is not None:
+        throttle.record_failure(email)
+    if member and member.record_failed_login(
+        config.LOGIN_MAX_FAILED_ATTEMPTS,
+        timedelta(seconds=config.LOGIN_LOCKOUT_SECONDS),
+    ):
+        lock_email(member, throttle, email)
+
+
 def login_member(
     uow: uow.AbstractUnitOfWork,
     email: str,
     password: str,
+    client_address: Optional[str] = None,
+    throttle: Optional[LoginThrottle] = None,
 ) -> dict:
+    """Verify the member's password. Throttled clients and locked accounts
+    are turned away before the member is read or any password hashed.
+
+    The throttle locks the email itself, so an unknown email answers exactly
+    like a member's. The lock persisted on the member holds across processes
+    and restarts, and is copied onto the email when found."""
+    throttle = throttle or get_login_throttle()
+    check_login_allowed(throttle, email, client_address)
     with uow:
         try:
             member = uow.members.get_member_by_email(email)
         except domain_exceptions.BaseIAMDomainError as e:
             logger.exception(f"An error occurred while logging in: {e}")
             raise service_exceptions.InvalidCredentialsError("Invalid credentials")
+        check_member_unlocked(member, throttle, email)
+        if throttle is not None:
+            throttle.record_attempt(client_address)
         if member and member.verify_password(password):
+            if member.needs_password_rehash():
+                member.password = member.hash_password(password)
+            member.record_successful_login()
+            if throttle is not None:
+                throttle.record_success(email)
             uow.commit()
             return member.to_dict()
-        else:
-            raise service_exceptions.InvalidCredentialsError("Invalid credentials")
+        record_failed_login(member, throttle, email)
+        if member:
+            uow.commit()
+        raise service_exceptions.InvalidCredentialsError("Invalid credentials")
+
+
+def check_identifiers_free(taken: set[str]) -> None:
+    # An indexed lookup turns duplicates away before the password is hashed;
+    # the unique indexes still reject any registered since the lookup.
+    if "email" in taken:
+        raise service_exceptions.DuplicateEntryError("Email already in use")
+    if "username" in taken:
+        raise service_exceptions.DuplicateUsernameError("Username already in use")
 
 
 def register_member(
@@ -75,35 +155,27 @@ def register_member(
     if not email:
         raise service_exceptions.MissingEmailError("Missing email")
     with uow:
+        check_identifiers_free(uow.members.taken_identifiers(email, username))
         try:
+            new_member = model.Member.register(
+                username, email, password, confirm_password
+            )
+            uow.members.add(new_member)
+            # The unique indexes on email and username reject duplicates here.
             try:
-                check_for_unique_parameters(username, email, uow.members)
+                uow.commit()
             except service_exceptions.DuplicateEntryError as e:
                 logger.exception(f"An error occurred while registering a member: {e}")
                 raise
             except service_exceptions.DuplicateUsernameError as e:
                 logger.exception(f"An error occurred while registering a member: {e}")
                 raise
-            new_member = model.Member.register(
-                username, email, password, confirm_password
-            )
-            uow.members.add(new_member)
-            uow.commit()
             return new_member.to_dict()
         except domain_exceptions.BaseIAMDomainError as e:
             logger.exception(f"An error occurred while registering a member: {e}")
             raise service_exceptions.InvalidEntryError(f"Invalid entry: {e}")
 
 
-def check_for_unique_parameters(
-    username: str, email: str, repo: AbstractMemberRepository
-) -> None:
-    if repo.get_member_by_email(email):
-        raise service_exceptions.DuplicateEntryError("Email already in use")
-    if repo.get_member_by_username(username):
-        raise service_exceptions.DuplicateUsernameError("Username already in use")
-
-
 def list_members(uow: uow.AbstractUnitOfWork) -> list[model.Member]:
     with uow:
         return uow.members.list()
@@ -3,8 +3,29 @@ from __future__ import annotations
 
 import abc
 
+from sqlalchemy.exc import IntegrityError
+
+from critique_wheel.adapters.sqlalchemy import async_iam_repository as async_repository
 from critique_wheel.adapters.sqlalchemy import iam_repository as repository
+from critique_wheel.adapters.sqlalchemy.async_token_repository import (
+    AsyncRevokedTokenRepository,
+)
 from critique_wheel.infrastructure import database
+from critique_wheel.members.models.token_repository import (
+    AbstractAsyncRevokedTokenRepository,
+)
+from critique_wheel.members.services import exceptions as service_exceptions
+
+
+def raise_for_duplicate_member(error: IntegrityError) -> None:
+    # Postgres reports the violated index name, SQLite the table and column.
+    message = str(error.orig)
+    if "ix_members_username" in message or "members.username" in message:
+        raise service_exceptions.DuplicateUsernameError(
+            "Username already in use"
+        ) from error
+    if "ix_members_email" in message or "members.email" in message:
+        raise service_exceptions.DuplicateEntryError("Email already in use") from error
 
 
 class AbstractUnitOfWork(abc.ABC):
@@ -26,8 +47,8 @@ class AbstractUnitOfWork(abc.ABC):
 
 
 class IAMUnitOfWork(AbstractUnitOfWork):
-    def __init__(self, session_factory=database.get_postgres_session_local()):
-        self.session_factory = session_factory
+    def __init__(self, session_factory=None):
+        self.session_factory = session_factory or database.get_session_factory()
 
     def __enter__(self):
         self.session = self.session_factory()  # type: Session
@@ -39,7 +60,57 @@ class IAMUnitOfWork(AbstractUnitOfWork):
         self.session.close()
 
     def commit(self):
-        self.session.commit()
+        try:
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise_for_duplicate_member(e)
+            raise
 
     def rollback(self):
         self.session.rollback()
+
+
+class AbstractAsyncUnitOfWork(abc.ABC):
+    members: async_repository.AbstractAsyncMemberRepository
+    revoked_tokens: AbstractAsyncRevokedTokenRepository
+
+    async def __aenter__(self) -> AbstractAsyncUnitOfWork:
+        return self
+
+    async def __aexit__(self, *args):
+        await self.rollback()
+
+    @abc.abstractmethod
+    async def commit(self):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def rollback(self):
+        raise NotImplementedError
+
+
+class AsyncIAMUnitOfWork(AbstractAsyncUnitOfWork):
+    def __init__(self, session_factory=None):
+        self.session_factory = session_factory or database.get_async_session_factory()
+
+    async def __aenter__(self):
+        self.session = self.session_factory()  # type: AsyncSession
+        self.members = async_repository.AsyncMemberRepository(self.session)
+        self.revoked_tokens = AsyncRevokedTokenRepository(self.session)
+        return await super().__aenter__()
+
+    async def __aexit__(self, *args):
+        await super().__aexit__(*args)
+        await self.session.close()
+
+    async def commit(self):
+        try:
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise_for_duplicate_member(e)
+            raise
+
+    async def rollback(self):
+        await self.session.rollback()
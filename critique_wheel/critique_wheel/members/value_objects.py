@@ -3,6 +3,7 @@ import uuid
 from dataclasses import dataclass, field
 
 from critique_wheel.members.models import exceptions
+from critique_wheel.text import exceeds_word_count
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +63,7 @@ class Bio:
     def __post_init__(self):
         word_limit = 200
         char_limit = 1200
-        if len(self.value.split()) > word_limit or len(self.value) > char_limit:
+        if len(self.value) > char_limit or exceeds_word_count(self.value, word_limit):
             raise exceptions.InvalidEntryError(
                 f"Bio must be under {word_limit} words and {char_limit} characters."
             )
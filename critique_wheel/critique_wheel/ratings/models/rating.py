@@ -1,5 +1,6 @@
 from datetime import datetime
 from enum import Enum
+from typing import Optional
 
 from critique_wheel.ratings.value_objects import RatingComment, RatingId, RatingScore
 
@@ -71,6 +72,14 @@ class Rating:
     def member_id(self, value):
         raise AttributeError("Can't set attribute")
 
+    @property
+    def counted_score(self) -> Optional[int]:
+        # What this rating contributes to its critique's and critic's
+        # aggregates; only active ratings count.
+        if self.status != RatingStatus.ACTIVE or self.score is None:
+            return None
+        return int(self.score)
+
     def update_score(self, updated_score: int) -> None:
         self.score = updated_score
         self.last_updated_date = datetime.now()
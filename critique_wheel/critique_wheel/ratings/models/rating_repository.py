@@ -2,7 +2,11 @@ import abc
 from typing import List, Optional
 
 from critique_wheel.ratings.models.rating import Rating
-from critique_wheel.ratings.value_objects import RatingId
+from critique_wheel.ratings.value_objects import RatingAggregate, RatingId
+
+
+class RatedCritiqueNotFoundError(Exception):
+    pass
 
 
 class AbstractRatingRepository(abc.ABC):
@@ -17,3 +21,31 @@ class AbstractRatingRepository(abc.ABC):
     @abc.abstractmethod
     def list(self) -> List[Rating]:
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def apply_score_change(
+        self, critique_id, before: Optional[int], after: Optional[int]
+    ) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_critique_aggregate(self, critique_id) -> RatingAggregate:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_critic_aggregate(self, member_id) -> RatingAggregate:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def rebuild_aggregates(self) -> dict:
+        raise NotImplementedError
+
+
+class AbstractAsyncRatingRepository(abc.ABC):
+    @abc.abstractmethod
+    async def get_critique_aggregate(self, critique_id) -> RatingAggregate:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_critic_aggregate(self, member_id) -> RatingAggregate:
+        raise NotImplementedError
@@ -0,0 +1,94 @@
+import logging
+import uuid
+from typing import Callable
+
+from critique_wheel.critiques.value_objects import CritiqueId
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.ratings.models.rating import Rating
+from critique_wheel.ratings.services import unit_of_work as uow
+from critique_wheel.ratings.value_objects import RatingComment, RatingId
+
+logger = logging.getLogger(__name__)
+
+
+class BaseRatingServiceError(Exception):
+    pass
+
+
+class RatingNotFoundError(BaseRatingServiceError):
+    pass
+
+
+def add_rating(
+    uow: uow.AbstractUnitOfWork,
+    critique_id: str,
+    member_id: str,
+    score: int,
+    comment: str = "",
+) -> dict:
+    with uow:
+        rating = Rating.create(
+            score=score,
+            comment=RatingComment(comment),
+            critique_id=CritiqueId(uuid.UUID(critique_id)),
+            member_id=MemberId.from_string(member_id),
+        )
+        # The repository folds the score into the aggregates as it adds.
+        uow.ratings.add(rating)
+        uow.commit()
+        logger.debug(f"Added rating {rating.id} to critique {critique_id}")
+        return {"id": str(rating.id), "critique_id": critique_id, "score": score}
+
+
+def _change_rating(
+    uow: uow.AbstractUnitOfWork, rating_id: str, change: Callable[[Rating], None]
+) -> None:
+    with uow:
+        rating = uow.ratings.get(RatingId(uuid.UUID(rating_id)))
+        if rating is None:
+            raise RatingNotFoundError(f"Rating {rating_id} not found")
+        before = rating.counted_score
+        change(rating)
+        uow.ratings.apply_score_change(rating.critique_id, before, rating.counted_score)
+        uow.commit()
+
+
+def update_score(uow: uow.AbstractUnitOfWork, rating_id: str, score: int) -> None:
+    if score not in range(1, 6):
+        raise ValueError("Score must be between 1 and 5.")
+    _change_rating(uow, rating_id, lambda rating: rating.update_score(score))
+
+
+def archive_rating(uow: uow.AbstractUnitOfWork, rating_id: str) -> None:
+    _change_rating(uow, rating_id, Rating.archive)
+
+
+def restore_rating(uow: uow.AbstractUnitOfWork, rating_id: str) -> None:
+    _change_rating(uow, rating_id, Rating.restore)
+
+
+def rebuild_aggregates(uow: uow.AbstractUnitOfWork) -> dict:
+    with uow:
+        counts = uow.ratings.rebuild_aggregates()
+        uow.commit()
+        return counts
+
+
+async def get_critique_aggregate(
+    uow: uow.AbstractAsyncUnitOfWork, critique_id: str
+) -> dict:
+    async with uow:
+        aggregate = await uow.ratings.get_critique_aggregate(
+            CritiqueId(uuid.UUID(critique_id))
+        )
+        return {"critique_id": critique_id, **aggregate.to_dict()}
+
+
+async def get_critic_aggregate(
+    uow: uow.AbstractAsyncUnitOfWork, member_id: str
+) -> dict:
+    async with uow:
+        aggregate = await uow.ratings.get_critic_aggregate(
+            MemberId.from_string(member_id)
+        )
+        return {"member_id": member_id, **aggregate.to_dict()}
@@ -0,0 +1,88 @@
+# pylint: disable=attribute-defined-outside-init
+from __future__ import annotations
+
+import abc
+
+from critique_wheel.adapters.sqlalchemy import async_rating_repository
+from critique_wheel.adapters.sqlalchemy import rating_repository as repository
+from critique_wheel.infrastructure import database as db_config
+from critique_wheel.ratings.models.rating_repository import (
+    AbstractAsyncRatingRepository,
+    AbstractRatingRepository,
+)
+
+
+class AbstractUnitOfWork(abc.ABC):
+    ratings: AbstractRatingRepository
+
+    def __enter__(self) -> AbstractUnitOfWork:
+        return self
+
+    def __exit__(self, *args):
+        self.rollback()
+
+    @abc.abstractmethod
+    def commit(self):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def rollback(self):
+        raise NotImplementedError
+
+
+class RatingUnitOfWork(AbstractUnitOfWork):
+    def __init__(self, session_factory=None):
+        self.session_factory = session_factory or db_config.get_session_factory()
+
+    def __enter__(self):
+        self.session = self.session_factory()  # type: Session
+        self.ratings = repository.RatingRepository(self.session)
+        return super().__enter__()
+
+    def __exit__(self, *args):
+        super().__exit__(*args)
+        self.session.close()
+
+    def commit(self):
+        self.session.commit()
+
+    def rollback(self):
+        self.session.rollback()
+
+
+class AbstractAsyncUnitOfWork(abc.ABC):
+    ratings: AbstractAsyncRatingRepository
+
+    async def __aenter__(self) -> AbstractAsyncUnitOfWork:
+        return self
+
+    async def __aexit__(self, *args):
+        await self.rollback()
+
+    @abc.abstractmethod
+    async def commit(self):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def rollback(self):
+        raise NotImplementedError
+
+
+class AsyncRatingUnitOfWork(AbstractAsyncUnitOfWork):
+    def __init__(self, session_factory=None):
+        self.session_factory = session_factory or db_config.get_async_session_factory()
+
+    async def __aenter__(self):
+        self.session = self.session_factory()  # type: AsyncSession
+        self.ratings = async_rating_repository.AsyncRatingRepository(self.session)
+        return await super().__aenter__()
+
+    async def __aexit__(self, *args):
+        await super().__aexit__(*args)
+        await self.session.close()
+
+    async def commit(self):
+        await self.session.commit()
+
+    async def rollback(self):
+        await self.session.rollback()
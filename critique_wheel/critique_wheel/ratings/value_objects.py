@@ -1,5 +1,8 @@
 import uuid
 from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from critique_wheel.text import Text
 
 
 @dataclass(frozen=True)
@@ -29,7 +32,7 @@ class RatingScore:
 
 
 @dataclass(frozen=True)
-class RatingComment:
+class RatingComment(Text):
     value: str
 
     def __str__(self):
@@ -38,5 +41,53 @@ class RatingComment:
     def __len__(self):
         return len(self.value)
 
-    def word_count(self):
-        return len(self.value.split())
+
+SCORES = range(1, 6)
+
+
+@dataclass(frozen=True)
+class RatingAggregate:
+    """Running count, total and per score histogram of active ratings. Also
+    used for the (possibly negative) change a single rating makes to one."""
+
+    rating_count: int = 0
+    score_total: int = 0
+    histogram: Tuple[int, ...] = (0,) * len(SCORES)
+
+    @classmethod
+    def change(cls, before: Optional[int], after: Optional[int]) -> "RatingAggregate":
+        # before/after are the counted score (None when not counted) either
+        # side of an update.
+        histogram = [0] * len(SCORES)
+        if before is not None:
+            histogram[before - 1] -= 1
+        if after is not None:
+            histogram[after - 1] += 1
+        return cls(
+            rating_count=(after is not None) - (before is not None),
+            score_total=(after or 0) - (before or 0),
+            histogram=tuple(histogram),
+        )
+
+    @classmethod
+    def from_row(cls, row) -> "RatingAggregate":
+        rating_count, score_total, *histogram = row
+        return cls(rating_count, score_total, tuple(histogram))
+
+    def __bool__(self) -> bool:
+        return bool(self.rating_count or self.score_total or any(self.histogram))
+
+    @property
+    def average(self) -> Optional[float]:
+        if not self.rating_count:
+            return None
+        return round(self.score_total / self.rating_count, 2)
+
+    def to_dict(self) -> dict:
+        return {
+            "rating_count": self.rating_count,
+            "average": self.average,
+            "histogram": {
+                str(score): count for score, count in zip(SCORES, self.histogram)
+            },
+        }
@@ -0,0 +1,46 @@
+"""Word counting shared by the text value objects."""
+
+import re
+from itertools import islice
+
+from critique_wheel.hydration import trusted
+
+WORD = re.compile(r"\S+")
+
+
+def count_words(text: str) -> int:
+    # str.split() runs in C and beats any regex scan for a full count; the
+    # text value objects cache the result so it is only paid once.
+    return len(text.split())
+
+
+def exceeds_word_count(text: str, limit: int) -> bool:
+    """Whether text has more than limit words, scanning no further than the
+    word after the limit."""
+    if limit < 0:
+        return True
+    # Each word but the last needs a separator, so short texts need no scan.
+    if (len(text) + 1) // 2 <= limit:
+        return False
+    return next(islice(WORD.finditer(text), limit, None), None) is not None
+
+
+class Text:
+    """Mixin for frozen dataclasses holding `value: str`: a cached word count
+    and a constructor for values read back from the database."""
+
+    value: str
+
+    def word_count(self) -> int:
+        try:
+            return self.__dict__["_word_count"]
+        except KeyError:
+            count = count_words(self.value)
+            # Not a dataclass field, so equality and repr are unchanged.
+            object.__setattr__(self, "_word_count", count)
+            return count
+
+    @classmethod
+    def trusted(cls, value: str):
+        # Rows were validated when written; skip __post_init__ on hydration.
+        return trusted(cls, value=value)
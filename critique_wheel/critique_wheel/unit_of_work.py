@@ -0,0 +1,113 @@
+# pylint: disable=attribute-defined-outside-init
+from __future__ import annotations
+
+import abc
+from typing import Callable
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from critique_wheel.adapters.sqlalchemy import (
+    credit_repository,
+    critique_repository,
+    iam_repository,
+    rating_repository,
+    work_repository,
+)
+from critique_wheel.credits.models.credit_repository import AbstractCreditRepository
+from critique_wheel.critiques.models.critique_repository import (
+    AbstractCritiqueRepository,
+)
+from critique_wheel.critiques.services.unit_of_work import raise_for_duplicate_critique
+from critique_wheel.infrastructure import database as db_config
+from critique_wheel.infrastructure.cache import AbstractCache, NullCache, get_work_cache
+from critique_wheel.members.models.iam_repository import AbstractMemberRepository
+from critique_wheel.members.services.unit_of_work import raise_for_duplicate_member
+from critique_wheel.ratings.models.rating_repository import AbstractRatingRepository
+from critique_wheel.works.models.work_repository import AbstractWorkRepository
+
+
+class AbstractUnitOfWork(abc.ABC):
+    """Every context's repositories over one transaction, for business
+    operations that span contexts, e.g. a critique and the credit it earns."""
+
+    members: AbstractMemberRepository
+    works: AbstractWorkRepository
+    critiques: AbstractCritiqueRepository
+    ratings: AbstractRatingRepository
+    credits: AbstractCreditRepository
+    cache: AbstractCache = NullCache()
+
+    def __enter__(self) -> AbstractUnitOfWork:
+        return self
+
+    def __exit__(self, *args):
+        self.rollback()
+
+    @abc.abstractmethod
+    def commit(self):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def rollback(self):
+        raise NotImplementedError
+
+
+class LazyRepository:
+    """A repository built on first use within a unit of work, over its
+    session, so an operation only pays for the repositories it touches."""
+
+    def __init__(self, factory: Callable[[Session], object]):
+        self.factory = factory
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, uow, owner=None):
+        if uow is None:
+            return self
+        built = uow.repositories.get(self.name)
+        if built is None:
+            built = uow.repositories[self.name] = self.factory(uow.session)
+        return built
+
+
+class UnitOfWork(AbstractUnitOfWork):
+    members = LazyRepository(iam_repository.MemberRepository)
+    works = LazyRepository(work_repository.WorkRepository)
+    critiques = LazyRepository(critique_repository.CritiqueRepository)
+    ratings = LazyRepository(rating_repository.RatingRepository)
+    credits = LazyRepository(credit_repository.CreditRepository)
+
+    def __init__(self, session_factory=None, cache=None):
+        self.session_factory = session_factory or db_config.get_session_factory()
+        self.cache = cache or get_work_cache()
+        self.repositories: dict = {}
+
+    def __enter__(self):
+        self.session = self.session_factory()  # type: Session
+        self.repositories = {}
+        # Critiques change their work's cached entry even when the works
+        # repository is never used.
+        work_repository.track_touched_works(self.session)
+        return super().__enter__()
+
+    def __exit__(self, *args):
+        super().__exit__(*args)
+        self.session.close()
+        self.repositories = {}
+
+    def commit(self):
+        try:
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            work_repository.pop_touched_work_ids(self.session)
+            raise_for_duplicate_member(e)
+            raise_for_duplicate_critique(e)
+            raise
+        self.cache.invalidate(work_repository.pop_touched_work_ids(self.session))
+
+    def rollback(self):
+        self.session.rollback()
+        work_repository.pop_touched_work_ids(self.session)
@@ -16,3 +16,11 @@ class WorkNotAvailableForCritiqueError(BaseWorkDomainError):
 
 class CritiqueDuplicateError(BaseWorkDomainError):
     pass
+
+
+class CritiqueLimitReachedError(BaseWorkDomainError):
+    pass
+
+
+class InvalidCursorError(BaseWorkDomainError):
+    pass
@@ -1,7 +1,11 @@
 import logging
 from datetime import datetime
+from typing import Optional
 
+from critique_wheel.config import config
+from critique_wheel.critiques.value_objects import CritiqueStatus
 from critique_wheel.members.value_objects import MemberId
+from critique_wheel.text import count_words
 from critique_wheel.works.exceptions import exceptions
 from critique_wheel.works.value_objects import (
     Content,
@@ -10,6 +14,7 @@ from critique_wheel.works.value_objects import (
     WorkGenre,
     WorkId,
     WorkStatus,
+    WorkSummary,
 )
 
 logger = logging.getLogger(__name__)
@@ -34,12 +39,23 @@ class Work:
         self.age_restriction: WorkAgeRestriction = age_restriction
         self.genre: WorkGenre = genre
         self.status: WorkStatus = status
-        self.word_count: int = len(str(content).split())
+        self.word_count: int = (
+            content.word_count()
+            if isinstance(content, Content)
+            else count_words(str(content))
+        )
         self.submission_date: datetime = datetime.now()
         self.last_update_date: datetime = datetime.now()
         self.archive_date = None
         self.member_id: MemberId = member_id
         self.critiques = critiques or []
+        self.critique_count: int = len(self.critiques)
+        self.active_critique_count: int = sum(
+            1
+            for critique in self.critiques
+            if getattr(critique, "status", None) == CritiqueStatus.ACTIVE
+        )
+        self.critique_limit: Optional[int] = None
 
     @classmethod
     def create(
@@ -67,12 +83,11 @@ class Work:
             work_id=work_id,
         )
 
-    def to_dict(self) -> dict:
+    def to_dict(self, include_content: bool = True) -> dict:
         logger.debug("Converting work to dict.")
-        return {
+        work = {
             "id": str(self.id),
             "title": str(self.title),
-            "content": str(self.content),
             "age_restriction": self.age_restriction.value,
             "genre": self.genre.value,
             "status": self.status.value,
@@ -83,8 +98,23 @@ class Work:
             if self.archive_date
             else None,
             "member_id": str(self.member_id),
-            "critiques": [str(critique) for critique in self.critiques],
+            "critiques": [str(critique.id) for critique in self.critiques],
         }
+        if include_content:
+            work["content"] = str(self.content)
+        return work
+
+    def to_summary(self) -> WorkSummary:
+        return WorkSummary(
+            id=self.id,
+            title=self.title,
+            member_id=self.member_id,
+            age_restriction=self.age_restriction,
+            genre=self.genre,
+            status=self.status,
+            word_count=self.word_count,
+            submission_date=self.submission_date,
+        )
 
     def approve(self) -> None:
         logger.debug("Approving work.")
@@ -119,18 +149,39 @@ class Work:
             return True
         return False
 
+    def has_critique_capacity(self) -> bool:
+        # An admin limit of 0 closes the work, as it does in the database.
+        limit = (
+            config.CRITIQUE_LIMIT_PER_WORK
+            if self.critique_limit is None
+            else self.critique_limit
+        )
+        return self.critique_count < limit
+
+    def record_critique(self, status: CritiqueStatus) -> None:
+        # Counter upkeep for a new critique, without touching self.critiques.
+        if not self.is_available_for_critique():
+            raise exceptions.WorkNotAvailableForCritiqueError(
+                "This work is not available for critique",
+            )
+        if not self.has_critique_capacity():
+            raise exceptions.CritiqueLimitReachedError(
+                "This work has reached its critique limit"
+            )
+        self.critique_count += 1
+        if status == CritiqueStatus.ACTIVE:
+            self.active_critique_count += 1
+        self.last_update_date = datetime.now()
+
     def list_critiques(self) -> list:
         logger.debug("Listing critiques.")
         return self.critiques
 
     def add_critique(self, critique) -> None:
         logger.debug("Adding critique.")
-        if not self.is_available_for_critique():
-            raise exceptions.WorkNotAvailableForCritiqueError(
-                "This work is not available for critique",
-            )
-        if critique not in self.critiques:
-            self.critiques.append(critique)
-            self.last_update_date = datetime.now()
-        else:
-            raise exceptions.CritiqueDuplicateError("Critique already exists")
+        # One critique per member and work is kept by the unique (work_id,
+        # member_id) index when the critique is flushed, so the loaded
+        # critiques are not scanned here. Persisted critiques go through
+        # critique_service.add_critique.
+        self.record_critique(getattr(critique, "status", None))
+        self.critiques.append(critique)
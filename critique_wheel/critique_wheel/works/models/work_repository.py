@@ -1,9 +1,16 @@
 import abc
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 
 from critique_wheel.members.value_objects import MemberId
 from critique_wheel.works.models.work import Work
-from critique_wheel.works.value_objects import WorkId
+from critique_wheel.works.value_objects import (
+    Content,
+    CritiqueCapacity,
+    WorkCursor,
+    WorkFilters,
+    WorkId,
+    WorkSummary,
+)
 
 
 class AbstractWorkRepository(abc.ABC):
@@ -15,6 +22,10 @@ class AbstractWorkRepository(abc.ABC):
     def get_work_by_id(self, work_id: WorkId) -> Optional[Work]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def get_work_content(self, work_id: WorkId) -> Optional[Content]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_work_by_member_id(self, member_id: MemberId) -> Optional[Work]:
         raise NotImplementedError
@@ -22,3 +33,77 @@ class AbstractWorkRepository(abc.ABC):
     @abc.abstractmethod
     def list(self) -> List[Work]:
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def list_summaries(
+        self,
+        filters: WorkFilters,
+        limit: int,
+        after: Optional[WorkCursor] = None,
+    ) -> List[WorkSummary]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def existing_ids(self, work_ids: Iterable[WorkId]) -> Set[WorkId]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def add_many(self, works: List[Work]) -> List[Tuple[int, str]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def reserve_critique_slot(
+        self, work_id: WorkId, limit: int, active: bool = True
+    ) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_critique_capacity(self, work_id: WorkId) -> Optional[CritiqueCapacity]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_word_count(self, work_id: WorkId) -> Optional[int]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def adjust_active_critique_count(self, work_id: WorkId, delta: int) -> None:
+        raise NotImplementedError
+
+
+class AbstractAsyncWorkRepository(abc.ABC):
+    @abc.abstractmethod
+    def add(self, work: Work) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_work_by_id(self, work_id: WorkId) -> Optional[Work]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_work_content(self, work_id: WorkId) -> Optional[Content]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_work_by_member_id(self, member_id: MemberId) -> Optional[Work]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def list(self) -> List[Work]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def list_summaries(
+        self,
+        filters: WorkFilters,
+        limit: int,
+        after: Optional[WorkCursor] = None,
+    ) -> List[WorkSummary]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def existing_ids(self, work_ids: Iterable[WorkId]) -> Set[WorkId]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def add_many(self, works: List[Work]) -> List[Tuple[int, str]]:
+        raise NotImplementedError
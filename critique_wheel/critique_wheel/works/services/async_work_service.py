@@ -0,0 +1,142 @@
+import logging
+from typing import Iterable, Optional, Set
+
+from critique_wheel.works import value_objects
+from critique_wheel.works.exceptions import exceptions
+from critique_wheel.works.services import unit_of_work as uow
+from critique_wheel.works.services.work_service import (
+    DuplicateWorkError,
+    InvalidDataError,
+    build_import_batch,
+    build_page,
+    build_work,
+    build_work_filters,
+    decode_cursor,
+    drop_existing_works,
+    from_cached_work,
+    get_page_size,
+    iter_import_batches,
+    record_inserted_works,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def add_work(
+    uow: uow.AbstractAsyncUnitOfWork,
+    title: str,
+    content: str,
+    member_id: str,
+    genre: str,
+    age_restriction: str,
+    work_id: Optional[str] = "",
+    critiques: Optional[list] = None,
+) -> dict:
+    async with uow:
+        try:
+            new_work = build_work(
+                title=title,
+                content=content,
+                member_id=member_id,
+                genre=genre,
+                age_restriction=age_restriction,
+                work_id=work_id,
+                critiques=critiques,
+            )
+            if await uow.works.get_work_by_id(new_work.id):
+                raise DuplicateWorkError(
+                    f"Work with id {str(new_work.id)} already exists"
+                )
+            uow.works.add(new_work)
+            await uow.commit()
+            return new_work.to_dict()
+        except DuplicateWorkError as e:
+            logger.exception("Work with that id already exists")
+            raise DuplicateWorkError(f"Work with that id already exists: {e}") from e
+        except exceptions.MissingEntryError as e:
+            logger.exception(f"Invalid data encountered: {e}")
+            raise InvalidDataError(f"Invalid data encountered: {e}") from e
+        except Exception as e:
+            logger.exception(f"Invalid data encountered: {e}")
+            raise InvalidDataError(f"Invalid data encountered: {e}") from e
+
+
+async def import_works(
+    uow: uow.AbstractAsyncUnitOfWork,
+    rows: Iterable[dict],
+    batch_size: Optional[int] = None,
+) -> dict:
+    # See work_service.import_works().
+    report = value_objects.WorkImportReport()
+    seen_ids: Set[value_objects.WorkId] = set()
+    async with uow:
+        for batch in iter_import_batches(rows, batch_size):
+            works = build_import_batch(batch, seen_ids, report)
+            if works:
+                existing_ids = await uow.works.existing_ids(
+                    work.id for _, work in works
+                )
+                works = drop_existing_works(works, existing_ids, report)
+            failed = await uow.works.add_many([work for _, work in works])
+            await uow.commit()
+            record_inserted_works(works, failed, report)
+    report.errors.sort(key=lambda error: error.row)
+    return report.to_dict()
+
+
+async def list_works(
+    uow: uow.AbstractAsyncUnitOfWork,
+) -> list[dict]:
+    async with uow:
+        works = [work.to_dict(include_content=False) for work in await uow.works.list()]
+    return works
+
+
+async def get_work_by_id(
+    work_id: str, uow: uow.AbstractAsyncUnitOfWork, include_content: bool = True
+) -> Optional[dict]:
+    # See work_service.get_work_by_id().
+    key = value_objects.WorkId.from_string(uuid_string=work_id)
+    result = from_cached_work(uow.cache.get(key), include_content)
+    if result is not None:
+        return result
+    generation = uow.cache.generation(key)
+    async with uow:
+        work = await uow.works.get_work_by_id(key)
+        if not work:
+            return None
+        # Serialise before leaving the unit of work: the rollback on exit
+        # expires the loaded attributes. Content is deferred and an async
+        # session cannot lazy load it, so it is fetched on its own.
+        result = work.to_dict(include_content=False)
+        if include_content:
+            result["content"] = str(await uow.works.get_work_content(work.id))
+    uow.cache.set(key, result, generation)
+    return from_cached_work(result, include_content)
+
+
+async def get_work_content(
+    work_id: str, uow: uow.AbstractAsyncUnitOfWork
+) -> Optional[str]:
+    async with uow:
+        content = await uow.works.get_work_content(
+            value_objects.WorkId.from_string(uuid_string=work_id)
+        )
+    return str(content) if content else None
+
+
+async def list_work_summaries(
+    uow: uow.AbstractAsyncUnitOfWork,
+    genre: Optional[str] = None,
+    age_restriction: Optional[str] = None,
+    status: Optional[str] = None,
+    member_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+) -> dict:
+    filters = build_work_filters(genre, age_restriction, status, member_id)
+    after = decode_cursor(cursor)
+    page_size = get_page_size(page_size)
+    async with uow:
+        summaries = await uow.works.list_summaries(filters, page_size + 1, after)
+    return build_page(summaries, page_size)
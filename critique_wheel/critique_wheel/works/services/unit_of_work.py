@@ -3,12 +3,17 @@ from __future__ import annotations
 
 import abc
 
+from critique_wheel.adapters.sqlalchemy import async_work_repository as async_repository
 from critique_wheel.adapters.sqlalchemy import work_repository as repository
 from critique_wheel.infrastructure import database as db_config
+from critique_wheel.infrastructure.cache import AbstractCache, NullCache, get_work_cache
 
 
 class AbstractUnitOfWork(abc.ABC):
     works: repository.AbstractWorkRepository
+    # Read-through cache of work lookups; commits invalidate the works they
+    # wrote.
+    cache: AbstractCache = NullCache()
 
     def __enter__(self) -> AbstractUnitOfWork:
         return self
@@ -26,8 +31,9 @@ class AbstractUnitOfWork(abc.ABC):
 
 
 class WorkUnitOfWork(AbstractUnitOfWork):
-    def __init__(self, session_factory=db_config.get_postgres_session_local()):
-        self.session_factory = session_factory
+    def __init__(self, session_factory=None, cache=None):
+        self.session_factory = session_factory or db_config.get_session_factory()
+        self.cache = cache or get_work_cache()
 
     def __enter__(self):
         self.session = self.session_factory()  # type: Session
@@ -40,6 +46,52 @@ class WorkUnitOfWork(AbstractUnitOfWork):
 
     def commit(self):
         self.session.commit()
+        self.cache.invalidate(repository.pop_touched_work_ids(self.session))
 
     def rollback(self):
         self.session.rollback()
+        repository.pop_touched_work_ids(self.session)
+
+
+class AbstractAsyncUnitOfWork(abc.ABC):
+    works: async_repository.AbstractAsyncWorkRepository
+    cache: AbstractCache = NullCache()
+
+    async def __aenter__(self) -> AbstractAsyncUnitOfWork:
+        return self
+
+    async def __aexit__(self, *args):
+        await self.rollback()
+
+    @abc.abstractmethod
+    async def commit(self):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def rollback(self):
+        raise NotImplementedError
+
+
+class AsyncWorkUnitOfWork(AbstractAsyncUnitOfWork):
+    def __init__(self, session_factory=None, cache=None):
+        self.session_factory = session_factory or db_config.get_async_session_factory()
+        self.cache = cache or get_work_cache()
+
+    async def __aenter__(self):
+        self.session = self.session_factory()  # type: AsyncSession
+        self.works = async_repository.AsyncWorkRepository(self.session)
+        return await super().__aenter__()
+
+    async def __aexit__(self, *args):
+        await super().__aexit__(*args)
+        await self.session.close()
+
+    async def commit(self):
+        await self.session.commit()
+        self.cache.invalidate(
+            repository.pop_touched_work_ids(self.session.sync_session)
+        )
+
+    async def rollback(self):
+        await self.session.rollback()
+        repository.pop_touched_work_ids(self.session.sync_session)
@@ -1,7 +1,10 @@
 import logging
-from typing import Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
+from critique_wheel.config import config
 from critique_wheel.members import value_objects as member_value_objects
+from critique_wheel.members.models import exceptions as member_exceptions
 from critique_wheel.works import value_objects
 from critique_wheel.works.exceptions import exceptions
 from critique_wheel.works.models import work as model
@@ -26,6 +29,74 @@ class InvalidDataError(BaseWorkServiceError):
     pass
 
 
+def build_work(
+    title: str,
+    content: str,
+    member_id: str,
+    genre: str,
+    age_restriction: str,
+    work_id: Optional[str] = "",
+    critiques: Optional[list] = None,
+) -> model.Work:
+    return model.Work.create(
+        work_id=value_objects.WorkId.from_string(uuid_string=work_id)
+        or value_objects.WorkId(),
+        title=value_objects.Title(title),
+        content=value_objects.Content(content),
+        member_id=member_value_objects.MemberId.from_string(uuid_string=member_id),
+        age_restriction=value_objects.find_agerestriction_by_value(age_restriction),
+        genre=value_objects.find_genre_by_value(genre),
+        critiques=critiques,
+    )
+
+
+def build_work_filters(
+    genre: Optional[str] = None,
+    age_restriction: Optional[str] = None,
+    status: Optional[str] = None,
+    member_id: Optional[str] = None,
+) -> value_objects.WorkFilters:
+    try:
+        return value_objects.WorkFilters(
+            genre=value_objects.find_genre_by_value(genre) if genre else None,
+            age_restriction=value_objects.find_agerestriction_by_value(age_restriction)
+            if age_restriction
+            else None,
+            status=value_objects.WorkStatus(status) if status else None,
+            member_id=member_value_objects.MemberId.from_string(member_id)
+            if member_id
+            else None,
+        )
+    except (ValueError, member_exceptions.InvalidEntryError) as e:
+        logger.exception(f"Invalid filter encountered: {e}")
+        raise InvalidDataError(f"Invalid filter encountered: {e}") from e
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[value_objects.WorkCursor]:
+    if not cursor:
+        return None
+    try:
+        return value_objects.WorkCursor.decode(cursor)
+    except exceptions.InvalidCursorError as e:
+        raise InvalidDataError(f"Invalid cursor encountered: {e}") from e
+
+
+def get_page_size(page_size: Optional[int] = None) -> int:
+    return min(page_size or config.WORK_PAGE_SIZE, config.WORK_PAGE_SIZE_MAX)
+
+
+def build_page(summaries: list[value_objects.WorkSummary], page_size: int) -> dict:
+    # One row beyond the page size is fetched to tell whether a next page exists.
+    # The summaries are returned as they are; the response model serializes
+    # them straight to JSON.
+    page = summaries[:page_size]
+    has_more = len(summaries) > page_size
+    return {
+        "works": page,
+        "next_cursor": page[-1].cursor.encode() if has_more else None,
+    }
+
+
 def add_work(
     uow: uow.AbstractUnitOfWork,
     title: str,
@@ -38,18 +109,13 @@ def add_work(
 ) -> dict:
     with uow:
         try:
-            new_work = model.Work.create(
-                work_id=value_objects.WorkId.from_string(uuid_string=work_id)
-                or value_objects.WorkId(),
-                title=value_objects.Title(title),
-                content=value_objects.Content(content),
-                member_id=member_value_objects.MemberId.from_string(
-                    uuid_string=member_id
-                ),
-                age_restriction=value_objects.find_agerestriction_by_value(
-                    age_restriction
-                ),
-                genre=value_objects.find_genre_by_value(genre),
+            new_work = build_work(
+                title=title,
+                content=content,
+                member_id=member_id,
+                genre=genre,
+                age_restriction=age_restriction,
+                work_id=work_id,
                 critiques=critiques,
             )
             if uow.works.get_work_by_id(new_work.id):
@@ -70,6 +136,112 @@ def add_work(
             raise InvalidDataError(f"Invalid data encountered: {e}") from e
 
 
+IMPORT_FIELDS = ("title", "content", "member_id", "genre", "age_restriction")
+
+
+def iter_import_batches(
+    rows: Iterable[dict], batch_size: Optional[int] = None
+) -> Iterator[List[Tuple[int, dict]]]:
+    # Numbered rows in batches, so errors can name the input row.
+    numbered = enumerate(rows)
+    batch_size = batch_size or config.WORK_IMPORT_BATCH_SIZE
+    while batch := list(islice(numbered, batch_size)):
+        yield batch
+
+
+def build_import_batch(
+    batch: List[Tuple[int, dict]],
+    seen_ids: Set[value_objects.WorkId],
+    report: value_objects.WorkImportReport,
+) -> List[Tuple[int, model.Work]]:
+    """Validate a batch of rows into works, recording a row error for each
+    one that fails or repeats an id seen earlier in the import."""
+    works = []
+    for row_number, row in batch:
+        missing = [name for name in IMPORT_FIELDS if not row.get(name)]
+        if missing:
+            report.errors.append(
+                value_objects.ImportRowError(
+                    row_number, f"Missing fields: {', '.join(missing)}"
+                )
+            )
+            continue
+        try:
+            work = build_work(
+                title=row["title"],
+                content=row["content"],
+                member_id=row["member_id"],
+                genre=row["genre"],
+                age_restriction=row["age_restriction"],
+                work_id=row.get("id") or "",
+            )
+        except Exception as e:
+            report.errors.append(value_objects.ImportRowError(row_number, str(e)))
+            continue
+        if work.id in seen_ids:
+            report.errors.append(
+                value_objects.ImportRowError(
+                    row_number, f"Work id {work.id} repeated in import"
+                )
+            )
+            continue
+        seen_ids.add(work.id)
+        works.append((row_number, work))
+    return works
+
+
+def drop_existing_works(
+    works: List[Tuple[int, model.Work]],
+    existing_ids: Set[value_objects.WorkId],
+    report: value_objects.WorkImportReport,
+) -> List[Tuple[int, model.Work]]:
+    new_works = []
+    for row_number, work in works:
+        if work.id in existing_ids:
+            report.errors.append(
+                value_objects.ImportRowError(
+                    row_number, f"Work with id {work.id} already exists"
+                )
+            )
+        else:
+            new_works.append((row_number, work))
+    return new_works
+
+
+def record_inserted_works(
+    works: List[Tuple[int, model.Work]],
+    failed: List[Tuple[int, str]],
+    report: value_objects.WorkImportReport,
+) -> None:
+    for position, error in failed:
+        report.errors.append(value_objects.ImportRowError(works[position][0], error))
+    report.imported += len(works) - len(failed)
+
+
+def import_works(
+    uow: uow.AbstractUnitOfWork,
+    rows: Iterable[dict],
+    batch_size: Optional[int] = None,
+) -> dict:
+    """Import works in batches: one id lookup and one multi row insert per
+    batch, each batch its own transaction. Invalid, repeated or existing rows
+    are reported by input position rather than failing the import."""
+    report = value_objects.WorkImportReport()
+    seen_ids: Set[value_objects.WorkId] = set()
+    with uow:
+        for batch in iter_import_batches(rows, batch_size):
+            works = build_import_batch(batch, seen_ids, report)
+            if works:
+                existing_ids = uow.works.existing_ids(work.id for _, work in works)
+                works = drop_existing_works(works, existing_ids, report)
+            failed = uow.works.add_many([work for _, work in works])
+            uow.commit()
+            record_inserted_works(works, failed, report)
+            logger.debug(f"Imported batch ending at row {batch[-1][0]}: {report}")
+    report.errors.sort(key=lambda error: error.row)
+    return report.to_dict()
+
+
 def list_works(
     uow: uow.AbstractUnitOfWork,
 ) -> list[dict]:
@@ -78,9 +250,57 @@ def list_works(
     return works
 
 
-def get_work_by_id(work_id: str, uow: uow.AbstractUnitOfWork) -> Optional[dict]:
+def from_cached_work(cached: Optional[dict], include_content: bool) -> Optional[dict]:
+    """A copy of a cached work dict fit for the request, or None when the
+    entry is missing or lacks the content asked for."""
+    if cached is None or (include_content and "content" not in cached):
+        return None
+    work = {**cached, "critiques": list(cached["critiques"])}
+    if not include_content:
+        work.pop("content", None)
+    return work
+
+
+def get_work_by_id(
+    work_id: str, uow: uow.AbstractUnitOfWork, include_content: bool = True
+) -> Optional[dict]:
+    # Read through the work cache; only found works are cached. The
+    # generation is taken before loading, so a commit invalidating the work
+    # while it loads keeps this stale copy out of the cache.
+    key = value_objects.WorkId.from_string(uuid_string=work_id)
+    work = from_cached_work(uow.cache.get(key), include_content)
+    if work is not None:
+        return work
+    generation = uow.cache.generation(key)
     with uow:
-        work = uow.works.get_work_by_id(
+        work = uow.works.get_work_by_id(key)
+        if not work:
+            return None
+        work = work.to_dict(include_content=include_content)
+    uow.cache.set(key, work, generation)
+    return from_cached_work(work, include_content)
+
+
+def get_work_content(work_id: str, uow: uow.AbstractUnitOfWork) -> Optional[str]:
+    with uow:
+        content = uow.works.get_work_content(
             value_objects.WorkId.from_string(uuid_string=work_id)
         )
-    return work.to_dict() if work else None
+    return str(content) if content else None
+
+
+def list_work_summaries(
+    uow: uow.AbstractUnitOfWork,
+    genre: Optional[str] = None,
+    age_restriction: Optional[str] = None,
+    status: Optional[str] = None,
+    member_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+) -> dict:
+    filters = build_work_filters(genre, age_restriction, status, member_id)
+    after = decode_cursor(cursor)
+    page_size = get_page_size(page_size)
+    with uow:
+        summaries = uow.works.list_summaries(filters, page_size + 1, after)
+    return build_page(summaries, page_size)
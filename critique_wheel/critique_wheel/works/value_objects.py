@@ -1,9 +1,15 @@
+import base64
+import binascii
 import logging
 import uuid
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
+from typing import List, Optional
 
 from critique_wheel.config import config
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.text import Text
 from critique_wheel.works.exceptions import exceptions
 
 logger = logging.getLogger(__name__)
@@ -105,7 +111,7 @@ class Title:
 
 
 @dataclass(frozen=True)
-class Content:
+class Content(Text):
     value: str
 
     def __post_init__(self):
@@ -121,5 +127,97 @@ class Content:
     def __len__(self):
         return len(self.value)
 
-    def word_count(self):
-        return len(self.value.split())
+
+@dataclass(frozen=True)
+class WorkFilters:
+    genre: Optional[WorkGenre] = None
+    age_restriction: Optional[WorkAgeRestriction] = None
+    status: Optional[WorkStatus] = None
+    member_id: Optional[MemberId] = None
+
+
+@dataclass(frozen=True)
+class WorkCursor:
+    """Position after the last work of a page, ordered by (submission_date, id)
+    newest first."""
+
+    submission_date: datetime
+    id: WorkId
+
+    def encode(self) -> str:
+        raw = f"{self.submission_date.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str):
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            submission_date, work_id = raw.split("|")
+            return cls(
+                submission_date=datetime.fromisoformat(submission_date),
+                id=WorkId(id=uuid.UUID(work_id)),
+            )
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            logger.exception(f"Invalid cursor: '{cursor}'")
+            raise exceptions.InvalidCursorError(f"Invalid cursor: '{cursor}'")
+
+
+@dataclass(frozen=True)
+class WorkSummary:
+    """A work without its content, for listings."""
+
+    id: WorkId
+    title: Title
+    member_id: MemberId
+    age_restriction: WorkAgeRestriction
+    genre: WorkGenre
+    status: WorkStatus
+    word_count: int
+    submission_date: datetime
+
+    @property
+    def cursor(self) -> WorkCursor:
+        return WorkCursor(submission_date=self.submission_date, id=self.id)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": str(self.id),
+            "title": str(self.title),
+            "age_restriction": self.age_restriction.value,
+            "genre": self.genre.value,
+            "status": self.status.value,
+            "word_count": self.word_count,
+            "submission_date": self.submission_date.isoformat(),
+            "member_id": str(self.member_id),
+        }
+
+
+@dataclass(frozen=True)
+class CritiqueCapacity:
+    """The counters on a work's row, read when a critique slot is refused."""
+
+    status: WorkStatus
+    critique_count: int
+    active_critique_count: int
+    critique_limit: Optional[int]
+
+    def limit(self, default: int) -> int:
+        return default if self.critique_limit is None else self.critique_limit
+
+
+@dataclass(frozen=True)
+class ImportRowError:
+    row: int
+    error: str
+
+
+@dataclass
+class WorkImportReport:
+    imported: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "imported": self.imported,
+            "errors": [{"row": e.row, "error": e.error} for e in self.errors],
+        }
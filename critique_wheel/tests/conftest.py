@@ -7,7 +7,9 @@ import requests
 from requests.exceptions import ConnectionError
 from sqlalchemy import create_engine
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import clear_mappers, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from critique_wheel.adapters.orm import mapper_registry, start_mappers
 from critique_wheel.credits.models.credit import CreditManager, TransactionType
@@ -35,6 +37,11 @@ from critique_wheel.works.value_objects import (
 
 os.environ["ENV_STATE"] = "test"
 from critique_wheel import config  # noqa : E402
+from critique_wheel.infrastructure.cache import (  # noqa : E402
+    get_work_cache,
+    reset_work_cache,
+)
+from critique_wheel.infrastructure.throttle import reset_login_throttle  # noqa : E402
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +58,36 @@ def sqlite_session_factory(in_memory_sqlite_db):
     yield sessionmaker(bind=in_memory_sqlite_db)
 
 
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def async_sqlite_session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(mapper_registry.metadata.create_all)
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def work_cache():
+    # The process wide work cache must not carry works between tests.
+    reset_work_cache()
+    yield get_work_cache()
+    reset_work_cache()
+
+
+@pytest.fixture(autouse=True)
+def login_throttle():
+    # Failed logins must not throttle later tests.
+    reset_login_throttle()
+    yield
+    reset_login_throttle()
+
+
 @pytest.fixture
 def mappers():
     start_mappers()
@@ -0,0 +1,38 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from critique_wheel import config
+from critique_wheel.infrastructure import database
+from critique_wheel.main import app
+
+pytestmark = pytest.mark.usefixtures("mappers")
+
+
+@pytest.fixture
+def sqlite_app(monkeypatch):
+    # Run against the app's own engines, as configured by example.env.
+    monkeypatch.setattr(config.config, "DATABASE_TYPE", "sqlite")
+    monkeypatch.setattr(app, "dependency_overrides", {})
+    database.dispose_engine()
+    monkeypatch.setattr(database, "_async_engine", None)
+    monkeypatch.setattr(database, "_async_session_factory", None)
+    with TestClient(app) as client:
+        yield client
+
+
+def test_async_routes_find_the_schema_once_the_app_has_started(sqlite_app):
+    payload = {
+        "username": "lifespan",
+        "email": "lifespan@davidnevin.net",
+        "password": "bhsrugh^yygTY!",
+        "confirm_password": "bhsrugh^yygTY!",
+    }
+
+    response = sqlite_app.post("/members/register/", json=payload)
+
+    assert response.status_code == 201
+    login = sqlite_app.post(
+        "/members/login",
+        json={"email": payload["email"], "password": payload["password"]},
+    )
+    assert login.status_code == 200
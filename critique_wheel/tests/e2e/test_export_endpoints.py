@@ -0,0 +1,49 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from critique_wheel.entrypoints.routers import exports as exports_router
+from critique_wheel.infrastructure.tokens import get_token_signer
+from critique_wheel.main import app
+from critique_wheel.members.models.IAM import Member
+from tests.helpers import override_get_db_session
+
+pytestmark = pytest.mark.usefixtures("mappers")
+
+test_client = TestClient(app)
+app.dependency_overrides[exports_router.get_db_session] = override_get_db_session
+
+
+@pytest.fixture(autouse=True)
+def default_roles():
+    Member.load_roles_from_yaml()
+
+
+def bearer(role):
+    token = get_token_signer().issue("member", role)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_export_endpoint_streams_ndjson():
+    response = test_client.get("/exports/credits", headers=bearer("ADMIN"))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text == ""
+
+
+def test_export_endpoint_rejects_unknown_exports_and_bad_cursors():
+    assert (
+        test_client.get("/exports/passwords", headers=bearer("ADMIN")).status_code
+        == 404
+    )
+    response = test_client.get(
+        "/exports/works", params={"after": "not an id"}, headers=bearer("ADMIN")
+    )
+    assert response.status_code == 400
+
+
+def test_export_endpoint_requires_an_admin():
+    assert test_client.get("/exports/members").status_code == 401
+    response = test_client.get("/exports/members", headers=bearer("MEMBER"))
+    assert response.status_code == 403
+    response = test_client.get("/exports/members", headers=bearer("STAFF"))
+    assert response.status_code == 403
@@ -11,3 +11,10 @@ def test_healthcheck_api_returns_ok():
     response = client.get("/healthcheck")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_metrics_endpoint_reports_password_hasher_metrics():
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert "queue_depth" in response.json()["password_hasher"]
+    assert "hits" in response.json()["work_cache"]
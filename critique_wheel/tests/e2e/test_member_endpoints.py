@@ -3,9 +3,14 @@ import uuid
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
+from critique_wheel.adapters.orm import mapper_registry
 from critique_wheel.entrypoints.routers import members as members_router
+from critique_wheel.infrastructure.password_hasher import PasswordHasherBusyError
 from critique_wheel.main import app
+from critique_wheel.members.services import async_iam_service, iam_service
 from tests.helpers import create_and_insert_member, override_get_db_session
 
 logger = logging.getLogger(__name__)
@@ -71,3 +76,140 @@ def test_duplicate_info_register_member_endpoint_returns_DuplicateEntryError(
     logger.debug(response.json())
     assert response.status_code == 201
     assert response.json()["detail"] == "User created. Please confirm your email"
+
+
+class SaturatedPasswordHasher:
+    async def hash(self, password):
+        raise PasswordHasherBusyError("Password hasher is saturated")
+
+
+def test_register_member_endpoint_returns_503_when_hashing_is_saturated(
+    monkeypatch,
+):
+    monkeypatch.setattr(
+        async_iam_service, "get_password_hasher", SaturatedPasswordHasher
+    )
+    payload = {
+        "username": "busy_member",
+        "email": "busy_member@davidnevin.net",
+        "password": "bhsrugh^yygTY!",
+        "confirm_password": "bhsrugh^yygTY!",
+    }
+
+    response = test_client.post("/members/register/", json=payload)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+@pytest.fixture
+def shared_db_session():
+    # Login needs the member registered by an earlier request, so every
+    # request in the test shares one database.
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    created = []
+
+    async def get_shared_db_session():
+        if not created:
+            async with engine.begin() as connection:
+                await connection.run_sync(mapper_registry.metadata.create_all)
+            created.append(True)
+        yield session_factory
+
+    app.dependency_overrides[members_router.get_db_session] = get_shared_db_session
+    yield
+    app.dependency_overrides[members_router.get_db_session] = override_get_db_session
+
+
+@pytest.mark.usefixtures("shared_db_session")
+def test_login_refresh_and_logout_flow():
+    credentials = {"email": "token_flow@davidnevin.net", "password": "bhsrugh^yygTY!"}
+    test_client.post("/members/", json={"username": "token_flow", **credentials})
+
+    response = test_client.post("/members/login", json=credentials)
+    assert response.status_code == 200
+    tokens = response.json()
+    assert tokens["token_type"] == "bearer"
+
+    response = test_client.post(
+        "/members/token/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 200
+    refreshed = response.json()
+    response = test_client.post(
+        "/members/token/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 401
+
+    response = test_client.post(
+        "/members/logout",
+        json={"refresh_token": refreshed["refresh_token"]},
+        headers={"Authorization": f"Bearer {refreshed['access_token']}"},
+    )
+    assert response.status_code == 204
+    response = test_client.post(
+        "/members/logout",
+        headers={"Authorization": f"Bearer {refreshed['access_token']}"},
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.usefixtures("shared_db_session")
+def test_login_with_wrong_password_returns_401():
+    response = test_client.post(
+        "/members/login",
+        json={"email": "nobody@davidnevin.net", "password": "bhsrugh^yygTY!"},
+    )
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
+@pytest.mark.usefixtures("shared_db_session")
+def test_login_returns_429_once_account_is_locked(monkeypatch):
+    monkeypatch.setattr(iam_service.config, "LOGIN_MAX_FAILED_ATTEMPTS", 2)
+    credentials = {"email": "locked@davidnevin.net", "password": "bhsrugh^yygTY!"}
+    test_client.post("/members/", json={"username": "locked", **credentials})
+    for _ in range(2):
+        response = test_client.post(
+            "/members/login",
+            json={"email": credentials["email"], "password": "wrong_p@ssword1"},
+        )
+        assert response.status_code == 401
+
+    response = test_client.post("/members/login", json=credentials)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+
+
+@pytest.mark.usefixtures("shared_db_session")
+def test_lockout_does_not_reveal_whether_an_account_exists():
+    password = "bhsrugh^yygTY!"
+    test_client.post(
+        "/members/",
+        json={
+            "username": "known",
+            "email": "known@davidnevin.net",
+            "password": password,
+        },
+    )
+
+    def responses(email):
+        results = []
+        for _ in range(7):
+            response = test_client.post(
+                "/members/login", json={"email": email, "password": "wrong_p@ssword1"}
+            )
+            results.append((response.status_code, response.headers.get("Retry-After")))
+        return results
+
+    known = responses("known@davidnevin.net")
+    unknown = responses("unknown@davidnevin.net")
+
+    assert known == unknown
+    assert known[-1] == (429, "1800")
@@ -0,0 +1,73 @@
+import fastapi
+import pytest
+from fastapi.testclient import TestClient
+
+from critique_wheel.entrypoints.dependencies import require_permission
+from critique_wheel.infrastructure.tokens import get_revocation_list, get_token_signer
+from critique_wheel.members.models.IAM import Member
+
+app = fastapi.FastAPI()
+
+
+@app.middleware("http")
+async def role_from_header(request: fastapi.Request, call_next):
+    # Stands in for authentication, which sets the caller's role.
+    if "X-Test-Role" in request.headers:
+        request.state.member_role = request.headers["X-Test-Role"]
+    return await call_next(request)
+
+
+@app.delete("/works/{work_id}")
+async def delete_work(
+    work_id: str, role=fastapi.Depends(require_permission("Delete", "Works"))
+):
+    return {"deleted": work_id}
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def default_roles():
+    Member.load_roles_from_yaml()
+
+
+def test_role_with_permission_is_authorized():
+    response = client.delete("/works/1", headers={"X-Test-Role": "ADMIN"})
+    assert response.status_code == 200
+
+
+def test_role_without_permission_is_forbidden():
+    response = client.delete("/works/1", headers={"X-Test-Role": "MEMBER"})
+    assert response.status_code == 403
+
+
+def test_unauthenticated_request_is_rejected():
+    response = client.delete("/works/1")
+    assert response.status_code == 401
+
+
+def test_bearer_token_role_is_authorized():
+    token = get_token_signer().issue("member", "ADMIN")
+    response = client.delete("/works/1", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+
+
+def test_bearer_token_without_permission_is_forbidden():
+    token = get_token_signer().issue("member", "MEMBER")
+    response = client.delete("/works/1", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 403
+
+
+def test_invalid_or_revoked_bearer_token_is_rejected():
+    signer = get_token_signer()
+    token = signer.issue("member", "ADMIN")
+    claims = signer.decode(token)
+    get_revocation_list().revoke(claims.jti, claims.expires_at)
+
+    for bearer in (token, "not-a-token"):
+        response = client.delete(
+            "/works/1", headers={"Authorization": f"Bearer {bearer}"}
+        )
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Bearer"
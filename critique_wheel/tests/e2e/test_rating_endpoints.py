@@ -0,0 +1,30 @@
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from critique_wheel.entrypoints.routers import ratings as ratings_router
+from critique_wheel.main import app
+from tests.helpers import override_get_db_session
+
+pytestmark = pytest.mark.usefixtures("mappers")
+
+test_client = TestClient(app)
+app.dependency_overrides[ratings_router.get_db_session] = override_get_db_session
+
+
+def test_critique_ratings_endpoint_returns_an_empty_aggregate():
+    critique_id = str(uuid4())
+    response = test_client.get(f"/critiques/{critique_id}/ratings")
+    assert response.status_code == 200
+    assert response.json() == {
+        "critique_id": critique_id,
+        "rating_count": 0,
+        "average": None,
+        "histogram": {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0},
+    }
+
+
+def test_critic_ratings_endpoint_returns_400_for_an_invalid_id():
+    response = test_client.get("/critics/not-a-uuid/ratings")
+    assert response.status_code == 400
@@ -5,7 +5,12 @@ import pytest
 from fastapi.testclient import TestClient
 
 from critique_wheel.entrypoints.routers import works as works_router
+from critique_wheel.entrypoints.schemas import schemas
+from critique_wheel.infrastructure.tokens import get_token_signer
 from critique_wheel.main import app
+from critique_wheel.members.models.IAM import Member
+from critique_wheel.works.services import async_work_service
+from critique_wheel.works.services.work_service import from_cached_work
 from critique_wheel.works.value_objects import WorkAgeRestriction, WorkGenre, WorkStatus
 from tests.helpers import create_and_insert_member, override_get_db_session
 
@@ -18,6 +23,16 @@ test_client = TestClient(app)
 app.dependency_overrides[works_router.get_db_session] = override_get_db_session
 
 
+@pytest.fixture(autouse=True)
+def default_roles():
+    Member.load_roles_from_yaml()
+
+
+def bearer(role):
+    token = get_token_signer().issue("member", role)
+    return {"Authorization": f"Bearer {token}"}
+
+
 def test_work_endpoint_returns_404_if_id_does_not_exist():
     nonexistant_work_id = uuid4()
     response = test_client.get(f"/works/{nonexistant_work_id}")
@@ -49,3 +64,63 @@ def test_create_work_endpoint_returns_work(work_details, sqlite_session_factory)
     assert response.json()["genre"] == payload["genre"]
     assert response.json()["member_id"] == payload["member_id"]
     assert response.json()["id"] is not None
+
+
+def test_work_endpoint_returns_the_work_in_the_documented_shape(
+    valid_work, monkeypatch
+):
+    cached = valid_work.to_dict(include_content=True)
+
+    async def get_work_by_id(work_id, uow, include_content):
+        return from_cached_work(cached, include_content)
+
+    monkeypatch.setattr(async_work_service, "get_work_by_id", get_work_by_id)
+
+    summary = test_client.get(f"/work/{valid_work.id}")
+    detail = test_client.get(f"/work/{valid_work.id}", params={"include_content": True})
+
+    assert summary.status_code == 200
+    assert set(summary.json()) == set(schemas.WorkOut.model_fields) - {"content"}
+    assert schemas.WorkOut.model_validate(detail.json()).content == "Test content"
+
+
+def test_list_works_endpoint_returns_a_page():
+    response = test_client.get("/works", params={"genre": WorkGenre.YOUNGADULT.value})
+    assert response.status_code == 200
+    assert response.json() == {"works": [], "next_cursor": None}
+
+
+def test_list_works_endpoint_returns_400_for_an_invalid_cursor():
+    response = test_client.get("/works", params={"cursor": "not a cursor"})
+    assert response.status_code == 400
+
+
+def test_work_content_endpoint_returns_404_if_id_does_not_exist():
+    response = test_client.get(f"/work/{uuid4()}/content")
+    assert response.status_code == 404
+
+
+def test_bulk_import_endpoint_reports_per_row_errors():
+    row = {
+        "title": "Bulk Title",
+        "content": "Bulk content",
+        "age_restriction": WorkAgeRestriction.ADULT.value,
+        "genre": WorkGenre.OTHER.value,
+        "member_id": str(uuid4()),
+    }
+    payload = {"works": [row, {**row, "genre": "NOT A GENRE"}, {"title": "Only"}]}
+
+    response = test_client.post("/works/bulk", json=payload, headers=bearer("ADMIN"))
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1
+    assert [error["row"] for error in response.json()["errors"]] == [1, 2]
+
+
+def test_bulk_import_endpoint_requires_an_admin():
+    payload = {"works": []}
+
+    assert test_client.post("/works/bulk", json=payload).status_code == 401
+    for role in ("MEMBER", "STAFF"):
+        response = test_client.post("/works/bulk", json=payload, headers=bearer(role))
+        assert response.status_code == 403
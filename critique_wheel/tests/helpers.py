@@ -2,8 +2,7 @@ import logging
 import uuid
 
 import sqlalchemy
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from critique_wheel.adapters.orm import mapper_registry
@@ -12,25 +11,30 @@ logger = logging.getLogger(__name__)
 
 
 # Possibly can be moved to a fixture
-def override_get_db_session():
-    SQLITE_DB_URI = "sqlite:///"
-    engine = create_engine(
+async def override_get_db_session():
+    SQLITE_DB_URI = "sqlite+aiosqlite:///"
+    engine = create_async_engine(
         SQLITE_DB_URI,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
         # echo=True,
     )
     logger.debug(f"Using {engine} database engine")
-    mapper_registry.metadata.create_all(engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(mapper_registry.metadata.create_all)
     try:
-        db = sessionmaker(
-            autocommit=False,
+        yield async_sessionmaker(
             autoflush=False,
             bind=engine,
+            expire_on_commit=False,
         )
-        yield db
     finally:
-        db().close()
+        await engine.dispose()
+
+
+def db_id(value) -> bytes:
+    # Id columns are stored as 16 raw bytes on SQLite.
+    return uuid.UUID(str(value)).bytes
 
 
 def insert_member(session, **kwargs):
@@ -40,7 +44,7 @@ def insert_member(session, **kwargs):
         VALUES (:id, :username, :email, :password)
         """
     )
-    params = kwargs
+    params = {**kwargs, "id": db_id(kwargs["id"])}
     session.execute(stmt, params)
 
 
@@ -53,7 +57,7 @@ def get_member_by_id(session, member_id):
         """
     )
     params = {
-        "id": member_id,
+        "id": db_id(member_id),
     }
     result = session.execute(stmt, params)
     row = result.fetchone()
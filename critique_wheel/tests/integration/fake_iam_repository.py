@@ -2,6 +2,7 @@ from typing import Optional
 
 from critique_wheel.members.models.IAM import Member
 from critique_wheel.members.models.iam_repository import AbstractMemberRepository
+from critique_wheel.members.services import exceptions as service_exceptions
 from critique_wheel.members.value_objects import MemberId
 
 
@@ -11,6 +12,11 @@ class FakeMemberRepository(AbstractMemberRepository):
         self.committed = False
 
     def add(self, member: Member) -> None:
+        # Mirrors the unique indexes on members.email and members.username.
+        if self.get_member_by_email(member.email):
+            raise service_exceptions.DuplicateEntryError("Email already in use")
+        if self.get_member_by_username(member.username):
+            raise service_exceptions.DuplicateUsernameError("Username already in use")
         self._members.add(member)
 
     def get_member_by_id(self, member_id: MemberId) -> Optional[Member]:
@@ -31,6 +37,14 @@ class FakeMemberRepository(AbstractMemberRepository):
                 return m
         return None
 
+    def taken_identifiers(self, email: str, username: str) -> set[str]:
+        taken = set()
+        if self.get_member_by_email(email):
+            taken.add("email")
+        if self.get_member_by_username(username):
+            taken.add("username")
+        return taken
+
     def list(self) -> list[Member]:
         return list(self._members)
 
@@ -1,10 +1,21 @@
 import logging
-from typing import Optional
+from typing import Iterable, List, Optional, Set, Tuple
 
 from critique_wheel.members.value_objects import MemberId
 from critique_wheel.works.models.work import Work
-from critique_wheel.works.models.work_repository import AbstractWorkRepository
-from critique_wheel.works.value_objects import WorkId
+from critique_wheel.works.models.work_repository import (
+    AbstractAsyncWorkRepository,
+    AbstractWorkRepository,
+)
+from critique_wheel.works.value_objects import (
+    Content,
+    CritiqueCapacity,
+    WorkCursor,
+    WorkFilters,
+    WorkId,
+    WorkStatus,
+    WorkSummary,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +38,10 @@ class FakeWorkRepository(AbstractWorkRepository):
             logger.exception(f"Error getting work by member id: {e}")
             return None
 
+    def get_work_content(self, work_id: WorkId) -> Optional[Content]:
+        work = self.get_work_by_id(work_id)
+        return work.content if work else None
+
     def get_work_by_member_id(self, member_id: MemberId) -> Optional[Work]:
         try:
             return next(w for w in self._works if w.member_id == member_id)
@@ -40,5 +55,105 @@ class FakeWorkRepository(AbstractWorkRepository):
     def list(self) -> list[Work]:
         return list(self._works)
 
+    def list_summaries(
+        self,
+        filters: WorkFilters,
+        limit: int,
+        after: Optional[WorkCursor] = None,
+    ) -> List[WorkSummary]:
+        def key(w):
+            return (w.submission_date, w.id.id)
+
+        works = [
+            w
+            for w in self._works
+            if (not filters.genre or w.genre == filters.genre)
+            and (
+                not filters.age_restriction
+                or w.age_restriction == filters.age_restriction
+            )
+            and (not filters.status or w.status == filters.status)
+            and (not filters.member_id or w.member_id == filters.member_id)
+            and (not after or key(w) < (after.submission_date, after.id.id))
+        ]
+        works.sort(key=key, reverse=True)
+        return [w.to_summary() for w in works[:limit]]
+
+    def existing_ids(self, work_ids: Iterable[WorkId]) -> Set[WorkId]:
+        ids = set(work_ids)
+        return {w.id for w in self._works if w.id in ids}
+
+    def add_many(self, works: List[Work]) -> List[Tuple[int, str]]:
+        self._works.update(works)
+        return []
+
+    def reserve_critique_slot(
+        self, work_id: WorkId, limit: int, active: bool = True
+    ) -> bool:
+        work = self.get_work_by_id(work_id)
+        if (
+            not work
+            or work.status != WorkStatus.ACTIVE
+            or work.critique_count >= (work.critique_limit or limit)
+        ):
+            return False
+        work.critique_count += 1
+        work.active_critique_count += int(active)
+        return True
+
+    def get_critique_capacity(self, work_id: WorkId) -> Optional[CritiqueCapacity]:
+        work = self.get_work_by_id(work_id)
+        if not work:
+            return None
+        return CritiqueCapacity(
+            status=work.status,
+            critique_count=work.critique_count,
+            active_critique_count=work.active_critique_count,
+            critique_limit=work.critique_limit,
+        )
+
+    def get_word_count(self, work_id: WorkId) -> Optional[int]:
+        work = self.get_work_by_id(work_id)
+        return work.word_count if work else None
+
+    def adjust_active_critique_count(self, work_id: WorkId, delta: int) -> None:
+        work = self.get_work_by_id(work_id)
+        if work:
+            work.active_critique_count += delta
+
     def commit(self) -> None:
         self.committed = True
+
+
+class FakeAsyncWorkRepository(AbstractAsyncWorkRepository):
+    def __init__(self, works: list[Work]):
+        self._repository = FakeWorkRepository(works)
+
+    def add(self, work: Work) -> None:
+        self._repository.add(work)
+
+    async def get_work_by_id(self, work_id: WorkId) -> Optional[Work]:
+        return self._repository.get_work_by_id(work_id)
+
+    async def get_work_content(self, work_id: WorkId) -> Optional[Content]:
+        return self._repository.get_work_content(work_id)
+
+    async def get_work_by_member_id(self, member_id: MemberId) -> Optional[Work]:
+        return self._repository.get_work_by_member_id(member_id)
+
+    async def list(self) -> list[Work]:
+        return self._repository.list()
+
+    async def existing_ids(self, work_ids: Iterable[WorkId]) -> Set[WorkId]:
+        return self._repository.existing_ids(work_ids)
+
+    async def add_many(self, works: List[Work]) -> List[Tuple[int, str]]:
+        return self._repository.add_many(works)
+
+    async def list_summaries(
+        self,
+        filters: WorkFilters,
+        limit: int,
+        after: Optional[WorkCursor] = None,
+    ) -> List[WorkSummary]:
+        return self._repository.list_summaries(filters, limit, after)
@@ -9,6 +9,7 @@ from critique_wheel.members.models.IAM import MemberStatus
 from critique_wheel.members.value_objects import MemberId
 from critique_wheel.works.models.work import Work
 from critique_wheel.works.value_objects import WorkId
+from tests.helpers import db_id
 
 pytestmark = pytest.mark.usefixtures("mappers")
 
@@ -38,7 +39,7 @@ def test_repository_can_save_a_basic_member(
     )
     assert rows == [
         (
-            member.id.get_uuid(),
+            db_id(member.id),
             member.username,
             member.email,
             member.password,
@@ -65,7 +66,7 @@ def test_repository_can_get_a_member_by_id(
     session.commit()
 
     stmt = text('SELECT * FROM "members" WHERE id=:id').bindparams(
-        id=valid_member.id.get_uuid(),
+        id=db_id(valid_member.id),
     )
     rows = session.execute(stmt).fetchall()
     assert len(rows) == 1
@@ -109,6 +110,22 @@ def test_resository_can_get_a_member_by_username(session, valid_member):
     assert repo.get_member_by_username(member.username) == member
 
 
+def test_repository_reports_which_identifiers_are_taken(session, valid_member):
+    repo = iam_repository.MemberRepository(session)
+    repo.add(valid_member)
+    session.commit()
+
+    assert repo.taken_identifiers(valid_member.email, valid_member.username) == {
+        "email",
+        "username",
+    }
+    assert repo.taken_identifiers(valid_member.email, "free_username") == {"email"}
+    assert repo.taken_identifiers("free@davidnevin.net", valid_member.username) == {
+        "username"
+    }
+    assert repo.taken_identifiers("free@davidnevin.net", "free_username") == set()
+
+
 def test_resository_can_get_a_list_of_members(
     session, valid_member, active_valid_member
 ):
@@ -0,0 +1,104 @@
+import pytest
+
+from critique_wheel.infrastructure.cache import LRUCache
+from critique_wheel.members.services.unit_of_work import AsyncIAMUnitOfWork
+from critique_wheel.works.services import async_work_service
+from critique_wheel.works.services.unit_of_work import AsyncWorkUnitOfWork
+from critique_wheel.works.value_objects import Title
+
+pytestmark = [pytest.mark.anyio, pytest.mark.usefixtures("mappers")]
+
+
+async def test_async_uow_can_create_and_retrieve_works(
+    async_sqlite_session_factory, valid_member, valid_work
+):
+    valid_work.member_id = valid_member.id
+    async with AsyncIAMUnitOfWork(async_sqlite_session_factory) as uow:
+        uow.members.add(valid_member)
+        await uow.commit()
+
+    async with AsyncWorkUnitOfWork(async_sqlite_session_factory) as uow:
+        uow.works.add(valid_work)
+        await uow.commit()
+
+    async with AsyncWorkUnitOfWork(async_sqlite_session_factory) as uow:
+        work = await uow.works.get_work_by_id(valid_work.id)
+        assert work.title == valid_work.title
+        assert work.critiques == []
+        assert await uow.works.get_work_by_member_id(valid_member.id) == work
+        assert await uow.works.list() == [work]
+
+
+async def test_async_uow_rolls_back_uncommitted_work_by_default(
+    async_sqlite_session_factory, valid_work
+):
+    async with AsyncWorkUnitOfWork(async_sqlite_session_factory) as uow:
+        uow.works.add(valid_work)
+
+    async with AsyncWorkUnitOfWork(async_sqlite_session_factory) as uow:
+        assert await uow.works.list() == []
+
+
+async def test_async_uow_rolls_back_on_error(async_sqlite_session_factory, valid_work):
+    class MyException(Exception):
+        pass
+
+    with pytest.raises(MyException):
+        async with AsyncWorkUnitOfWork(async_sqlite_session_factory) as uow:
+            uow.works.add(valid_work)
+            raise MyException()
+
+    async with AsyncWorkUnitOfWork(async_sqlite_session_factory) as uow:
+        assert await uow.works.list() == []
+
+
+async def test_async_member_repository_finds_members(
+    async_sqlite_session_factory, valid_member
+):
+    async with AsyncIAMUnitOfWork(async_sqlite_session_factory) as uow:
+        uow.members.add(valid_member)
+        await uow.commit()
+
+    async with AsyncIAMUnitOfWork(async_sqlite_session_factory) as uow:
+        member = await uow.members.get_member_by_email(valid_member.email)
+        assert member.id == valid_member.id
+        assert member.works == []
+        assert await uow.members.get_member_by_username(valid_member.username) == member
+        assert await uow.members.get_member_by_id(valid_member.id) == member
+        assert await uow.members.get_member_by_email("missing@example.com") is None
+
+
+async def test_async_uow_fetches_deferred_content_separately(
+    async_sqlite_session_factory, valid_work
+):
+    async with AsyncWorkUnitOfWork(async_sqlite_session_factory) as uow:
+        uow.works.add(valid_work)
+        await uow.commit()
+
+    async with AsyncWorkUnitOfWork(async_sqlite_session_factory) as uow:
+        work = await uow.works.get_work_by_id(valid_work.id)
+        assert "content" not in work.__dict__
+        assert await uow.works.get_work_content(work.id) == valid_work.content
+
+
+async def test_async_commit_invalidates_cached_works(
+    async_sqlite_session_factory, valid_work
+):
+    cache = LRUCache()
+    uow = AsyncWorkUnitOfWork(async_sqlite_session_factory, cache=cache)
+    async with uow:
+        uow.works.add(valid_work)
+        await uow.commit()
+    work_id = str(valid_work.id)
+    work = await async_work_service.get_work_by_id(work_id, uow)
+    assert await async_work_service.get_work_by_id(work_id, uow) == work
+    assert cache.metrics()["hits"] == 1
+
+    async with uow:
+        stored = await uow.works.get_work_by_id(valid_work.id)
+        stored.title = Title("Retitled")
+        await uow.commit()
+
+    assert cache.get(valid_work.id) is None
+    work = await async_work_service.get_work_by_id(work_id, uow)
+    assert work["title"] == "Retitled"
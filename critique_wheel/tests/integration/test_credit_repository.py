@@ -1,7 +1,16 @@
+import csv
+from datetime import datetime, timedelta
+
 import pytest
 from sqlalchemy import text
 
 from critique_wheel.adapters.sqlalchemy import credit_repository
+from critique_wheel.credits.models.credit import CreditManager, TransactionType
+from critique_wheel.credits.services import credit_service
+from critique_wheel.credits.services.unit_of_work import CreditUnitOfWork
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.works.value_objects import WorkId
+from tests.helpers import db_id
 
 pytestmark = pytest.mark.usefixtures("mappers")
 
@@ -31,12 +40,12 @@ def test_repository_can_save_a_critique_credit_transaction(
     )
     assert rows == [
         (
-            credit.id.get_uuid(),
-            member.id.get_uuid(),
+            db_id(credit.id),
+            db_id(member.id),
             credit.amount,
             credit.transaction_type.value,
             None,
-            critique.id.get_uuid(),
+            db_id(critique.id),
         )
     ]
 
@@ -63,17 +72,228 @@ def test_repository_can_save_a_work_credit_transaction(
             text(
                 "SELECT id, member_id, amount, transaction_type, work_id, critique_id FROM credits WHERE id=:id"
             ).bindparams(
-                id=credit.id.get_uuid(),
+                id=db_id(credit.id),
             )
         )
     )
     assert rows == [
         (
-            credit.id.get_uuid(),
-            member.id.get_uuid(),
+            db_id(credit.id),
+            db_id(member.id),
             credit.amount,
             credit.transaction_type.value,
-            work.id.get_uuid(),
+            db_id(work.id),
             None,
         )
     ]
+
+
+def make_credit(member_id, amount):
+    return CreditManager.create(
+        member_id=member_id,
+        amount=amount,
+        transaction_type=TransactionType.WORK_SUBMITTED,
+        work_id=WorkId(),
+    )
+
+
+def test_adding_credits_keeps_the_member_balance(session):
+    member_id = MemberId()
+    other_member_id = MemberId()
+    repo = credit_repository.CreditRepository(session)
+    repo.add(make_credit(member_id, 3))
+    repo.add(make_credit(member_id, 2))
+    repo.add(make_credit(other_member_id, 4))
+    session.commit()
+
+    assert repo.get_balance(member_id) == 5
+    assert repo.get_balance(other_member_id) == 4
+    assert repo.get_balance(MemberId()) == 0
+    rows = list(
+        session.execute(
+            text(
+                "SELECT balance, transaction_count FROM member_credit_balances "
+                "WHERE member_id=:id"
+            ).bindparams(id=db_id(member_id))
+        )
+    )
+    assert rows == [(5, 2)]
+
+
+def test_fractional_credits_keep_the_ledger_and_balance_in_step(
+    sqlite_session_factory,
+):
+    member_id = MemberId()
+    session = sqlite_session_factory()
+    repo = credit_repository.CreditRepository(session)
+    repo.add(make_credit(member_id, 1.5))
+    repo.add(make_credit(member_id, 2.5))
+    session.commit()
+
+    amounts = session.execute(text("SELECT amount FROM credits")).scalars()
+    assert sorted(amounts) == [1.5, 2.5]
+    assert repo.get_balance(member_id) == 4
+    assert not credit_service.reconcile_balances(
+        CreditUnitOfWork(sqlite_session_factory)
+    ).drift
+
+
+def test_balance_is_rolled_back_with_the_credit(session):
+    member_id = MemberId()
+    repo = credit_repository.CreditRepository(session)
+    repo.add(make_credit(member_id, 3))
+    session.rollback()
+
+    assert repo.get_balance(member_id) == 0
+
+
+def test_reconcile_balances_reports_and_repairs_drift(sqlite_session_factory):
+    member_ids = [MemberId() for _ in range(5)]
+    session = sqlite_session_factory()
+    repo = credit_repository.CreditRepository(session)
+    for member_id in member_ids:
+        repo.add(make_credit(member_id, 2))
+    session.commit()
+    # Corrupt one balance and leave a balance row with no ledger behind.
+    orphan_id = MemberId()
+    repo.adjust_balance(member_ids[0], 10, 0)
+    repo.adjust_balance(orphan_id, 1, 1)
+    session.commit()
+
+    report = credit_service.reconcile_balances(
+        CreditUnitOfWork(sqlite_session_factory), batch_size=2
+    )
+
+    assert report.members_checked == 6
+    assert {drift.member_id for drift in report.drift} == {member_ids[0], orphan_id}
+    assert report.repaired
+    session = sqlite_session_factory()
+    repo = credit_repository.CreditRepository(session)
+    assert repo.get_balance(member_ids[0]) == 2
+    assert repo.get_balance(orphan_id) == 0
+    assert not credit_service.reconcile_balances(
+        CreditUnitOfWork(sqlite_session_factory)
+    ).drift
+
+
+def test_reconcile_balances_commits_each_batch_of_repairs(
+    sqlite_session_factory, monkeypatch
+):
+    member_ids = [MemberId() for _ in range(3)]
+    session = sqlite_session_factory()
+    repo = credit_repository.CreditRepository(session)
+    for member_id in member_ids:
+        repo.add(make_credit(member_id, 2))
+        repo.adjust_balance(member_id, 1, 0)
+    session.commit()
+
+    def fail(self):
+        raise RuntimeError("lost the connection")
+
+    monkeypatch.setattr(
+        credit_repository.CreditRepository, "list_balances_without_ledger", fail
+    )
+    with pytest.raises(RuntimeError):
+        credit_service.reconcile_balances(
+            CreditUnitOfWork(sqlite_session_factory), batch_size=2
+        )
+
+    session = sqlite_session_factory()
+    repo = credit_repository.CreditRepository(session)
+    assert [repo.get_balance(member_id) for member_id in member_ids] == [2, 2, 2]
+
+
+def test_reconcile_balances_dry_run_leaves_balances(sqlite_session_factory):
+    member_id = MemberId()
+    session = sqlite_session_factory()
+    repo = credit_repository.CreditRepository(session)
+    repo.add(make_credit(member_id, 2))
+    repo.adjust_balance(member_id, 1, 0)
+    session.commit()
+
+    report = credit_service.reconcile_balances(
+        CreditUnitOfWork(sqlite_session_factory), repair=False
+    )
+
+    assert report.drifted == 1
+    assert not report.repaired
+    assert repo.get_balance(member_id) == 3
+
+
+def test_balance_as_of_reads_snapshot_and_tail(session, monkeypatch):
+    monkeypatch.setattr(credit_repository.config, "CREDIT_SNAPSHOT_INTERVAL", 3)
+    member_id = MemberId()
+    repo = credit_repository.CreditRepository(session)
+    start = datetime(2024, 1, 1)
+    for day in range(7):
+        credit = make_credit(member_id, day + 1)
+        credit.date_of_transaction = start + timedelta(days=day)
+        repo.add(credit)
+    session.commit()
+
+    snapshots = list(
+        session.execute(text("SELECT balance, transaction_count FROM credit_snapshots"))
+    )
+    assert snapshots == [(6, 3), (21, 6)]
+    assert repo.balance_as_of(member_id, start - timedelta(days=1)) == 0
+    assert repo.balance_as_of(member_id, start + timedelta(days=1)) == 3
+    assert repo.balance_as_of(member_id, start + timedelta(days=4)) == 15
+    assert repo.balance_as_of(member_id, start + timedelta(days=30)) == 28
+
+
+def test_backdated_credit_drops_snapshots_it_invalidates(session, monkeypatch):
+    monkeypatch.setattr(credit_repository.config, "CREDIT_SNAPSHOT_INTERVAL", 2)
+    member_id = MemberId()
+    repo = credit_repository.CreditRepository(session)
+    start = datetime(2024, 1, 1)
+    for day in [0, 5]:
+        credit = make_credit(member_id, 1)
+        credit.date_of_transaction = start + timedelta(days=day)
+        repo.add(credit)
+    backdated = make_credit(member_id, 10)
+    backdated.date_of_transaction = start + timedelta(days=2)
+    repo.add(backdated)
+    session.commit()
+
+    assert repo.balance_as_of(member_id, start + timedelta(days=3)) == 11
+    assert repo.balance_as_of(member_id, start + timedelta(days=6)) == 12
+
+
+def test_write_snapshots_covers_changed_balances_once(session):
+    member_id = MemberId()
+    repo = credit_repository.CreditRepository(session)
+    repo.add(make_credit(member_id, 2))
+    session.commit()
+
+    assert credit_service.write_snapshots(CreditUnitOfWork(lambda: session)) == 1
+    assert credit_service.write_snapshots(CreditUnitOfWork(lambda: session)) == 0
+    assert repo.balance_as_of(member_id, datetime.now()) == 2
+
+
+def test_export_ledger_writes_one_file_per_day(sqlite_session_factory, tmp_path):
+    session = sqlite_session_factory()
+    repo = credit_repository.CreditRepository(session)
+    start = datetime(2024, 1, 1, 12)
+    for hours in [0, 1, 24, 72]:
+        credit = make_credit(MemberId(), 1)
+        credit.date_of_transaction = start + timedelta(hours=hours)
+        repo.add(credit)
+    session.commit()
+
+    counts = credit_service.export_ledger(
+        CreditUnitOfWork(sqlite_session_factory),
+        tmp_path,
+        start=start,
+        end=start + timedelta(days=3),
+        batch_size=2,
+    )
+
+    assert counts == {"2024-01-01": 2, "2024-01-02": 1}
+    with open(
+        tmp_path / "credits_2024-01-01.csv", newline="", encoding="utf-8"
+    ) as file:
+        rows = list(csv.DictReader(file))
+    assert [row["amount"] for row in rows] == ["1", "1"]
+    with open(tmp_path / "credits_2024-01-02.csv", "rb") as file:
+        assert file.read().count(b"\r\n") == 2
+    assert rows[0]["transaction_type"] == "WORK_SUBMITTED"
@@ -3,6 +3,7 @@ from sqlalchemy import text
 
 from critique_wheel.adapters.sqlalchemy import critique_repository
 from critique_wheel.critiques.value_objects import CritiqueId
+from tests.helpers import db_id
 
 pytestmark = pytest.mark.usefixtures("mappers")
 
@@ -19,19 +20,19 @@ def test_repository_can_save_a_critique(session, valid_critique):
             text(
                 "SELECT id, critique_about, critique_successes, critique_weaknesses, critique_ideas, member_id, work_id, status FROM critiques WHERE id=:id"
             ).bindparams(
-                id=critique.id.get_uuid(),
+                id=db_id(critique.id),
             )
         )
     )
     assert rows == [
         (
-            critique.id.get_uuid(),
+            db_id(critique.id),
             str(critique.critique_about),
             str(critique.critique_successes),
             str(critique.critique_weaknesses),
             str(critique.critique_ideas),
-            critique.member_id.get_uuid(),
-            critique.work_id.get_uuid(),
+            db_id(critique.member_id),
+            db_id(critique.work_id),
             critique.status.value,
         )
     ]
@@ -44,7 +45,7 @@ def test_repository_can_get_a_critique_by_id(session, valid_critique):
     repo.add(critique)
     session.commit()
 
-    id_to_get = critique.id.get_uuid()
+    id_to_get = db_id(critique.id)
     stmt = text(
         'SELECT id, critique_about, critique_successes, critique_weaknesses, critique_ideas, member_id, work_id, status FROM "critiques" WHERE id=:id_to_get'
     ).bindparams(id_to_get=id_to_get)
@@ -52,13 +53,13 @@ def test_repository_can_get_a_critique_by_id(session, valid_critique):
     rows = session.execute(stmt).fetchall()
     assert rows == [
         (
-            critique.id.get_uuid(),
+            db_id(critique.id),
             str(critique.critique_about),
             str(critique.critique_successes),
             str(critique.critique_weaknesses),
             str(critique.critique_ideas),
-            critique.member_id.get_uuid(),
-            critique.work_id.get_uuid(),
+            db_id(critique.member_id),
+            db_id(critique.work_id),
             critique.status.value,
         )
     ]
@@ -0,0 +1,129 @@
+import pytest
+import sqlalchemy
+
+from critique_wheel.critiques.services import critique_service
+from critique_wheel.critiques.services.unit_of_work import CritiqueUnitOfWork
+from critique_wheel.critiques.value_objects import CritiqueStatus
+from critique_wheel.infrastructure import migrations
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.works.exceptions import exceptions
+from critique_wheel.works.value_objects import WorkStatus
+from tests.helpers import db_id
+
+pytestmark = pytest.mark.usefixtures("mappers")
+
+TEXT = "Word " * 45
+
+
+def save_active_work(session_factory, work, critique_limit=None):
+    session = session_factory()
+    work.status = WorkStatus.ACTIVE
+    work.critique_limit = critique_limit
+    session.add(work)
+    session.commit()
+    work_id = str(work.id)
+    session.close()
+    return work_id
+
+
+def add_critique(session_factory, work_id, member_id=None):
+    return critique_service.add_critique(
+        CritiqueUnitOfWork(session_factory),
+        work_id=work_id,
+        member_id=member_id or str(MemberId()),
+        critique_about=TEXT,
+        critique_successes=TEXT,
+        critique_weaknesses=TEXT,
+        critique_ideas=TEXT,
+    )
+
+
+def get_counts(session_factory, work_id):
+    session = session_factory()
+    row = session.execute(
+        sqlalchemy.text(
+            "SELECT critique_count, active_critique_count FROM works WHERE id=:id"
+        ),
+        {"id": db_id(work_id)},
+    ).one()
+    session.close()
+    return tuple(row)
+
+
+def test_add_critique_increments_the_work_counters(sqlite_session_factory, valid_work):
+    work_id = save_active_work(sqlite_session_factory, valid_work)
+
+    add_critique(sqlite_session_factory, work_id)
+    add_critique(sqlite_session_factory, work_id)
+
+    assert get_counts(sqlite_session_factory, work_id) == (2, 2)
+
+
+def test_second_critique_by_the_same_member_is_rejected(
+    sqlite_session_factory, valid_work
+):
+    work_id = save_active_work(sqlite_session_factory, valid_work)
+    member_id = str(MemberId())
+    add_critique(sqlite_session_factory, work_id, member_id)
+
+    with pytest.raises(exceptions.CritiqueDuplicateError):
+        add_critique(sqlite_session_factory, work_id, member_id)
+
+    # The counter bump was rolled back with the failed insert.
+    assert get_counts(sqlite_session_factory, work_id) == (1, 1)
+
+
+def test_critique_limit_is_enforced(sqlite_session_factory, valid_work):
+    work_id = save_active_work(sqlite_session_factory, valid_work, critique_limit=1)
+    add_critique(sqlite_session_factory, work_id)
+
+    with pytest.raises(exceptions.CritiqueLimitReachedError):
+        add_critique(sqlite_session_factory, work_id)
+
+    assert get_counts(sqlite_session_factory, work_id) == (1, 1)
+
+
+def test_inactive_or_unknown_works_cannot_be_critiqued(
+    sqlite_session_factory, valid_work
+):
+    session = sqlite_session_factory()
+    session.add(valid_work)
+    session.commit()
+    work_id = str(valid_work.id)
+    session.close()
+
+    with pytest.raises(exceptions.WorkNotAvailableForCritiqueError):
+        add_critique(sqlite_session_factory, work_id)
+    with pytest.raises(critique_service.WorkNotFoundError):
+        add_critique(sqlite_session_factory, str(MemberId()))
+
+
+def test_status_change_updates_the_active_count(sqlite_session_factory, valid_work):
+    work_id = save_active_work(sqlite_session_factory, valid_work)
+    critique = add_critique(sqlite_session_factory, work_id)
+
+    critique_service.change_critique_status(
+        CritiqueUnitOfWork(sqlite_session_factory),
+        critique["id"],
+        CritiqueStatus.ARCHIVED.value,
+    )
+
+    assert get_counts(sqlite_session_factory, work_id) == (1, 0)
+
+
+def test_backfill_recounts_critiques(
+    in_memory_sqlite_db, sqlite_session_factory, valid_work
+):
+    work_id = save_active_work(sqlite_session_factory, valid_work)
+    add_critique(sqlite_session_factory, work_id)
+    add_critique(sqlite_session_factory, work_id)
+    with in_memory_sqlite_db.begin() as connection:
+        connection.execute(
+            sqlalchemy.text(
+                "UPDATE works SET critique_count = 0, active_critique_count = 0"
+            )
+        )
+
+    migrations.backfill_critique_counts(in_memory_sqlite_db)
+
+    assert get_counts(sqlite_session_factory, work_id) == (2, 2)
@@ -0,0 +1,77 @@
+import pytest
+
+from critique_wheel.adapters.sqlalchemy import export_repository
+from critique_wheel.works.value_objects import WorkStatus
+
+pytestmark = pytest.mark.usefixtures("mappers")
+
+
+def save(session, *entities):
+    session.add_all(entities)
+    session.commit()
+
+
+def test_works_export_uses_the_work_dict_shape_and_resumes_after_an_id(
+    session, valid_work, another_valid_work, valid_critique
+):
+    valid_work.status = WorkStatus.ACTIVE
+    valid_critique.work_id = valid_work.id
+    valid_work.add_critique(valid_critique)
+    work_id, critique_id = str(valid_work.id), str(valid_critique.id)
+    ids = sorted([work_id, str(another_valid_work.id)])
+    save(session, valid_work, another_valid_work)
+    repository = export_repository.ExportRepository(session)
+
+    records = list(repository.iter_records("works", batch_size=1))
+
+    assert sorted(record["id"] for record in records) == ids
+    by_id = {record["id"]: record for record in records}
+    assert by_id[work_id]["critiques"] == [critique_id]
+    assert by_id[work_id]["content"] == "Test content"
+    resumed = list(repository.iter_records("works", after=records[0]["id"]))
+    assert resumed == records[1:]
+
+
+def test_members_export_leaves_out_passwords(session, valid_member):
+    member_id = str(valid_member.id)
+    save(session, valid_member)
+
+    (record,) = export_repository.ExportRepository(session).iter_records("members")
+
+    assert record["id"] == member_id
+    assert "password" not in record
+
+
+def test_core_exports_serialise_value_objects(session, valid_rating):
+    rating_id = str(valid_rating.id)
+    save(session, valid_rating)
+
+    (record,) = export_repository.ExportRepository(session).iter_records("ratings")
+
+    assert record["id"] == rating_id
+    assert record["score"] == 5
+    assert record["status"] == "ACTIVE"
+    assert record["comment"] == "This is a test rating."
+
+
+def test_unknown_exports_are_rejected(session):
+    with pytest.raises(export_repository.UnknownExportError):
+        list(export_repository.ExportRepository(session).iter_records("passwords"))
+
+
+@pytest.mark.anyio
+async def test_async_export_streams_the_same_records(
+    async_sqlite_session_factory, valid_work, another_valid_work
+):
+    ids = {str(valid_work.id), str(another_valid_work.id)}
+    async with async_sqlite_session_factory() as session:
+        session.add_all([valid_work, another_valid_work])
+        await session.commit()
+        records = [
+            record
+            async for record in export_repository.AsyncExportRepository(
+                session
+            ).stream_records("works", batch_size=1)
+        ]
+
+    assert {record["id"] for record in records} == ids
@@ -0,0 +1,118 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import clear_mappers
+
+from critique_wheel.adapters.orm import start_mappers
+from critique_wheel.adapters.sqlalchemy import iam_repository, work_repository
+from critique_wheel.members.models.IAM import Member
+from critique_wheel.works.models.work import Work
+from critique_wheel.works.value_objects import Content, Title
+
+
+@contextmanager
+def count_queries(engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def add_members_with_works(session, count):
+    for number in range(count):
+        member = Member.create(
+            username=f"username_{number}",
+            email=f"email_{number}@davidnevin.net",
+            password="secure_unguessab1e_p@ssword",
+        )
+        member.works.append(
+            Work.create(
+                title=Title(f"Title {number}"),
+                content=Content("Some content"),
+                member_id=member.id,
+            )
+        )
+        session.add(member)
+    session.commit()
+    session.expunge_all()
+
+
+@pytest.mark.usefixtures("mappers")
+@pytest.mark.parametrize("count", [2, 20])
+def test_listing_members_uses_a_fixed_number_of_queries(
+    in_memory_sqlite_db, session, count
+):
+    add_members_with_works(session, count)
+    repo = iam_repository.MemberRepository(session)
+
+    with count_queries(in_memory_sqlite_db) as statements:
+        members = repo.list()
+        # The collections Member.to_dict() serialises.
+        works = [work for member in members for work in member.works]
+        critiques = [critique for member in members for critique in member.critiques]
+
+    assert len(works) == count
+    assert critiques == []
+    # One query for the members and one per selectin loaded collection.
+    assert len(statements) == 3
+
+
+@pytest.mark.usefixtures("mappers")
+def test_joined_loading_plan_fetches_work_and_critiques_in_one_query(
+    in_memory_sqlite_db, session, valid_work, valid_critique
+):
+    work_id = valid_work.id
+    valid_work.critiques.append(valid_critique)
+    session.add(valid_work)
+    session.commit()
+    session.expunge_all()
+    repo = work_repository.WorkRepository(session)
+
+    with count_queries(in_memory_sqlite_db) as statements:
+        work = repo.get_work_by_id(work_id, loading={"critiques": "joined"})
+        assert len(work.critiques) == 1
+
+    assert len(statements) == 1
+
+
+@pytest.mark.usefixtures("mappers")
+def test_raise_loading_plan_rejects_unplanned_access(session):
+    add_members_with_works(session, 1)
+    repo = iam_repository.MemberRepository(session)
+
+    member = repo.list(loading={"works": "raise", "critiques": "selectin"})[0]
+
+    assert member.critiques == []
+    with pytest.raises(InvalidRequestError):
+        member.works
+
+
+@pytest.mark.usefixtures("mappers")
+def test_unknown_loading_strategy_is_rejected(session):
+    with pytest.raises(ValueError):
+        iam_repository.MemberRepository(session).list(loading={"works": "eager"})
+
+
+@pytest.fixture
+def raising_mappers():
+    start_mappers(lazy="raise")
+    yield
+    clear_mappers()
+
+
+@pytest.mark.usefixtures("raising_mappers")
+def test_raise_default_turns_accidental_lazy_loads_into_errors(session):
+    add_members_with_works(session, 1)
+
+    member = session.query(Member).one()
+
+    with pytest.raises(InvalidRequestError):
+        member.works
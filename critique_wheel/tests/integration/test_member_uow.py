@@ -2,7 +2,8 @@ from uuid import uuid4
 
 import pytest
 
-from critique_wheel.members.models.IAM import MemberRole, MemberStatus
+from critique_wheel.members.models.IAM import Member, MemberRole, MemberStatus
+from critique_wheel.members.services import exceptions as service_exceptions
 from critique_wheel.members.services.unit_of_work import IAMUnitOfWork
 from tests.helpers import get_member_by_id, insert_member
 
@@ -88,3 +89,39 @@ def test_rolls_back_on_errors(sqlite_session_factory):
 
     member = get_member_by_id(session, id)
     assert member.username == "test_username"
+
+
+def test_commit_rejects_a_duplicate_email(sqlite_session_factory, valid_member):
+    email = valid_member.email
+    uow = IAMUnitOfWork(sqlite_session_factory)
+    with uow:
+        uow.members.add(valid_member)
+        uow.commit()
+
+    duplicate = Member.create(
+        username="another_username",
+        email=email,
+        password="secure_unguessab1e_p@ssword",
+    )
+    with pytest.raises(service_exceptions.DuplicateEntryError):
+        with uow:
+            uow.members.add(duplicate)
+            uow.commit()
+
+
+def test_commit_rejects_a_duplicate_username(sqlite_session_factory, valid_member):
+    username = valid_member.username
+    uow = IAMUnitOfWork(sqlite_session_factory)
+    with uow:
+        uow.members.add(valid_member)
+        uow.commit()
+
+    duplicate = Member.create(
+        username=username,
+        email="another_email@davidnevin.net",
+        password="secure_unguessab1e_p@ssword",
+    )
+    with pytest.raises(service_exceptions.DuplicateUsernameError):
+        with uow:
+            uow.members.add(duplicate)
+            uow.commit()
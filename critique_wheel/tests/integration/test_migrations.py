@@ -0,0 +1,70 @@
+from uuid import uuid4
+
+import pytest
+import sqlalchemy
+
+from critique_wheel.infrastructure import database, migrations
+from critique_wheel.members.models.IAM import Member
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.works.models.work import Work
+from tests.helpers import db_id
+
+pytestmark = pytest.mark.usefixtures("mappers")
+
+
+def insert_legacy_rows(session, member_id, work_id):
+    session.execute(
+        sqlalchemy.text(
+            "INSERT INTO members (id, username, email, password) "
+            "VALUES (:id, 'legacy', 'legacy@davidnevin.net', 'p@ssword')"
+        ),
+        {"id": member_id},
+    )
+    session.execute(
+        sqlalchemy.text(
+            "INSERT INTO works (id, title, content, member_id) "
+            "VALUES (:id, 'Legacy Title', 'Legacy content', :member_id)"
+        ),
+        {"id": work_id, "member_id": member_id},
+    )
+    session.commit()
+
+
+def test_legacy_text_ids_are_still_readable(session):
+    member_id = str(uuid4())
+    insert_legacy_rows(session, member_id, str(uuid4()))
+
+    member = session.query(Member).one()
+
+    assert member.id == MemberId.from_string(member_id)
+
+
+def test_check_schema_migrates_legacy_text_ids(
+    in_memory_sqlite_db, sqlite_session_factory
+):
+    session = sqlite_session_factory()
+    member_id, work_id = str(uuid4()), str(uuid4())
+    insert_legacy_rows(session, member_id, work_id)
+    assert set(migrations.get_legacy_uuid_columns(in_memory_sqlite_db)) == {
+        ("members", "id"),
+        ("works", "id"),
+        ("works", "member_id"),
+    }
+
+    database.check_schema(in_memory_sqlite_db, create_missing=True)
+
+    assert migrations.get_legacy_uuid_columns(in_memory_sqlite_db) == []
+    stored_id = session.execute(sqlalchemy.text("SELECT member_id FROM works")).scalar()
+    assert stored_id == db_id(member_id)
+    work = (
+        session.query(Work).filter_by(member_id=MemberId.from_string(member_id)).one()
+    )
+    assert str(work.id) == work_id
+
+
+def test_check_schema_raises_on_legacy_ids_when_creation_is_off(
+    in_memory_sqlite_db, sqlite_session_factory
+):
+    insert_legacy_rows(sqlite_session_factory(), str(uuid4()), str(uuid4()))
+    with pytest.raises(database.SchemaMismatchError):
+        database.check_schema(in_memory_sqlite_db, create_missing=False)
@@ -2,10 +2,31 @@ import pytest
 from sqlalchemy import text
 
 from critique_wheel.adapters.sqlalchemy import rating_repository
+from critique_wheel.critiques.value_objects import CritiqueId
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.ratings.models.rating import Rating
+from critique_wheel.ratings.models.rating_repository import RatedCritiqueNotFoundError
+from critique_wheel.ratings.services import rating_service
+from critique_wheel.ratings.services.unit_of_work import RatingUnitOfWork
+from critique_wheel.ratings.value_objects import RatingAggregate, RatingComment
+from tests.helpers import db_id
 
 pytestmark = pytest.mark.usefixtures("mappers")
 
 
+@pytest.fixture
+def valid_rating(session, valid_critique):
+    # Ratings fold into their critic's aggregate, so the critique must exist;
+    # it is left pending for the repository to flush.
+    session.add(valid_critique)
+    yield Rating.create(
+        member_id=MemberId(),
+        score=5,
+        comment=RatingComment("This is a test rating."),
+        critique_id=valid_critique.id,
+    )
+
+
 def test_repository_can_save_a_rating(session, valid_rating):
     rating = valid_rating
     repo = rating_repository.RatingRepository(session)
@@ -21,11 +42,11 @@ def test_repository_can_save_a_rating(session, valid_rating):
     )
     assert rows == [
         (
-            rating.id.get_uuid(),
+            db_id(rating.id),
             int(rating.score),
             str(rating.comment),
-            rating.member_id.get_uuid(),
-            rating.critique_id.get_uuid(),
+            db_id(rating.member_id),
+            db_id(rating.critique_id),
             rating.status.value,
         )
     ]
@@ -46,7 +67,7 @@ def test_repository_can_get_a_rating_by_id(session, valid_rating):
     repo.add(rating)
     session.commit()
 
-    id_to_get = rating.id.get_uuid()
+    id_to_get = db_id(rating.id)
     stmt = text(
         'SELECT id, score, comment, critique_id, member_id, status FROM "ratings" WHERE id=:id_to_get'
     ).bindparams(id_to_get=id_to_get)
@@ -54,11 +75,83 @@ def test_repository_can_get_a_rating_by_id(session, valid_rating):
     rows = session.execute(stmt).fetchall()
     assert rows == [
         (
-            rating.id.get_uuid(),
+            db_id(rating.id),
             int(rating.score),
             str(rating.comment),
-            rating.critique_id.get_uuid(),
-            rating.member_id.get_uuid(),
+            db_id(rating.critique_id),
+            db_id(rating.member_id),
             rating.status.value,
         )
     ]
+
+
+def test_rating_an_unknown_critique_raises(session):
+    rating = Rating.create(
+        member_id=MemberId(),
+        score=4,
+        comment=RatingComment("A rating of nothing."),
+        critique_id=CritiqueId(),
+    )
+    repo = rating_repository.RatingRepository(session)
+    with pytest.raises(RatedCritiqueNotFoundError):
+        repo.add(rating)
+
+
+def test_critic_aggregate_counts_a_critique_pending_in_the_session(
+    session, valid_rating, valid_critique
+):
+    repo = rating_repository.RatingRepository(session)
+    repo.add(valid_rating)
+    session.commit()
+    assert repo.get_critic_aggregate(valid_critique.member_id).rating_count == 1
+
+
+def save_critique(session, critique):
+    session.add(critique)
+    session.commit()
+    return str(critique.id), critique.member_id
+
+
+def test_rating_aggregates_follow_adds_updates_archives_and_restores(
+    sqlite_session_factory, valid_critique
+):
+    critique_id, critic_id = save_critique(sqlite_session_factory(), valid_critique)
+    uow = RatingUnitOfWork(sqlite_session_factory)
+    rating = rating_service.add_rating(uow, critique_id, str(MemberId()), 5)
+    rating_service.add_rating(uow, critique_id, str(MemberId()), 2)
+
+    rating_service.update_score(uow, rating["id"], 4)
+    with uow:
+        aggregate = uow.ratings.get_critique_aggregate(valid_critique.id)
+        assert uow.ratings.get_critic_aggregate(critic_id) == aggregate
+    assert aggregate == RatingAggregate(2, 6, (0, 1, 0, 1, 0))
+
+    rating_service.archive_rating(uow, rating["id"])
+    with uow:
+        assert uow.ratings.get_critique_aggregate(valid_critique.id) == (
+            RatingAggregate(1, 2, (0, 1, 0, 0, 0))
+        )
+
+    rating_service.restore_rating(uow, rating["id"])
+    with uow:
+        assert uow.ratings.get_critic_aggregate(critic_id).average == 3.0
+
+
+def test_rebuild_matches_the_incremental_aggregates(
+    sqlite_session_factory, valid_critique
+):
+    critique_id, critic_id = save_critique(sqlite_session_factory(), valid_critique)
+    uow = RatingUnitOfWork(sqlite_session_factory)
+    for score in (1, 3, 3, 5):
+        rating_service.add_rating(uow, critique_id, str(MemberId()), score)
+    with uow:
+        incremental = uow.ratings.get_critique_aggregate(valid_critique.id)
+        uow.session.execute(text("DELETE FROM critic_rating_aggregates"))
+        uow.commit()
+
+    assert rating_service.rebuild_aggregates(uow) == {"critiques": 1, "critics": 1}
+
+    with uow:
+        assert uow.ratings.get_critique_aggregate(valid_critique.id) == incremental
+        assert uow.ratings.get_critic_aggregate(critic_id) == incremental
+    assert incremental == RatingAggregate(4, 12, (1, 0, 2, 0, 1))
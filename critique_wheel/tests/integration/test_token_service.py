@@ -0,0 +1,131 @@
+import pytest
+
+from critique_wheel.infrastructure import tokens
+from critique_wheel.infrastructure.password_hasher import PasswordHasher
+from critique_wheel.members.services import async_iam_service
+from critique_wheel.members.services import exceptions as service_exceptions
+from critique_wheel.members.services.unit_of_work import AsyncIAMUnitOfWork
+
+pytestmark = [pytest.mark.anyio, pytest.mark.usefixtures("mappers")]
+
+EMAIL = "token_member@davidnevin.net"
+PASSWORD = "secure_unguessab1e_p@ssword"
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(max_workers=1)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.fixture
+def signer():
+    return tokens.TokenSigner("secret")
+
+
+@pytest.fixture
+def revocations():
+    return tokens.RevocationList()
+
+
+@pytest.fixture
+async def token_pair(async_sqlite_session_factory, hasher, signer):
+    await async_iam_service.add_member(
+        AsyncIAMUnitOfWork(async_sqlite_session_factory),
+        username="token_member",
+        email=EMAIL,
+        password=PASSWORD,
+        hasher=hasher,
+    )
+    return await async_iam_service.issue_tokens(
+        AsyncIAMUnitOfWork(async_sqlite_session_factory),
+        email=EMAIL,
+        password=PASSWORD,
+        hasher=hasher,
+        signer=signer,
+    )
+
+
+async def test_issue_tokens_embeds_member_role(token_pair, signer):
+    claims = signer.decode(token_pair["access_token"])
+    assert claims.role == "MEMBER"
+
+
+async def test_issue_tokens_rejects_wrong_password(
+    async_sqlite_session_factory, token_pair, hasher
+):
+    with pytest.raises(service_exceptions.InvalidCredentialsError):
+        await async_iam_service.issue_tokens(
+            AsyncIAMUnitOfWork(async_sqlite_session_factory),
+            email=EMAIL,
+            password="wrong_p@ssword1",
+            hasher=hasher,
+        )
+
+
+async def test_refresh_tokens_rotates_the_refresh_token(
+    async_sqlite_session_factory, token_pair, signer, revocations
+):
+    def refresh(refresh_token, revocations):
+        return async_iam_service.refresh_tokens(
+            AsyncIAMUnitOfWork(async_sqlite_session_factory),
+            refresh_token,
+            signer=signer,
+            revocations=revocations,
+        )
+
+    new_pair = await refresh(token_pair["refresh_token"], revocations)
+    assert signer.decode(new_pair["access_token"]).role == "MEMBER"
+
+    with pytest.raises(service_exceptions.InvalidTokenError):
+        await refresh(token_pair["refresh_token"], revocations)
+    # Another process has not seen the revocation yet; the database has.
+    with pytest.raises(service_exceptions.InvalidTokenError):
+        await refresh(token_pair["refresh_token"], tokens.RevocationList())
+
+
+async def test_revoke_tokens_persists_revocations(
+    async_sqlite_session_factory, token_pair, signer, revocations
+):
+    await async_iam_service.revoke_tokens(
+        AsyncIAMUnitOfWork(async_sqlite_session_factory),
+        token_pair["access_token"],
+        token_pair["refresh_token"],
+        signer=signer,
+        revocations=revocations,
+    )
+
+    with pytest.raises(tokens.RevokedTokenError):
+        tokens.authenticate(
+            token_pair["access_token"], signer=signer, revocations=revocations
+        )
+    other_process = tokens.RevocationList()
+    other_process.merge(
+        await async_iam_service.load_revoked_tokens(
+            AsyncIAMUnitOfWork(async_sqlite_session_factory)
+        )
+    )
+    assert len(other_process) == 2
+    access_claims = signer.decode(token_pair["access_token"])
+    assert access_claims.jti in other_process
+
+
+async def test_load_revoked_tokens_prunes_expired_rows(
+    async_sqlite_session_factory, token_pair, signer, revocations
+):
+    await async_iam_service.revoke_tokens(
+        AsyncIAMUnitOfWork(async_sqlite_session_factory),
+        token_pair["access_token"],
+        signer=signer,
+        revocations=revocations,
+    )
+    expires_at = signer.decode(token_pair["access_token"]).expires_at
+
+    revoked = await async_iam_service.load_revoked_tokens(
+        AsyncIAMUnitOfWork(async_sqlite_session_factory), now=expires_at
+    )
+
+    assert revoked == []
+    async with AsyncIAMUnitOfWork(async_sqlite_session_factory) as uow:
+        assert await uow.revoked_tokens.list_active(0) == []
@@ -0,0 +1,119 @@
+import pytest
+import sqlalchemy
+from sqlalchemy.orm import sessionmaker
+
+from critique_wheel.adapters.orm import mapper_registry
+from critique_wheel.credits.models.credit import CreditManager
+from critique_wheel.critiques.services import critique_service
+from critique_wheel.infrastructure.cache import LRUCache
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.unit_of_work import UnitOfWork
+from critique_wheel.works.exceptions import exceptions
+from critique_wheel.works.value_objects import WorkId
+from tests.helpers import create_and_insert_member, db_id
+from tests.integration.test_critique_service import TEXT, get_counts, save_active_work
+
+pytestmark = pytest.mark.usefixtures("mappers")
+
+
+def submit_critique(uow, work_id, member_id):
+    return critique_service.submit_critique(
+        uow,
+        work_id=work_id,
+        member_id=member_id,
+        critique_about=TEXT,
+        critique_successes=TEXT,
+        critique_weaknesses=TEXT,
+        critique_ideas=TEXT,
+    )
+
+
+def count_credits(session_factory, member_id):
+    session = session_factory()
+    count = session.execute(
+        sqlalchemy.text("SELECT count(*) FROM credits WHERE member_id=:id"),
+        {"id": db_id(member_id)},
+    ).scalar_one()
+    session.close()
+    return count
+
+
+def test_repositories_are_built_on_first_use_over_one_session(sqlite_session_factory):
+    uow = UnitOfWork(sqlite_session_factory)
+    with uow:
+        assert uow.repositories == {}
+        works = uow.works
+        assert uow.works is works
+        assert uow.credits.session is works.session is uow.session
+        assert set(uow.repositories) == {"works", "credits"}
+    with uow:
+        assert uow.repositories == {}
+        assert uow.works is not works
+
+
+def test_submit_critique_credits_the_critic_in_the_same_transaction(
+    sqlite_session_factory, valid_work
+):
+    word_count = valid_work.word_count
+    work_id = save_active_work(sqlite_session_factory, valid_work)
+    member_id = str(MemberId())
+
+    result = submit_critique(UnitOfWork(sqlite_session_factory), work_id, member_id)
+
+    assert result["credits"] == CreditManager.credits_for_critique(word_count)
+    assert result["balance"] == result["credits"]
+    assert get_counts(sqlite_session_factory, work_id) == (1, 1)
+    assert count_credits(sqlite_session_factory, member_id) == 1
+
+
+def test_rejected_critique_awards_no_credit(sqlite_session_factory, valid_work):
+    work_id = save_active_work(sqlite_session_factory, valid_work)
+    member_id = str(MemberId())
+    submit_critique(UnitOfWork(sqlite_session_factory), work_id, member_id)
+
+    with pytest.raises(exceptions.CritiqueDuplicateError):
+        submit_critique(UnitOfWork(sqlite_session_factory), work_id, member_id)
+
+    # The slot and the credit were rolled back with the failed insert.
+    assert get_counts(sqlite_session_factory, work_id) == (1, 1)
+    assert count_credits(sqlite_session_factory, member_id) == 1
+
+
+def test_commit_invalidates_the_critiqued_work(sqlite_session_factory, valid_work):
+    work_id = save_active_work(sqlite_session_factory, valid_work)
+    cache = LRUCache()
+    cache.set(WorkId.from_string(work_id), {"id": work_id})
+
+    submit_critique(
+        UnitOfWork(sqlite_session_factory, cache=cache), work_id, str(MemberId())
+    )
+
+    assert cache.get(WorkId.from_string(work_id)) is None
+
+
+@pytest.fixture
+def foreign_keys_session_factory():
+    engine = sqlalchemy.create_engine("sqlite://")
+    sqlalchemy.event.listen(
+        engine,
+        "connect",
+        lambda connection, _: connection.execute("PRAGMA foreign_keys=ON"),
+    )
+    mapper_registry.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def test_critique_is_written_before_the_credit_referencing_it(
+    foreign_keys_session_factory, valid_work
+):
+    session = foreign_keys_session_factory()
+    member_id = create_and_insert_member(session)
+    session.commit()
+    session.close()
+    valid_work.member_id = MemberId.from_string(member_id)
+    work_id = save_active_work(foreign_keys_session_factory, valid_work)
+
+    submit_critique(UnitOfWork(foreign_keys_session_factory), work_id, member_id)
+
+    assert count_credits(foreign_keys_session_factory, member_id) == 1
@@ -1,10 +1,21 @@
+from datetime import datetime, timedelta
+
 import pytest
 from sqlalchemy import text
 
 from critique_wheel.adapters.sqlalchemy import work_repository
 from critique_wheel.members.models.IAM import MemberStatus
 from critique_wheel.members.value_objects import MemberId
-from critique_wheel.works.value_objects import WorkId
+from critique_wheel.works.models.work import Work
+from critique_wheel.works.value_objects import (
+    Content,
+    Title,
+    WorkFilters,
+    WorkGenre,
+    WorkId,
+    WorkSummary,
+)
+from tests.helpers import db_id
 
 pytestmark = pytest.mark.usefixtures("mappers")
 
@@ -27,25 +38,25 @@ def test_repository_can_save_a_work(
         session.execute(
             text(
                 "SELECT id, title, content, age_restriction, genre, member_id FROM works WHERE member_id=:member_id"
-            ).bindparams(member_id=active_valid_member.id.get_uuid())
+            ).bindparams(member_id=db_id(active_valid_member.id))
         )
     )
     assert rows == [
         (
-            work.id.get_uuid(),
+            db_id(work.id),
             str(work.title),
             str(work.content),
             work.age_restriction.value,
             work.genre.value,
-            work.member_id.get_uuid(),
+            db_id(work.member_id),
         ),
         (
-            work_2.id.get_uuid(),
+            db_id(work_2.id),
             str(work_2.title),
             str(work_2.content),
             work_2.age_restriction.value,
             work_2.genre.value,
-            work.member_id.get_uuid(),
+            db_id(work.member_id),
         ),
     ]
 
@@ -59,16 +70,16 @@ def test_repository_can_get_a_work_by_work_id(session, valid_work):
     id_to_get = work.id
     stmt = text(
         "SELECT id, title, content, age_restriction, genre, member_id FROM works WHERE id=:id"
-    ).bindparams(id=work.id.get_uuid())
+    ).bindparams(id=db_id(work.id))
     rows = session.execute(stmt).fetchall()
     assert rows == [
         (
-            work.id.get_uuid(),
+            db_id(work.id),
             str(work.title),
             str(work.content),
             work.age_restriction.value,
             work.genre.value,
-            work.member_id.get_uuid(),
+            db_id(work.member_id),
         )
     ]
 
@@ -84,19 +95,19 @@ def test_repository_can_get_work_by_member_id(session, valid_work):
     repo.add(work)
     session.commit()
 
-    member_id_to_get = str(work.member_id)
+    member_id_to_get = db_id(work.member_id)
     stmt = text(
         "SELECT id, title, content, age_restriction, genre, member_id FROM works WHERE member_id=:member_id"
     ).bindparams(member_id=member_id_to_get)
     rows = session.execute(stmt).fetchall()
     assert rows == [
         (
-            work.id.get_uuid(),
+            db_id(work.id),
             str(work.title),
             str(work.content),
             work.age_restriction.value,
             work.genre.value,
-            work.member_id.get_uuid(),
+            db_id(work.member_id),
         )
     ]
 
@@ -110,3 +121,92 @@ def test_respository_returns_none_when_no_work_found(session):
     member_id = MemberId()
     assert repo.get_work_by_id(id) is None
     assert repo.get_work_by_member_id(member_id) is None
+
+
+def add_dated_works(repo, member_id, count, genre=WorkGenre.OTHER):
+    start = datetime(2024, 1, 1)
+    works = []
+    for day in range(count):
+        work = Work.create(
+            title=Title(f"Title {day}"),
+            content=Content("Some content"),
+            member_id=member_id,
+            genre=genre,
+            work_id=WorkId(),
+        )
+        work.submission_date = start + timedelta(days=day)
+        repo.add(work)
+        works.append(work)
+    return works
+
+
+def test_repository_pages_through_work_summaries_newest_first(session):
+    repo = work_repository.WorkRepository(session)
+    works = add_dated_works(repo, MemberId(), 5)
+    session.commit()
+    newest_first = [work.id for work in reversed(works)]
+
+    first_page = repo.list_summaries(WorkFilters(), limit=2)
+    second_page = repo.list_summaries(WorkFilters(), 2, first_page[-1].cursor)
+    last_page = repo.list_summaries(WorkFilters(), 2, second_page[-1].cursor)
+
+    assert [summary.id for summary in first_page] == newest_first[:2]
+    assert [summary.id for summary in second_page] == newest_first[2:4]
+    assert [summary.id for summary in last_page] == newest_first[4:]
+    assert isinstance(first_page[0], WorkSummary)
+    assert "content" not in first_page[0].to_dict()
+
+
+def test_repository_filters_work_summaries(session):
+    repo = work_repository.WorkRepository(session)
+    member_id = MemberId()
+    add_dated_works(repo, member_id, 2, genre=WorkGenre.HORROR)
+    add_dated_works(repo, MemberId(), 2, genre=WorkGenre.HORROR)
+    add_dated_works(repo, member_id, 3, genre=WorkGenre.FANTASY)
+    session.commit()
+
+    horror = repo.list_summaries(WorkFilters(genre=WorkGenre.HORROR), limit=10)
+    members_horror = repo.list_summaries(
+        WorkFilters(genre=WorkGenre.HORROR, member_id=member_id), limit=10
+    )
+
+    assert len(horror) == 4
+    assert len(members_horror) == 2
+    assert {summary.member_id for summary in members_horror} == {member_id}
+
+
+def test_repository_defers_work_content_until_requested(session, valid_work):
+    work_id, content = valid_work.id, valid_work.content
+    repo = work_repository.WorkRepository(session)
+    repo.add(valid_work)
+    session.commit()
+    session.expunge_all()
+
+    work = repo.get_work_by_id(work_id)
+    work.approve()
+    session.commit()
+
+    assert "content" not in work.__dict__
+    assert "content" not in work.to_dict(include_content=False)
+    assert repo.get_work_content(work_id) == content
+    assert repo.get_work_content(WorkId()) is None
+
+
+def test_add_many_keeps_the_rows_the_database_accepts(session, valid_work):
+    repo = work_repository.WorkRepository(session)
+    repo.add(valid_work)
+    session.commit()
+    new_work = Work.create(
+        title=Title("New Title"),
+        content=Content("New content"),
+        member_id=MemberId(),
+    )
+
+    failed = repo.add_many([new_work, valid_work])
+    session.commit()
+
+    assert [position for position, _ in failed] == [1]
+    assert repo.existing_ids([new_work.id, valid_work.id, WorkId()]) == {
+        new_work.id,
+        valid_work.id,
+    }
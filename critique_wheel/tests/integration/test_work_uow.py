@@ -3,7 +3,13 @@ from uuid import uuid4
 import pytest
 import sqlalchemy
 
+from critique_wheel.critiques.services import critique_service
+from critique_wheel.critiques.services.unit_of_work import CritiqueUnitOfWork
+from critique_wheel.infrastructure.cache import LRUCache
+from critique_wheel.works.services import work_service
 from critique_wheel.works.services.unit_of_work import WorkUnitOfWork
+from critique_wheel.works.value_objects import WorkStatus
+from tests.helpers import db_id
 
 pytestmark = pytest.mark.usefixtures("mappers")
 
@@ -15,7 +21,7 @@ def insert_member(session, **kwargs):
         VALUES (:id, :username, :email, :password)
         """
     )
-    params = kwargs
+    params = {**kwargs, "id": db_id(kwargs["id"])}
     session.execute(stmt, params)
 
 
@@ -39,7 +45,7 @@ def get_work_by_member_id(session, member_id):
         """
     )
     params = {
-        "member_id": member_id,
+        "member_id": db_id(member_id),
     }
     result = session.execute(stmt, params)
     row = result.fetchone()
@@ -68,5 +74,92 @@ def test_uow_can_create_and_retrieve_works(
 
     new_session = sqlite_session_factory()
     work = get_work_by_member_id(new_session, id)
-    assert id == work["member_id"]
+    assert db_id(id) == work["member_id"]
     assert "Test Title" == work["title"]
+
+
+def test_import_works_inserts_in_batches_and_skips_existing_ids(
+    sqlite_session_factory, valid_work
+):
+    session = sqlite_session_factory()
+    session.add(valid_work)
+    session.commit()
+    existing_id = str(valid_work.id)
+    session.close()
+    rows = [
+        {
+            "id": existing_id if number == 3 else None,
+            "title": f"Imported {number}",
+            "content": "Imported content",
+            "age_restriction": "ADULT",
+            "genre": "OTHER",
+            "member_id": str(uuid4()),
+        }
+        for number in range(5)
+    ]
+
+    report = work_service.import_works(
+        WorkUnitOfWork(sqlite_session_factory), rows, batch_size=2
+    )
+
+    assert report["imported"] == 4
+    assert [error["row"] for error in report["errors"]] == [3]
+    session = sqlite_session_factory()
+    titles = session.execute(
+        sqlalchemy.text("SELECT title FROM works WHERE title LIKE 'Imported%'")
+    ).scalars()
+    assert sorted(titles) == ["Imported 0", "Imported 1", "Imported 2", "Imported 4"]
+
+
+def test_commit_invalidates_cached_works_written_in_the_transaction(
+    sqlite_session_factory, valid_work, another_valid_work
+):
+    cache = LRUCache()
+    work_id, other_id = valid_work.id, another_valid_work.id
+    uow = WorkUnitOfWork(sqlite_session_factory, cache=cache)
+    with uow:
+        uow.works.add(valid_work)
+        uow.works.add(another_valid_work)
+        uow.commit()
+    work_service.get_work_by_id(str(work_id), uow)
+    work_service.get_work_by_id(str(other_id), uow)
+
+    with uow:
+        uow.works.get_work_by_id(work_id).status = WorkStatus.ACTIVE
+        uow.session.flush()
+        uow.rollback()
+    assert cache.get(work_id) is not None
+
+    with uow:
+        uow.works.get_work_by_id(work_id).status = WorkStatus.ACTIVE
+        uow.commit()
+
+    assert cache.get(work_id) is None
+    assert cache.get(other_id) is not None
+    assert work_service.get_work_by_id(str(work_id), uow)["status"] == "ACTIVE"
+
+
+def test_critique_commit_invalidates_the_critiqued_work(
+    sqlite_session_factory, valid_work
+):
+    cache = LRUCache()
+    valid_work.status = WorkStatus.ACTIVE
+    work_id = str(valid_work.id)
+    uow = WorkUnitOfWork(sqlite_session_factory, cache=cache)
+    with uow:
+        uow.works.add(valid_work)
+        uow.commit()
+    assert work_service.get_work_by_id(work_id, uow)["critiques"] == []
+
+    text = "Word " * 45
+    critique = critique_service.add_critique(
+        CritiqueUnitOfWork(sqlite_session_factory, cache=cache),
+        work_id=work_id,
+        member_id=str(uuid4()),
+        critique_about=text,
+        critique_successes=text,
+        critique_weaknesses=text,
+        critique_ideas=text,
+    )
+
+    assert work_service.get_work_by_id(work_id, uow)["critiques"] == [critique["id"]]
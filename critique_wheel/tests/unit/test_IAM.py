@@ -1,9 +1,11 @@
 import os
+from datetime import datetime, timedelta
 
 import pytest
 
 from critique_wheel.members.models import exceptions
 from critique_wheel.members.models.IAM import Member, MemberRole, MemberStatus
+from critique_wheel.members.models.permissions import compile_permissions
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 MOCK_YAML_PATH = os.path.join(CURRENT_DIR, "mock_rbac.yaml")
@@ -223,6 +225,66 @@ class TestRoles:
         )
         assert member.has_permission(action, resource) == expected
 
+    def test_loaded_roles_are_keyed_by_member_role(self, mock_roles):
+        assert MemberRole.ADMIN in Member.ROLES_AND_PERMISSIONS
+        assert ("read", "Works") in Member.ROLES_AND_PERMISSIONS[MemberRole.STAFF]
+
+    def test_compiled_permissions_are_immutable(self, mock_roles):
+        with pytest.raises(TypeError):
+            Member.ROLES_AND_PERMISSIONS[MemberRole.MEMBER] = frozenset()
+        with pytest.raises(AttributeError):
+            Member.ROLES_AND_PERMISSIONS[MemberRole.MEMBER].add(("delete", "Works"))
+
+    def test_wildcards_match_any_action_or_resource(self):
+        index = compile_permissions(
+            {
+                "ADMIN": [{"action": "*", "resource": "*"}],
+                "STAFF": [{"action": "read", "resource": "*"}],
+                "MEMBER": [{"action": "*", "resource": "Critiques"}],
+            },
+            role_type=MemberRole,
+        )
+
+        assert index.allows(MemberRole.ADMIN, "delete", "Members")
+        assert index.allows(MemberRole.STAFF, "read", "Members")
+        assert not index.allows(MemberRole.STAFF, "write", "Members")
+        assert index.allows(MemberRole.MEMBER, "write", "Critiques")
+        assert not index.allows(MemberRole.MEMBER, "write", "Works")
+
+    def test_roles_inherit_grants_from_parents(self):
+        index = compile_permissions(
+            {
+                "MEMBER": [{"action": "read", "resource": "Works"}],
+                "STAFF": {
+                    "inherits": ["MEMBER"],
+                    "permissions": [{"action": "write", "resource": "Critiques"}],
+                },
+                "ADMIN": {
+                    "inherits": ["STAFF"],
+                    "permissions": [{"action": "delete", "resource": "Works"}],
+                },
+            },
+            role_type=MemberRole,
+        )
+
+        assert index.allows(MemberRole.ADMIN, "read", "Works")
+        assert index.allows(MemberRole.ADMIN, "write", "Critiques")
+        assert index.allows(MemberRole.STAFF, "read", "Works")
+        assert not index.allows(MemberRole.STAFF, "delete", "Works")
+
+    def test_circular_inheritance_raises_value_error(self):
+        with pytest.raises(ValueError):
+            compile_permissions(
+                {
+                    "STAFF": {"inherits": ["ADMIN"]},
+                    "ADMIN": {"inherits": ["STAFF"]},
+                }
+            )
+
+    def test_unknown_role_raises_value_error(self):
+        with pytest.raises(ValueError):
+            compile_permissions({"GUEST": []}, role_type=MemberRole)
+
 
 class TestMemberContributions:
     def setup_method(self):
@@ -246,3 +308,31 @@ class TestMemberContributions:
         valid_work.critiques.append(valid_critique)
         reviewer.critiques.append(valid_critique)
         assert reviewer.list_critiques() == [valid_critique]
+
+
+class TestLoginLockout:
+    def test_member_is_locked_after_max_failed_attempts(self, member):
+        now = datetime(2024, 1, 1, 12, 0)
+        assert not member.record_failed_login(3, timedelta(minutes=30), now)
+        assert not member.record_failed_login(3, timedelta(minutes=30), now)
+        assert member.locked_for(now) is None
+
+        assert member.record_failed_login(3, timedelta(minutes=30), now)
+
+        assert member.locked_for(now) == timedelta(minutes=30)
+        assert member.locked_for(now + timedelta(minutes=30)) is None
+
+    def test_successful_login_clears_failed_attempts(self, member):
+        member.record_failed_login(3, timedelta(minutes=30))
+        member.record_successful_login()
+        assert member.failed_login_attempts == 0
+        assert member.locked_for() is None
+
+    def test_only_admin_can_unlock_member(self, member, admin):
+        member.record_failed_login(1, timedelta(minutes=30))
+        with pytest.raises(exceptions.AdminOnlyError):
+            member.unlock_member(member)
+
+        admin.unlock_member(member)
+
+        assert member.locked_for() is None
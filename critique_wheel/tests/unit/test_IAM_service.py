@@ -1,9 +1,19 @@
 import uuid
+from datetime import datetime, timedelta
 from uuid import uuid4
 
 import pytest
 
+from critique_wheel.infrastructure.throttle import (
+    LocalLockout,
+    LocalWindowCounter,
+    LoginThrottle,
+)
 from critique_wheel.members.models.IAM import MemberRole, MemberStatus
+from critique_wheel.members.models.password_policy import (
+    PasswordHashingPolicy,
+    get_password_policy,
+)
 from critique_wheel.members.services import exceptions as service_exceptions
 from critique_wheel.members.services import iam_service, unit_of_work
 from critique_wheel.members.value_objects import MemberId
@@ -72,6 +82,25 @@ def test_login_member_valid_credentials(member_details):
     assert uow.committed is True
 
 
+def test_login_member_rehashes_password_hashed_under_an_older_policy(member_details):
+    # Arrange
+    email = member_details["email"]
+    password = member_details["password"]
+    uow = FakeUnitOfWork()
+    iam_service.add_member(uow, member_details["username"], email, password)
+    member = uow.members.get_member_by_email(email)
+    old_policy = PasswordHashingPolicy(rounds=get_password_policy().rounds + 1)
+    member.password = old_policy.hash(password)
+
+    # Act
+    iam_service.login_member(uow, email, password)
+
+    # Assert
+    assert not get_password_policy().needs_rehash(member.password)
+    assert member.verify_password(password)
+    assert uow.committed is True
+
+
 def test_add_member_raises_InvalidCredentialsError_with_invalid_password(
     member_details,
 ):
@@ -126,6 +155,95 @@ def test_login_member_raises_InvalidCredentialsError_for_nonexistent_email(
         )
 
 
+def test_login_member_locks_account_after_repeated_failures(
+    member_details, monkeypatch
+):
+    email = member_details["email"]
+    password = member_details["password"]
+    uow = FakeUnitOfWork()
+    iam_service.add_member(uow, member_details["username"], email, password)
+    monkeypatch.setattr(iam_service.config, "LOGIN_MAX_FAILED_ATTEMPTS", 2)
+    for _ in range(2):
+        with pytest.raises(service_exceptions.InvalidCredentialsError):
+            iam_service.login_member(uow, email, "incorrect_password")
+    member = uow.members.get_member_by_email(email)
+
+    def verify_password(password):
+        raise AssertionError("Locked accounts must not reach the password hash")
+
+    monkeypatch.setattr(member, "verify_password", verify_password)
+
+    # Assert
+    with pytest.raises(service_exceptions.LoginThrottledError) as e:
+        iam_service.login_member(uow, email, password)
+    assert e.value.retry_after > 0
+
+
+def test_login_member_enforces_the_member_lock_without_a_throttle(
+    member_details, monkeypatch
+):
+    email = member_details["email"]
+    uow = FakeUnitOfWork()
+    password = member_details["password"]
+    iam_service.add_member(uow, member_details["username"], email, password)
+    monkeypatch.setattr(iam_service, "get_login_throttle", lambda: None)
+    monkeypatch.setattr(iam_service.config, "LOGIN_MAX_FAILED_ATTEMPTS", 1)
+    with pytest.raises(service_exceptions.InvalidCredentialsError):
+        iam_service.login_member(uow, email, "incorrect_password")
+
+    # Assert
+    assert uow.members.get_member_by_email(email).account_locked_until
+    with pytest.raises(service_exceptions.LoginThrottledError):
+        iam_service.login_member(uow, email, password)
+
+
+def test_login_member_enforces_a_persisted_lock_and_copies_it_to_the_email(
+    member_details,
+):
+    email = member_details["email"]
+    password = member_details["password"]
+    uow = FakeUnitOfWork()
+    iam_service.add_member(uow, member_details["username"], email, password)
+    # Locked by another process: this throttle has seen no failures.
+    uow.members.get_member_by_email(email).account_locked_until = (
+        datetime.now() + timedelta(seconds=600)
+    )
+    throttle = LoginThrottle(
+        LocalWindowCounter(300.0),
+        LocalWindowCounter(300.0),
+        lockout=LocalLockout(),
+    )
+
+    # Assert
+    with pytest.raises(service_exceptions.LoginThrottledError) as e:
+        iam_service.login_member(uow, email, password, throttle=throttle)
+    assert 599 <= e.value.retry_after <= 600
+    assert throttle.retry_after(email) == e.value.retry_after
+
+
+def test_login_member_rejects_throttled_address_before_reading_member(
+    member_details, monkeypatch
+):
+    email = member_details["email"]
+    uow = FakeUnitOfWork()
+    throttle = LoginThrottle(
+        LocalWindowCounter(300.0), LocalWindowCounter(300.0), address_limit=1
+    )
+    with pytest.raises(service_exceptions.InvalidCredentialsError):
+        iam_service.login_member(uow, email, "incorrect_password", "10.0.0.1", throttle)
+
+    def get_member_by_email(email):
+        raise AssertionError("Throttled logins must not read the member")
+
+    monkeypatch.setattr(uow.members, "get_member_by_email", get_member_by_email)
+
+    # Assert
+    with pytest.raises(service_exceptions.LoginThrottledError):
+        iam_service.login_member(
+            uow, email, member_details["password"], "10.0.0.1", throttle
+        )
+
+
 def test_register_new_member_with_valid_registration_returns_new_member(member_details):
     # Arrange
     username = member_details["username"]
@@ -326,6 +444,33 @@ def test_register_new_member_with_existing_username_raises_DuplicateUsernameErro
         )
 
 
+def test_register_duplicate_member_is_rejected_before_hashing(
+    member_details, monkeypatch
+):
+    uow = FakeUnitOfWork()
+    password = member_details["password"]
+    iam_service.register_member(
+        uow, member_details["username"], member_details["email"], password, password
+    )
+
+    def register(*args, **kwargs):
+        raise AssertionError("the password should not be hashed")
+
+    monkeypatch.setattr(iam_service.model.Member, "register", register)
+    with pytest.raises(service_exceptions.DuplicateEntryError):
+        iam_service.register_member(
+            uow, "another_username", member_details["email"], password, password
+        )
+    with pytest.raises(service_exceptions.DuplicateUsernameError):
+        iam_service.register_member(
+            uow,
+            member_details["username"],
+            "another_" + member_details["email"],
+            password,
+            password,
+        )
+
+
 def test_list_members(member_details):
     # Arrange
     uow = FakeUnitOfWork()
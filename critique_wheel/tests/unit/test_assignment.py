@@ -0,0 +1,121 @@
+from collections import Counter
+
+from critique_wheel.critiques.models.assignment import (
+    AssignableWork,
+    Critic,
+    assign_critiques,
+)
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.works.value_objects import WorkAgeRestriction, WorkGenre, WorkId
+
+
+def make_work(
+    author_id=None, genre=WorkGenre.FANTASY, age=WorkAgeRestriction.NONE, **kwargs
+):
+    return AssignableWork(
+        work_id=WorkId(),
+        author_id=author_id or MemberId(),
+        genre=genre,
+        age_restriction=age,
+        **kwargs,
+    )
+
+
+def test_critic_is_never_assigned_their_own_work():
+    member_id = MemberId()
+    own_work = make_work(author_id=member_id)
+    other_work = make_work()
+
+    assignments = assign_critiques([own_work, other_work], [Critic(member_id, owed=2)])
+
+    assert [a.work_id for a in assignments] == [other_work.work_id]
+
+
+def test_works_are_capped_at_the_critique_limit():
+    work = make_work(critique_count=3)
+    critics = [Critic(MemberId(), owed=1) for _ in range(5)]
+
+    assignments = assign_critiques([work], critics, critique_limit=5)
+
+    assert len(assignments) == 2
+
+
+def test_admin_limit_of_zero_closes_the_work():
+    work = make_work(critique_limit=0)
+
+    assert assign_critiques([work], [Critic(MemberId(), owed=1)]) == []
+
+
+def test_admin_raised_limit_overrides_the_default():
+    work = make_work(critique_count=5, critique_limit=7)
+    critics = [Critic(MemberId(), owed=1) for _ in range(5)]
+
+    assignments = assign_critiques([work], critics, critique_limit=5)
+
+    assert len(assignments) == 2
+
+
+def test_preferences_are_respected():
+    fantasy = make_work(genre=WorkGenre.FANTASY)
+    adult_horror = make_work(genre=WorkGenre.HORROR, age=WorkAgeRestriction.ADULT)
+    teen_horror = make_work(genre=WorkGenre.HORROR, age=WorkAgeRestriction.TEEN)
+    critic = Critic(
+        MemberId(),
+        owed=3,
+        genres=frozenset([WorkGenre.HORROR]),
+        age_restrictions=frozenset([WorkAgeRestriction.NONE, WorkAgeRestriction.TEEN]),
+    )
+
+    assignments = assign_critiques([fantasy, adult_horror, teen_horror], [critic])
+
+    assert [a.work_id for a in assignments] == [teen_horror.work_id]
+
+
+def test_critic_gets_no_work_twice_or_already_critiqued():
+    works = [make_work() for _ in range(3)]
+    critic = Critic(MemberId(), owed=5, critiqued=frozenset([works[0].work_id]))
+
+    assignments = assign_critiques(works, [critic])
+
+    assert sorted(str(a.work_id) for a in assignments) == sorted(
+        str(work.work_id) for work in works[1:]
+    )
+
+
+def test_load_and_critiques_are_spread_evenly():
+    works = [make_work() for _ in range(10)]
+    critics = [Critic(MemberId(), owed=10) for _ in range(4)]
+
+    assignments = assign_critiques(works, critics, critique_limit=2)
+
+    assert len(assignments) == 20
+    assert set(Counter(a.member_id for a in assignments).values()) == {5}
+    assert set(Counter(a.work_id for a in assignments).values()) == {2}
+
+
+def test_least_critiqued_work_is_assigned_first():
+    busy = make_work(critique_count=3)
+    quiet = make_work(critique_count=0)
+
+    assignments = assign_critiques([busy, quiet], [Critic(MemberId(), owed=1)])
+
+    assert assignments[0].work_id == quiet.work_id
+
+
+def test_only_works_open_for_critique_enter_the_pool(valid_work):
+    pending = AssignableWork.from_works([valid_work])
+    valid_work.approve()
+
+    assert pending == []
+    assert [work.work_id for work in AssignableWork.from_works([valid_work])] == [
+        valid_work.id
+    ]
+
+
+def test_the_pool_carries_each_works_admin_critique_limit(valid_work):
+    valid_work.approve()
+    valid_work.critique_limit = 7
+
+    (pending,) = AssignableWork.from_works([valid_work])
+
+    assert pending.critique_limit == 7
@@ -0,0 +1,76 @@
+from uuid import uuid4
+
+import pytest
+
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.works.services import async_work_service, unit_of_work
+from critique_wheel.works.services.work_service import DuplicateWorkError
+from tests.integration import fake_work_repository
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeAsyncUnitOfWork(unit_of_work.AbstractAsyncUnitOfWork):
+    def __init__(self):
+        self.works = fake_work_repository.FakeAsyncWorkRepository([])
+        self.committed = False
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        pass
+
+
+async def test_add_work(work_details):
+    uow = FakeAsyncUnitOfWork()
+    work = await async_work_service.add_work(
+        uow=uow,
+        work_id=str(uuid4()),
+        title=work_details["title"],
+        content=work_details["content"],
+        age_restriction=work_details["age_restriction"],
+        genre=work_details["genre"],
+        member_id=str(MemberId()),
+    )
+    assert uow.committed
+    assert work["title"] == "Test Title"
+    assert work["status"] == "PENDING REVIEW"
+
+
+async def test_cannot_add_work_with_duplicate_id(work_details):
+    uow = FakeAsyncUnitOfWork()
+    work_details["work_id"] = str(uuid4())
+    work_details["member_id"] = str(MemberId())
+    work_details.pop("status")
+    await async_work_service.add_work(uow=uow, **work_details)
+    with pytest.raises(DuplicateWorkError):
+        await async_work_service.add_work(uow=uow, **work_details)
+
+
+async def test_list_works_and_get_work_by_id(work_details):
+    uow = FakeAsyncUnitOfWork()
+    work_id = str(uuid4())
+    work_details["work_id"] = work_id
+    work_details["member_id"] = str(MemberId())
+    work_details.pop("status")
+    await async_work_service.add_work(uow=uow, **work_details)
+    works = await async_work_service.list_works(uow)
+    assert [work["id"] for work in works] == [work_id]
+    work = await async_work_service.get_work_by_id(work_id, uow)
+    assert work["id"] == work_id
+    assert await async_work_service.get_work_by_id(str(uuid4()), uow) is None
+
+
+async def test_get_work_content(work_details):
+    uow = FakeAsyncUnitOfWork()
+    work_id = str(uuid4())
+    work_details["work_id"] = work_id
+    work_details["member_id"] = str(MemberId())
+    work_details.pop("status")
+    await async_work_service.add_work(uow=uow, **work_details)
+
+    work = await async_work_service.get_work_by_id(work_id, uow, include_content=False)
+    assert "content" not in work
+    assert await async_work_service.get_work_content(work_id, uow) == "Test content"
+    assert await async_work_service.get_work_content(str(uuid4()), uow) is None
@@ -0,0 +1,134 @@
+import pytest
+
+from critique_wheel.infrastructure.cache import (
+    LocalSharedClient,
+    LRUCache,
+    NullCache,
+    SharedCache,
+    build_cache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_cache_evicts_least_recently_used_entry():
+    cache = LRUCache(max_size=2)
+    cache.set("a", {"id": "a"})
+    cache.set("b", {"id": "b"})
+    assert cache.get("a") == {"id": "a"}
+
+    cache.set("c", {"id": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"id": "a"}
+    assert cache.get("c") == {"id": "c"}
+    metrics = cache.metrics()
+    assert metrics["size"] == 2
+    assert metrics["evictions"] == 1
+    assert (metrics["hits"], metrics["misses"]) == (3, 1)
+
+
+def test_lru_cache_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = LRUCache(ttl=10, clock=clock)
+    cache.set("a", {"id": "a"})
+
+    clock.now = 9.9
+    assert cache.get("a") == {"id": "a"}
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.metrics()["evictions"] == 1
+    assert cache.size() == 0
+
+
+def test_invalidate_removes_entries_and_counts_them():
+    cache = LRUCache()
+    cache.set("a", {"id": "a"})
+    cache.set("b", {"id": "b"})
+
+    cache.invalidate(["a", "missing"])
+
+    assert cache.get("a") is None
+    assert cache.get("b") == {"id": "b"}
+    assert cache.metrics()["invalidations"] == 2
+
+
+def test_shared_cache_round_trips_json_and_expires_in_the_store():
+    clock = FakeClock()
+    client = LocalSharedClient(clock=clock)
+    cache = SharedCache(client, ttl=5)
+    other_process = SharedCache(client, ttl=5)
+
+    cache.set("a", {"id": "a", "critiques": ["c1"]})
+
+    assert other_process.get("a") == {"id": "a", "critiques": ["c1"]}
+    other_process.invalidate(["a"])
+    assert cache.get("a") is None
+    cache.set("b", {"id": "b"})
+    clock.now = 5
+    assert cache.get("b") is None
+
+
+@pytest.mark.parametrize(
+    "cache", [LRUCache(), SharedCache(LocalSharedClient())], ids=["lru", "shared"]
+)
+def test_set_is_dropped_when_the_key_was_invalidated_since_the_read(cache):
+    generation = cache.generation("a")
+    cache.invalidate(["a"])
+
+    cache.set("a", {"id": "a", "stale": True}, generation)
+
+    assert cache.get("a") is None
+    cache.set("a", {"id": "a"}, cache.generation("a"))
+    assert cache.get("a") == {"id": "a"}
+
+
+def test_shared_cache_ignores_an_entry_written_after_it_was_invalidated():
+    client = LocalSharedClient()
+    cache = SharedCache(client)
+    generation = cache.generation("a")
+    # Another process invalidates between this reader's check and its write.
+    SharedCache(client).invalidate(["a"])
+    client.set(
+        cache._name("a"),
+        b'{"generation": %d, "value": {"id": "a"}}' % generation,
+    )
+
+    assert cache.get("a") is None
+
+
+def test_local_shared_client_rejects_fractional_expiries_like_redis():
+    client = LocalSharedClient()
+    with pytest.raises(TypeError):
+        client.set("a", b"1", ex=1.5)
+    client.set("a", b"1", ex=2)
+    with pytest.raises(TypeError):
+        client.expire("a", 0.5)
+
+
+def test_shared_cache_passes_whole_seconds_to_the_store():
+    cache = SharedCache(LocalSharedClient(), ttl=0.5)
+    cache.set("a", {"id": "a"})
+    assert cache.get("a") == {"id": "a"}
+
+
+def test_null_cache_never_hits():
+    cache = NullCache()
+    cache.set("a", {"id": "a"})
+    assert cache.get("a") is None
+    assert cache.metrics()["misses"] == 1
+
+
+def test_build_cache_selects_backend():
+    assert isinstance(build_cache("memory", max_size=3), LRUCache)
+    assert isinstance(build_cache("none"), NullCache)
+    shared = build_cache("shared")
+    assert isinstance(shared.client, LocalSharedClient)
+    with pytest.raises(ValueError):
+        build_cache("memcached")
@@ -1,8 +1,12 @@
+import os
+import time
 from datetime import datetime
 
 import pytest
 
+from critique_wheel.credits.models import credit
 from critique_wheel.credits.models.credit import CreditManager, TransactionType
+from critique_wheel.credits.models.credit_rules import CreditTiers
 
 # Mock database setup
 mock_db = {
@@ -293,3 +297,108 @@ class TestTransactionType:
         assert CreditManager.credits_for_critique(3500) == 1.5
         assert CreditManager.credits_for_critique(4500) == 2
         assert CreditManager.credits_for_critique(6000) == 2.5
+
+
+@pytest.fixture
+def credit_rules_file(tmp_path):
+    def write(submission_credits):
+        path = tmp_path / "credit_rules.yaml"
+        path.write_text(
+            f"""
+            rules:
+              submission:
+                - max_words: 3000
+                  credits: {submission_credits}
+                - max_words: max
+                  credits: 5
+              critique:
+                - max_words: 3000
+                  credits: 1
+                - max_words: max
+                  credits: 2
+            """
+        )
+        return path
+
+    yield write
+    CreditManager.load_credit_rules_from_yaml()
+
+
+class TestCompiledCreditRules:
+    rules = [
+        {"max_words": 3000, "credits": 3},
+        {"max_words": 2000, "credits": 9},
+        {"max_words": 5000, "credits": 4},
+        {"max_words": "max", "credits": 5},
+        {"max_words": 9000, "credits": 9},
+    ]
+
+    def linear_lookup(self, word_count):
+        for setting in self.rules:
+            if setting["max_words"] == "max" or word_count < setting["max_words"]:
+                return setting["credits"]
+
+    def test_compiled_tiers_match_walking_the_rules(self):
+        tiers = CreditTiers.compile(self.rules)
+
+        for word_count in [0, 1999, 2000, 2999, 3000, 4999, 5000, 10000]:
+            assert tiers.credits_for(word_count) == self.linear_lookup(word_count)
+
+    def test_tiers_without_max_rule_return_none_beyond_last_limit(self):
+        tiers = CreditTiers.compile([{"max_words": 3000, "credits": 3}])
+
+        assert tiers.credits_for(2999) == 3
+        assert tiers.credits_for(3000) is None
+
+    def test_batch_pricing_matches_single_lookups(self):
+        word_counts = list(range(0, 12000, 250))
+
+        assert CreditManager.credits_for_submissions(word_counts) == [
+            CreditManager.credits_for_submission(count) for count in word_counts
+        ]
+        assert CreditManager.credits_for_critiques(word_counts) == [
+            CreditManager.credits_for_critique(count) for count in word_counts
+        ]
+
+    def test_changed_rules_file_is_reloaded(self, credit_rules_file):
+        path = credit_rules_file(3)
+        CreditManager.load_credit_rules_from_yaml(filepath=path)
+        assert CreditManager.credits_for_submission(100) == 3
+
+        credit_rules_file(7)
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert CreditManager.reload_credit_rules_if_changed()
+        assert CreditManager.credits_for_submission(100) == 7
+
+    def test_unchanged_rules_file_is_not_reloaded(self, credit_rules_file):
+        CreditManager.load_credit_rules_from_yaml(filepath=credit_rules_file(3))
+
+        assert not CreditManager.reload_credit_rules_if_changed()
+
+    def test_invalid_rules_file_keeps_current_rules(self, credit_rules_file):
+        path = credit_rules_file(3)
+        CreditManager.load_credit_rules_from_yaml(filepath=path)
+
+        path.write_text("rules:\n  submission: []\n")
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert not CreditManager.reload_credit_rules_if_changed()
+        assert CreditManager.credits_for_submission(100) == 3
+
+    def test_pricing_checks_for_changes_after_reload_interval(
+        self, credit_rules_file, monkeypatch
+    ):
+        monkeypatch.setattr(credit.config, "CREDIT_RULES_RELOAD_INTERVAL", 0.05)
+        path = credit_rules_file(3)
+        CreditManager.load_credit_rules_from_yaml(filepath=path)
+        credit_rules_file(7)
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert CreditManager.credits_for_submission(100) == 3
+
+        time.sleep(0.1)
+        assert CreditManager.credits_for_submission(100) == 7
@@ -1,12 +1,22 @@
+import uuid
+
 import pytest
 
 # Throwaway test file for testing ORM functionality
+from critique_wheel.adapters import orm_domain_types
 from critique_wheel.credits.models.credit import CreditManager, TransactionType
 from critique_wheel.critiques.models.critique import Critique
+from critique_wheel.hydration import trusted
 from critique_wheel.members.models.IAM import Member, MemberRole, MemberStatus
 from critique_wheel.ratings.models.rating import Rating
 from critique_wheel.works.models.work import Work
-from critique_wheel.works.value_objects import WorkAgeRestriction, WorkGenre, WorkStatus
+from critique_wheel.works.value_objects import (
+    Title,
+    WorkAgeRestriction,
+    WorkGenre,
+    WorkId,
+    WorkStatus,
+)
 
 pytestmark = pytest.mark.usefixtures("mappers")
 
@@ -168,3 +178,16 @@ def test_credit_and_member_relationship(
     assert retrieved_credit.amount == 5
     assert retrieved_credit.transaction_type == TransactionType.CRITIQUE_GIVEN
     assert retrieved_credit.critique_id == new_critique.id
+
+
+def test_orm_types_hydrate_without_revalidating():
+    # Rows were validated on the way in; a title written under an older,
+    # looser rule must still load.
+    long_title = "t" * 150
+    title = orm_domain_types.TitleType().process_result_value(long_title, None)
+    assert title == trusted(Title, value=long_title)
+    work_id = orm_domain_types.WorkUUIDType().process_result_value(
+        uuid.uuid4().bytes, None
+    )
+    assert isinstance(work_id, WorkId)
+    assert work_id == WorkId(id=work_id.id)
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from critique_wheel.infrastructure.password_hasher import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+    yield hasher
+    hasher.shutdown()
+
+
+async def test_hash_and_verify_run_on_the_pool(hasher):
+    hashed_password = await hasher.hash("secure_unguessab1e_p@ssword")
+
+    assert hashed_password != "secure_unguessab1e_p@ssword"
+    assert await hasher.verify("secure_unguessab1e_p@ssword", hashed_password)
+    assert not await hasher.verify("wrong_p@ssword1", hashed_password)
+
+
+async def test_saturated_hasher_rejects_new_work(hasher):
+    results = await asyncio.gather(
+        hasher.hash("secure_unguessab1e_p@ssword"),
+        hasher.hash("secure_unguessab1e_p@ssword"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], PasswordHasherBusyError)
+    assert hasher.metrics()["rejected"] == 1
+
+
+async def test_metrics_report_latency_and_queue_depth(hasher):
+    await hasher.hash("secure_unguessab1e_p@ssword")
+
+    metrics = hasher.metrics()
+
+    assert metrics["completed"] == 1
+    assert metrics["queue_depth"] == 0
+    assert metrics["in_flight"] == 0
+    assert metrics["average_latency_ms"] > 0
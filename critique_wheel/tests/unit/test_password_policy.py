@@ -0,0 +1,40 @@
+import pytest
+
+from critique_wheel.config import config
+from critique_wheel.members.models.password_policy import (
+    PasswordHashingPolicy,
+    get_password_policy,
+)
+
+
+def test_policy_round_trips_a_password():
+    policy = PasswordHashingPolicy(rounds=4)
+    hashed_password = policy.hash("Password1!")
+
+    assert hashed_password.startswith("$2b$04$")
+    assert policy.verify("Password1!", hashed_password)
+    assert not policy.verify("Password2!", hashed_password)
+
+
+def test_policy_flags_hashes_with_other_cost_for_rehash():
+    old_hash = PasswordHashingPolicy(rounds=4).hash("Password1!")
+    policy = PasswordHashingPolicy(rounds=5)
+
+    assert policy.needs_rehash(old_hash)
+    assert not policy.needs_rehash(policy.hash("Password1!"))
+
+
+def test_policy_flags_unrecognised_hashes_for_rehash():
+    assert PasswordHashingPolicy(rounds=4).needs_rehash("not-a-hash")
+
+
+def test_policy_rejects_unknown_algorithm():
+    with pytest.raises(ValueError):
+        PasswordHashingPolicy(algorithm="md5")
+
+
+def test_default_policy_follows_config():
+    policy = get_password_policy()
+
+    assert policy.algorithm == config.PASSWORD_HASH_ALGORITHM
+    assert policy.rounds == config.PASSWORD_HASH_ROUNDS
@@ -4,6 +4,7 @@ import pytest
 from pytest import raises
 
 from critique_wheel.ratings.models.rating import MissingEntryError, Rating, RatingStatus
+from critique_wheel.ratings.value_objects import RatingAggregate
 
 
 @pytest.fixture
@@ -211,3 +212,30 @@ def test_ensure_a_rating_status_can_be_restored_to_active(test_rating):
     assert rating.status == RatingStatus.MARKED_FOR_DELETION
     rating.restore()
     assert rating.status == RatingStatus.ACTIVE
+
+
+def test_only_active_ratings_count_towards_aggregates(test_rating):
+    assert test_rating.counted_score == 4
+    test_rating.archive()
+    assert test_rating.counted_score is None
+
+
+def test_rating_aggregate_change_moves_the_score_between_buckets():
+    change = RatingAggregate.change(2, 5)
+    assert change.rating_count == 0
+    assert change.score_total == 3
+    assert change.histogram == (0, -1, 0, 0, 1)
+    assert not RatingAggregate.change(None, None)
+
+    aggregate = RatingAggregate(
+        rating_count=2, score_total=7, histogram=(0, 0, 1, 1, 0)
+    )
+    assert aggregate.average == 3.5
+    assert aggregate.to_dict()["histogram"] == {
+        "1": 0,
+        "2": 0,
+        "3": 1,
+        "4": 1,
+        "5": 0,
+    }
+    assert RatingAggregate().average is None
@@ -0,0 +1,45 @@
+import json
+from datetime import datetime
+
+from critique_wheel.entrypoints.schemas import schemas
+from critique_wheel.members.value_objects import MemberId
+from critique_wheel.works.value_objects import (
+    Title,
+    WorkAgeRestriction,
+    WorkGenre,
+    WorkId,
+    WorkStatus,
+    WorkSummary,
+)
+
+
+def make_summary(submission_date):
+    return WorkSummary(
+        id=WorkId(),
+        title=Title("A Title"),
+        member_id=MemberId(),
+        age_restriction=WorkAgeRestriction.TEEN,
+        genre=WorkGenre.HISTORICALFICTION,
+        status=WorkStatus.PENDING_REVIEW,
+        word_count=42,
+        submission_date=submission_date,
+    )
+
+
+def test_work_page_serializes_summaries_like_to_dict():
+    summaries = [
+        make_summary(datetime(2024, 1, 1, 12, 30)),
+        make_summary(datetime(2024, 1, 2, 8, 15, 5, 123456)),
+    ]
+
+    page = schemas.WorkPageOut.model_validate({"works": summaries, "next_cursor": None})
+
+    assert json.loads(page.model_dump_json()) == {
+        "works": [summary.to_dict() for summary in summaries],
+        "next_cursor": None,
+    }
+
+
+def test_work_summary_out_still_accepts_plain_dicts():
+    summary = make_summary(datetime(2024, 1, 1, 12, 30)).to_dict()
+    assert json.loads(schemas.WorkSummaryOut(**summary).model_dump_json()) == summary
@@ -0,0 +1,33 @@
+import pytest
+
+from critique_wheel.config import config
+from critique_wheel.text import count_words, exceeds_word_count
+from critique_wheel.works.exceptions import exceptions
+from critique_wheel.works.value_objects import Content
+
+
+@pytest.mark.parametrize(
+    "text, words",
+    [("", 0), ("   ", 0), ("one", 1), (" one  two\nthree\t", 3), ("a b c d", 4)],
+)
+def test_word_counting(text, words):
+    assert count_words(text) == words
+    assert not exceeds_word_count(text, words)
+    assert exceeds_word_count(text, words - 1)
+
+
+def test_word_count_is_cached_without_changing_equality():
+    content = Content("Three little words")
+    assert content.word_count() == 3
+    assert content.__dict__["_word_count"] == 3
+    assert content == Content("Three little words")
+    assert repr(content) == "Content(value='Three little words')"
+
+
+def test_trusted_values_skip_validation():
+    too_long = "word " * (config.WORK_MAX_WORDS + 1)
+    with pytest.raises(exceptions.InvalidEntryError):
+        Content(too_long)
+    content = Content.trusted(too_long)
+    assert content.word_count() == config.WORK_MAX_WORDS + 1
+    assert content == Content.trusted(too_long)
@@ -0,0 +1,187 @@
+import pytest
+
+from critique_wheel.infrastructure.cache import LocalSharedClient
+from critique_wheel.infrastructure.throttle import (
+    LocalLockout,
+    LocalWindowCounter,
+    LoginThrottle,
+    SharedLockout,
+    SharedWindowCounter,
+    build_login_throttle,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=["local", "shared"])
+def counter(request, clock):
+    if request.param == "local":
+        return LocalWindowCounter(100.0, clock=clock)
+    return SharedWindowCounter(LocalSharedClient(clock=clock), 100.0, clock=clock)
+
+
+def test_counter_weights_the_previous_window_by_its_overlap(counter, clock):
+    for _ in range(4):
+        counter.hit("key")
+    assert counter.count("key") == 4
+
+    clock.now += 150
+    counter.hit("key")
+
+    assert counter.count("key") == 4 * 0.5 + 1
+    clock.now += 100
+    assert counter.count("key") == 0.5
+
+
+def test_counter_forgets_windows_older_than_the_previous_one(counter, clock):
+    counter.hit("key")
+    clock.now += 200
+    assert counter.count("key") == 0
+
+
+def test_retry_after_is_when_the_count_drops_below_the_limit(counter, clock):
+    for _ in range(3):
+        counter.hit("key")
+    assert counter.retry_after("key", 4) is None
+
+    counter.hit("key")
+    wait = counter.retry_after("key", 4)
+
+    assert wait == 101
+    clock.now += wait - 1
+    assert counter.retry_after("key", 4) is not None
+    clock.now += 1
+    assert counter.retry_after("key", 4) is None
+
+
+def test_reset_clears_the_key(counter):
+    counter.hit("key")
+    counter.hit("other")
+    counter.reset("key")
+    assert counter.count("key") == 0
+    assert counter.count("other") == 1
+
+
+def test_local_counter_drops_least_recently_counted_keys(clock):
+    counter = LocalWindowCounter(100.0, max_keys=2, clock=clock)
+    for key in ("a", "b", "a", "c"):
+        counter.hit(key)
+    assert counter.count("a") == 2
+    assert counter.count("b") == 0
+
+
+def test_login_throttle_limits_failures_per_account(clock):
+    throttle = LoginThrottle(
+        LocalWindowCounter(100.0, clock=clock),
+        LocalWindowCounter(100.0, clock=clock),
+        account_limit=2,
+        address_limit=10,
+    )
+    throttle.record_failure("Member@Example.com")
+    assert throttle.retry_after("member@example.com") is None
+
+    throttle.record_failure("member@example.com ")
+
+    assert throttle.retry_after("member@example.com", "10.0.0.1")
+    throttle.record_success("member@example.com")
+    assert throttle.retry_after("member@example.com") is None
+
+
+@pytest.fixture(params=["local", "shared"])
+def lockout(request, clock):
+    if request.param == "local":
+        return LocalLockout(max_failures=3, lockout=60.0, clock=clock)
+    return SharedLockout(
+        LocalSharedClient(clock=clock), max_failures=3, lockout=60.0, clock=clock
+    )
+
+
+def test_lockout_locks_the_key_after_max_failures(lockout, clock):
+    lockout.fail("key")
+    lockout.fail("key")
+    assert lockout.retry_after("key") is None
+
+    lockout.fail("key")
+
+    assert lockout.retry_after("key") == 60
+    clock.now += 59.5
+    assert lockout.retry_after("key") == 1
+    clock.now += 0.5
+    assert lockout.retry_after("key") is None
+
+
+def test_lockout_forgets_failures_after_the_lockout_period(lockout, clock):
+    lockout.fail("key")
+    lockout.fail("key")
+    clock.now += 60
+    lockout.fail("key")
+    assert lockout.retry_after("key") is None
+
+
+def test_lockout_reset_clears_failures_and_lock(lockout):
+    for _ in range(3):
+        lockout.fail("key")
+    lockout.reset("key")
+    lockout.fail("key")
+    assert lockout.retry_after("key") is None
+
+
+def test_lockout_lock_holds_until_the_given_time(lockout, clock):
+    lockout.fail("key")
+    lockout.lock("key", clock.now + 90.5)
+
+    assert lockout.retry_after("key") == 91
+    clock.now += 90.5
+    assert lockout.retry_after("key") is None
+    lockout.fail("key")
+    assert lockout.retry_after("key") is None
+
+
+def test_login_throttle_locks_any_email_after_repeated_failures(clock):
+    throttle = LoginThrottle(
+        LocalWindowCounter(100.0, clock=clock),
+        LocalWindowCounter(100.0, clock=clock),
+        account_limit=10,
+        lockout=LocalLockout(max_failures=2, lockout=600.0, clock=clock),
+    )
+    throttle.record_failure("member@example.com")
+    throttle.record_failure("Member@Example.com")
+
+    assert throttle.retry_after("member@example.com") == 600
+    throttle.record_success("member@example.com")
+    assert throttle.retry_after("member@example.com") is None
+
+
+def test_login_throttle_limits_attempts_per_address(clock):
+    throttle = LoginThrottle(
+        LocalWindowCounter(100.0, clock=clock),
+        LocalWindowCounter(100.0, clock=clock),
+        account_limit=10,
+        address_limit=2,
+    )
+    throttle.record_attempt("10.0.0.1")
+    throttle.record_attempt("10.0.0.1")
+
+    assert throttle.retry_after("anyone@example.com", "10.0.0.1")
+    assert throttle.retry_after("anyone@example.com", "10.0.0.2") is None
+    assert throttle.retry_after("anyone@example.com") is None
+
+
+def test_build_login_throttle_backends():
+    assert build_login_throttle("none") is None
+    assert isinstance(build_login_throttle("shared").accounts, SharedWindowCounter)
+    assert isinstance(build_login_throttle("shared").lockout, SharedLockout)
+    assert isinstance(build_login_throttle("memory").lockout, LocalLockout)
+    with pytest.raises(ValueError):
+        build_login_throttle("unknown")
@@ -0,0 +1,132 @@
+import base64
+import json
+import uuid
+
+import pytest
+
+from critique_wheel import config
+from critique_wheel.infrastructure import tokens
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def signer(clock):
+    return tokens.TokenSigner("secret", access_ttl=60, refresh_ttl=600, clock=clock)
+
+
+def test_access_token_round_trips_member_id_and_role(signer, clock):
+    member_id = str(uuid.uuid4())
+    claims = signer.decode(signer.issue(member_id, "ADMIN"))
+    assert (claims.member_id, claims.role) == (member_id, "ADMIN")
+    assert claims.token_type == tokens.ACCESS
+    assert claims.expires_at == int(clock.now) + 60
+
+
+def test_issue_pair_returns_access_and_refresh_tokens(signer):
+    pair = signer.issue_pair("member", "MEMBER")
+    assert signer.decode(pair["refresh_token"], tokens.REFRESH).role == "MEMBER"
+    assert pair["token_type"] == "bearer"
+    assert pair["expires_in"] == 60
+
+
+def test_tampered_token_is_rejected(signer):
+    header, payload, signature = signer.issue("member", "MEMBER").split(".")
+    claims = json.loads(base64.urlsafe_b64decode(payload + "=="))
+    claims["role"] = "ADMIN"
+    forged = tokens.b64encode(json.dumps(claims).encode()).decode()
+    with pytest.raises(tokens.TokenError):
+        signer.decode(f"{header}.{forged}.{signature}")
+
+
+@pytest.mark.parametrize(
+    "token", ["", "not-a-token", "a.b.c", "é.é.é", "a.b.c.d"], ids=repr
+)
+def test_malformed_token_is_rejected(signer, token):
+    with pytest.raises(tokens.TokenError):
+        signer.decode(token)
+
+
+def test_unsigned_token_is_rejected(signer):
+    _, payload, _ = signer.issue("member", "ADMIN").split(".")
+    header = tokens.b64encode(b'{"alg":"none","typ":"JWT"}').decode()
+    with pytest.raises(tokens.TokenError):
+        signer.decode(f"{header}.{payload}.")
+
+
+def test_token_signed_with_another_key_is_rejected(signer, clock):
+    other = tokens.TokenSigner("other secret", clock=clock)
+    with pytest.raises(tokens.TokenError):
+        signer.decode(other.issue("member", "ADMIN"))
+
+
+def test_refresh_token_is_not_accepted_as_access_token(signer):
+    refresh_token = signer.issue("member", "MEMBER", tokens.REFRESH)
+    with pytest.raises(tokens.TokenError):
+        signer.decode(refresh_token, tokens.ACCESS)
+
+
+def test_expired_token_is_rejected(signer, clock):
+    token = signer.issue("member", "MEMBER")
+    clock.now += 60
+    with pytest.raises(tokens.ExpiredTokenError):
+        signer.decode(token)
+
+
+def test_unsupported_algorithm_is_rejected():
+    with pytest.raises(ValueError):
+        tokens.TokenSigner("secret", algorithm="RS256")
+
+
+def test_authenticate_rejects_revoked_tokens(signer, clock):
+    revocations = tokens.RevocationList(clock=clock)
+    token = signer.issue("member", "MEMBER")
+    claims = tokens.authenticate(token, signer=signer, revocations=revocations)
+
+    revocations.revoke(claims.jti, claims.expires_at)
+
+    with pytest.raises(tokens.RevokedTokenError):
+        tokens.authenticate(token, signer=signer, revocations=revocations)
+
+
+def test_revocation_list_merge_keeps_local_revocations_and_prunes_expired(clock):
+    revocations = tokens.RevocationList(clock=clock)
+    local, loaded, expired = (uuid.uuid4().hex for _ in range(3))
+    revocations.revoke(local, int(clock.now) + 10)
+
+    revocations.merge([(loaded, int(clock.now) + 10), (expired, int(clock.now))])
+
+    assert local in revocations
+    assert loaded in revocations
+    assert expired not in revocations
+    clock.now += 10
+    revocations.merge([])
+    assert len(revocations) == 0
+
+
+def test_signer_refuses_to_start_without_a_secret_in_production(monkeypatch):
+    monkeypatch.setattr(tokens, "_token_signer", None)
+    monkeypatch.setattr(config, "config", config.ProdConfig(JWT_SECRET_KEY=None))
+
+    with pytest.raises(tokens.TokenError):
+        tokens.get_token_signer()
+
+
+def test_signer_falls_back_to_a_per_process_secret_outside_production(monkeypatch):
+    monkeypatch.setattr(tokens, "_token_signer", None)
+    monkeypatch.setattr(config, "config", config.DevConfig(JWT_SECRET_KEY=None))
+
+    signer = tokens.get_token_signer()
+
+    assert tokens.get_token_signer() is signer
@@ -8,6 +8,7 @@ from critique_wheel.works.exceptions import exceptions
 from critique_wheel.works.models.work import Work
 from critique_wheel.works.value_objects import (
     Content,
+    CritiqueCapacity,
     Title,
     WorkAgeRestriction,
     WorkGenre,
@@ -129,15 +130,50 @@ def test_cannot_add_critique_to_non_active_work(valid_work):
         work.add_critique("critique3")
 
 
-def test_cannot_add_same_critique_twice(valid_work_with_two_critiques):
+def test_add_critique_does_not_scan_the_critiques(valid_work, valid_critique):
+    class UnscannableList(list):
+        def __contains__(self, item):
+            raise AssertionError("critiques must not be scanned")
+
+    valid_work.status = WorkStatus.ACTIVE
+    valid_work.critiques = UnscannableList()
+    valid_work.add_critique(valid_critique)
+    assert valid_work.critique_count == 1
+
+
+def test_add_critique_keeps_the_counters(valid_work_with_two_critiques, valid_critique):
     work = valid_work_with_two_critiques
-    work.status = WorkStatus.ACTIVE
-    existing_critique = work.critiques[0]
-    with pytest.raises(
-        exceptions.CritiqueDuplicateError,
-        match="Critique already exists",
-    ):
-        work.add_critique(existing_critique)
+    assert (work.critique_count, work.active_critique_count) == (2, 2)
+    valid_critique.work_id = work.id
+    valid_critique.pending_review()
+    work.add_critique(valid_critique)
+    assert (work.critique_count, work.active_critique_count) == (3, 2)
+
+
+def test_cannot_add_critique_beyond_the_limit(
+    valid_work_with_two_critiques, valid_critique
+):
+    work = valid_work_with_two_critiques
+    work.critique_limit = 2
+    assert not work.has_critique_capacity()
+    with pytest.raises(exceptions.CritiqueLimitReachedError):
+        work.add_critique(valid_critique)
+    assert work.critique_count == 2
+    assert len(work.critiques) == 2
+
+
+def test_work_limit_of_zero_closes_the_work(valid_work):
+    valid_work.critique_limit = 0
+    assert not valid_work.has_critique_capacity()
+    capacity = CritiqueCapacity(valid_work.status, 0, 0, critique_limit=0)
+    assert capacity.limit(default=5) == 0
+
+
+def test_work_limit_defaults_to_config(valid_work):
+    valid_work.critique_count = config.CRITIQUE_LIMIT_PER_WORK - 1
+    assert valid_work.has_critique_capacity()
+    valid_work.critique_count += 1
+    assert not valid_work.has_critique_capacity()
 
 
 def test_word_count_calculation():
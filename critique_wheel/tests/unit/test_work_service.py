@@ -2,8 +2,10 @@ from uuid import uuid4
 
 import pytest
 
+from critique_wheel.infrastructure.cache import LRUCache
 from critique_wheel.members.value_objects import MemberId
 from critique_wheel.works.services import unit_of_work, work_service
+from critique_wheel.works.value_objects import WorkId
 from tests.integration import fake_work_repository
 
 
@@ -61,6 +63,53 @@ def test_get_work_by_id(work_details):
     assert retrieved_work == work
 
 
+def test_get_work_by_id_reads_through_the_cache(work_details, monkeypatch):
+    uow = FakeUnitOfWork()
+    uow.cache = LRUCache()
+    work_details.pop("status")
+    work = work_service.add_work(uow=uow, member_id=str(uuid4()), **work_details)
+    summary = work_service.get_work_by_id(work["id"], uow, include_content=False)
+
+    def fail(work_id):
+        raise AssertionError("cached work was read from the repository")
+
+    monkeypatch.setattr(uow.works, "get_work_by_id", fail)
+    assert work_service.get_work_by_id(work["id"], uow, include_content=False) == (
+        summary
+    )
+    assert "content" not in summary
+    assert uow.cache.metrics()["hits"] == 1
+    monkeypatch.undo()
+
+    # The cached summary lacks content, so asking for it goes to the repository.
+    assert work_service.get_work_by_id(work["id"], uow) == work
+    assert work_service.get_work_by_id(work["id"], uow, include_content=False) == (
+        summary
+    )
+
+
+def test_get_work_by_id_does_not_cache_a_read_overtaken_by_a_commit(
+    work_details, monkeypatch
+):
+    uow = FakeUnitOfWork()
+    uow.cache = LRUCache()
+    work_details.pop("status")
+    work = work_service.add_work(uow=uow, member_id=str(uuid4()), **work_details)
+    load = uow.works.get_work_by_id
+
+    def load_then_commit_elsewhere(work_id):
+        loaded = load(work_id)
+        # A concurrent request commits a change to the work after this read
+        # loaded it but before it reached the cache.
+        uow.cache.invalidate([work_id])
+        return loaded
+
+    monkeypatch.setattr(uow.works, "get_work_by_id", load_then_commit_elsewhere)
+    assert work_service.get_work_by_id(work["id"], uow) == work
+
+    assert uow.cache.get(WorkId.from_string(work["id"])) is None
+
+
 def test_create_dupliacte_work_raises_DuplicateWorkError(work_details):
     member_id = str(uuid4())
     work_id = str(uuid4())
@@ -207,3 +256,89 @@ def test_list_works_returns_empty_list_when_no_works_exist():
     works = work_service.list_works(uow=uow)
     assert len(works) == 0
     assert works == []
+
+
+def test_list_work_summaries_pages_with_a_cursor(work_details):
+    uow = FakeUnitOfWork()
+    member_id = str(uuid4())
+    for _ in range(3):
+        work_service.add_work(
+            uow=uow,
+            title=work_details["title"],
+            content=work_details["content"],
+            age_restriction=work_details["age_restriction"],
+            genre=work_details["genre"],
+            member_id=member_id,
+            work_id=str(uuid4()),
+        )
+
+    first_page = work_service.list_work_summaries(uow, page_size=2)
+    second_page = work_service.list_work_summaries(
+        uow, cursor=first_page["next_cursor"], page_size=2
+    )
+
+    assert len(first_page["works"]) == 2
+    assert not hasattr(first_page["works"][0], "content")
+    assert len(second_page["works"]) == 1
+    assert second_page["next_cursor"] is None
+    listed = {work.id for work in first_page["works"] + second_page["works"]}
+    assert len(listed) == 3
+
+
+def test_list_work_summaries_caps_the_page_size(monkeypatch):
+    monkeypatch.setattr(work_service.config, "WORK_PAGE_SIZE_MAX", 5)
+    assert work_service.get_page_size(500) == 5
+    assert work_service.get_page_size(None) == 5
+
+
+def test_list_work_summaries_rejects_invalid_cursor_and_filters():
+    uow = FakeUnitOfWork()
+    with pytest.raises(work_service.InvalidDataError):
+        work_service.list_work_summaries(uow, cursor="not a cursor")
+    with pytest.raises(work_service.InvalidDataError):
+        work_service.list_work_summaries(uow, genre="NOT A GENRE")
+
+
+def import_row(work_details, **overrides):
+    row = {
+        "title": work_details["title"],
+        "content": work_details["content"],
+        "age_restriction": work_details["age_restriction"],
+        "genre": work_details["genre"],
+        "member_id": str(uuid4()),
+    }
+    return {**row, **overrides}
+
+
+def test_import_works_reports_bad_rows_and_keeps_the_rest(work_details):
+    uow = FakeUnitOfWork()
+    repeated_id = str(uuid4())
+    rows = [
+        import_row(work_details, id=repeated_id),
+        import_row(work_details, title=None),
+        import_row(work_details, genre="NOT A GENRE"),
+        import_row(work_details, id=repeated_id),
+        import_row(work_details),
+    ]
+
+    report = work_service.import_works(uow, rows, batch_size=2)
+
+    assert uow.committed
+    assert report["imported"] == 2
+    assert [error["row"] for error in report["errors"]] == [1, 2, 3]
+    assert "title" in report["errors"][0]["error"]
+    assert len(uow.works.list()) == 2
+
+
+def test_import_works_skips_works_that_already_exist(work_details):
+    uow = FakeUnitOfWork()
+    work = work_service.add_work(uow=uow, **import_row(work_details))
+
+    report = work_service.import_works(
+        uow, [import_row(work_details, id=work["id"]), import_row(work_details)]
+    )
+
+    assert report["imported"] == 1
+    assert report["errors"] == [
+        {"row": 0, "error": f"Work with id {work['id']} already exists"}
+    ]